@@ -0,0 +1,186 @@
+import json
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+# Characters of ffmpeg stderr kept in FFmpegError (the end, where the cause is).
+_STDERR_TAIL = 800
+
+
+class FFmpegError(RuntimeError):
+    """An ffmpeg / ffprobe run failed or timed out; the message ends with its stderr."""
+
+
+@dataclass(frozen=True)
+class Rendition:
+    name: str
+    height: int
+    video_bitrate: str
+    max_rate: str
+    buffer_size: str
+    audio_bitrate: str = "128k"
+
+
+# Default adaptive bitrate ladder, highest first.
+DEFAULT_LADDER: List[Rendition] = [
+    Rendition("1080p", 1080, "5000k", "5350k", "7500k", "192k"),
+    Rendition("720p", 720, "2800k", "2996k", "4200k", "128k"),
+    Rendition("480p", 480, "1400k", "1498k", "2100k", "128k"),
+    Rendition("360p", 360, "800k", "856k", "1200k", "96k"),
+]
+
+
+@dataclass
+class MediaInfo:
+    duration_seconds: Optional[float]
+    size_bytes: Optional[int]
+    width: Optional[int]
+    height: Optional[int]
+    has_audio: bool
+
+
+class HLSPackager:
+    """
+    FFmpeg based HLS packaging for recorded streams.
+    This file stays SYNC by design; callers run it in a worker thread.
+    Every run takes a ``timeout`` in seconds (None waits forever); the
+    process is killed when it runs out and ``FFmpegError`` is raised.
+    """
+
+    @staticmethod
+    def _run(args: Sequence[str], timeout: Optional[float], capture_stdout: bool = False) -> str:
+        try:
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=timeout,
+                check=True,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise FFmpegError(f"{args[0]} timed out after {timeout}s: {HLSPackager._tail(e.stderr)}")
+        except subprocess.CalledProcessError as e:
+            raise FFmpegError(f"{args[0]} exited with {e.returncode}: {HLSPackager._tail(e.stderr)}")
+        return result.stdout or ""
+
+    @staticmethod
+    def _tail(stderr) -> str:
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode(errors="replace")
+        return (stderr or "").strip()[-_STDERR_TAIL:]
+
+    @staticmethod
+    def probe(source: Path, timeout: Optional[float] = None) -> MediaInfo:
+        stdout = HLSPackager._run(
+            [
+                "ffprobe",
+                "-v", "error",
+                "-show_entries", "format=duration,size:stream=codec_type,width,height",
+                "-of", "json",
+                str(source),
+            ],
+            timeout,
+            capture_stdout=True,
+        )
+        data = json.loads(stdout)
+        fmt = data.get("format", {})
+        streams = data.get("streams", [])
+        video = next((s for s in streams if s.get("codec_type") == "video"), {})
+
+        return MediaInfo(
+            duration_seconds=float(fmt["duration"]) if fmt.get("duration") else None,
+            size_bytes=int(fmt["size"]) if fmt.get("size") else None,
+            width=video.get("width"),
+            height=video.get("height"),
+            has_audio=any(s.get("codec_type") == "audio" for s in streams),
+        )
+
+    @staticmethod
+    def ladder_for(height: Optional[int], ladder: List[Rendition] = DEFAULT_LADDER) -> List[Rendition]:
+        """Drop renditions above the source resolution (always keep the lowest one)."""
+        if not height:
+            return ladder
+        fitting = [r for r in ladder if r.height <= height]
+        return fitting or ladder[-1:]
+
+    @staticmethod
+    def package(
+        source: Path,
+        output_dir: Path,
+        renditions: List[Rendition],
+        has_audio: bool = True,
+        segment_seconds: int = 6,
+        threads: int = 0,
+        timeout: Optional[float] = None,
+    ) -> Path:
+        """
+        Transcode ``source`` into an HLS ladder under ``output_dir``.
+
+        Produces ``master.m3u8`` plus ``<rendition>/index.m3u8`` and its
+        segments, all in a single ffmpeg invocation (one decode, N encodes).
+        Returns the master playlist path.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        n = len(renditions)
+
+        splits = "".join(f"[v{i}]" for i in range(n))
+        scales = ";".join(
+            f"[v{i}]scale=-2:{r.height}[v{i}out]" for i, r in enumerate(renditions)
+        )
+        args = [
+            "ffmpeg", "-y",
+            "-i", str(source),
+            "-threads", str(threads),
+            "-filter_complex", f"[0:v]split={n}{splits};{scales}",
+        ]
+
+        for i, r in enumerate(renditions):
+            args += [
+                "-map", f"[v{i}out]",
+                f"-c:v:{i}", "libx264",
+                "-preset", "veryfast",
+                f"-b:v:{i}", r.video_bitrate,
+                f"-maxrate:v:{i}", r.max_rate,
+                f"-bufsize:v:{i}", r.buffer_size,
+                # Keyframe on every segment boundary, whatever the frame rate.
+                f"-force_key_frames:v:{i}", f"expr:gte(t,n_forced*{segment_seconds})",
+                "-sc_threshold", "0",
+            ]
+            if has_audio:
+                args += ["-map", "0:a:0", f"-c:a:{i}", "aac", f"-b:a:{i}", r.audio_bitrate]
+
+        stream_map = " ".join(
+            f"v:{i},a:{i},name:{r.name}" if has_audio else f"v:{i},name:{r.name}"
+            for i, r in enumerate(renditions)
+        )
+        args += [
+            "-f", "hls",
+            "-hls_time", str(segment_seconds),
+            "-hls_playlist_type", "vod",
+            "-hls_segment_filename", str(output_dir / "%v" / "seg_%04d.ts"),
+            "-master_pl_name", "master.m3u8",
+            "-var_stream_map", stream_map,
+            str(output_dir / "%v" / "index.m3u8"),
+        ]
+
+        HLSPackager._run(args, timeout)
+        return output_dir / "master.m3u8"
+
+    @staticmethod
+    def thumbnail(
+        source: Path, output: Path, at_seconds: float = 1.0, width: int = 640, timeout: Optional[float] = None
+    ) -> Path:
+        HLSPackager._run(
+            [
+                "ffmpeg", "-y",
+                "-ss", str(at_seconds),
+                "-i", str(source),
+                "-frames:v", "1",
+                "-vf", f"scale={width}:-2",
+                str(output),
+            ],
+            timeout,
+        )
+        return output
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Optional
 
+import aiofiles
+
+# Read size when streaming an object to or from disk.
+CHUNK_SIZE = 1024 * 1024
+
 
 class StorageBackend(ABC):
     """
@@ -23,6 +29,16 @@ class StorageBackend(ABC):
         """Download file as bytes"""
         raise NotImplementedError
 
+    async def download_to(self, key: str, path: Path) -> int:
+        """
+        Download file into a local path and return its size. Backends that
+        can stream override this so large files never sit in memory whole.
+        """
+        data = await self.download(key)
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+        return len(data)
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete file"""
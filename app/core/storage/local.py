@@ -1,7 +1,7 @@
 import aiofiles
 from pathlib import Path
 
-from .base import StorageBackend
+from .base import CHUNK_SIZE, StorageBackend
 
 
 class LocalStorage(StorageBackend):
@@ -32,6 +32,14 @@ class LocalStorage(StorageBackend):
         async with aiofiles.open(path, "rb") as f:
             return await f.read()
 
+    async def download_to(self, key: str, path: Path) -> int:
+        size = 0
+        async with aiofiles.open(self._full_path(key), "rb") as src, aiofiles.open(path, "wb") as dst:
+            while chunk := await src.read(CHUNK_SIZE):
+                await dst.write(chunk)
+                size += len(chunk)
+        return size
+
     async def delete(self, key: str) -> None:
         path = self._full_path(key)
         if path.exists():
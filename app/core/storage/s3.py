@@ -1,7 +1,10 @@
+from pathlib import Path
+
 import aioboto3
+import aiofiles
 from botocore.exceptions import ClientError
 
-from .base import StorageBackend
+from .base import CHUNK_SIZE, StorageBackend
 
 
 class S3Storage(StorageBackend):
@@ -47,6 +50,18 @@ class S3Storage(StorageBackend):
             obj = await s3.get_object(Bucket=self.bucket, Key=key)
             return await obj["Body"].read()
 
+    async def download_to(self, key: str, path: Path) -> int:
+        size = 0
+        async with self.session.client(
+            "s3", endpoint_url=self.endpoint_url
+        ) as s3:
+            obj = await s3.get_object(Bucket=self.bucket, Key=key)
+            async with obj["Body"] as body, aiofiles.open(path, "wb") as f:
+                while chunk := await body.read(CHUNK_SIZE):
+                    await f.write(chunk)
+                    size += len(chunk)
+        return size
+
     async def delete(self, key: str) -> None:
         async with self.session.client(
             "s3", endpoint_url=self.endpoint_url
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from .base import StorageBackend
 
 
@@ -11,6 +13,9 @@ class StorageService:
     async def download(self, key: str) -> bytes:
         return await self.backend.download(key)
 
+    async def download_to(self, key: str, path: Path) -> int:
+        return await self.backend.download_to(key, path)
+
     async def delete(self, key: str) -> None:
         return await self.backend.delete(key)
 
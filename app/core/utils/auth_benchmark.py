@@ -0,0 +1,93 @@
+"""
+Per-request access-token verification overhead, in µs per token.
+
+Compares python-jose with the key parsed on every call (the previous path)
+against the prepared-key codec in ``jwt_verifier``, cold and with the
+verified-token LRU warm, for HS256, RS256 and ES256. Keys are generated in
+memory; nothing is read from settings or the database.
+
+    python -m app.core.utils.auth_benchmark [--tokens 1000] [--rounds 20]
+"""
+import argparse
+import time
+from statistics import median
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from app.core.utils.jwt_verifier import JWTCodec, VerifiedTokenCache
+
+HS_SECRET = "benchmark-secret-benchmark-secret"
+
+
+def _pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def _configs() -> Dict[str, SimpleNamespace]:
+    return {
+        "HS256": SimpleNamespace(algorithm="HS256", secret=HS_SECRET),
+        "RS256": SimpleNamespace(algorithm="RS256", secret=_pem(rsa.generate_private_key(65537, 2048))),
+        "ES256": SimpleNamespace(algorithm="ES256", secret=_pem(ec.generate_private_key(ec.SECP256R1()))),
+    }
+
+
+def _payloads(n: int) -> List[Dict]:
+    now = int(time.time())
+    return [
+        {"sub": f"{i:024x}", "exp": now + 3600, "iat": now, "jti": f"jti-{i}", "version": 1, "type": "access"}
+        for i in range(n)
+    ]
+
+
+def _time_per_token(fn: Callable[[str], object], tokens: List[str], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for token in tokens:
+            fn(token)
+        samples.append(time.perf_counter() - start)
+    return median(samples) / len(tokens) * 1_000_000  # µs per token
+
+
+def run(tokens: int = 1000, rounds: int = 20) -> Dict[str, float]:
+    configs = _configs()
+    codec = JWTCodec(configs)
+    payloads = _payloads(tokens)
+    results: Dict[str, float] = {}
+
+    for alg, config in configs.items():
+        signed = [codec.encode(p, alg) for p in payloads]
+        # The public half of the key, as a verifier parsing it per call would hold it.
+        verify_pem = config.secret if alg == "HS256" else codec.key(alg).verify.to_pem().decode()
+        results[f"jose {alg}"] = _time_per_token(
+            lambda t: jwt.decode(t, verify_pem, algorithms=[alg]), signed, rounds
+        )
+        results[f"codec {alg}"] = _time_per_token(lambda t: codec.decode(t, alg), signed, rounds)
+
+        cache = VerifiedTokenCache(max_entries=tokens)
+        for token, payload in zip(signed, payloads):
+            cache.set(token, payload)
+        results[f"cached {alg}"] = _time_per_token(cache.get, signed, rounds)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run(args.tokens, args.rounds)
+    for name, us in results.items():
+        baseline = results[f"jose {name.split()[1]}"]
+        print(f"{name:<14}{us:8.2f} µs / token   ({baseline / us if us else 0:5.1f}x vs jose)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AuthState:
+    """The part of a user every authenticated request needs to check."""
+    is_active: bool
+    token_version: int
+    role: str
+
+    @classmethod
+    def of_document(cls, doc: Dict[str, Any]) -> "AuthState":
+        """From a raw users document; missing fields take the ``User`` defaults."""
+        return cls(
+            is_active=bool(doc.get("is_active", True)),
+            token_version=int(doc.get("token_version", 1)),
+            role=doc.get("user_role", "user"),
+        )
+
+
+class AuthCache:
+    """
+    Short-lived ``user_id -> AuthState`` cache used by
+    ``SecurityManager.get_current_user``.
+
+    Two tiers: an in-process LRU (``AUTH_CACHE_LOCAL_TTL_SECONDS``) in front
+    of a Redis hash per user (``AUTH_CACHE_TTL_SECONDS``). Any write to a user
+    through ``user_crud`` drops both, so session invalidation, role changes
+    and deactivation take effect immediately on this worker and in Redis;
+    other workers may serve their local copy for at most the local TTL.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, Tuple[float, AuthState]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Bumped by every invalidation so a state read from Mongo before an
+        # invalidation is not cached after it (see ``set``).
+        self.epoch = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.AUTH_CACHE_ENABLED
+
+    @property
+    def _use_redis(self) -> bool:
+        return settings.AUTH_CACHE_REDIS and redis_client.available
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"auth:user:{user_id}"
+
+    # --------------------- Reads ---------------------
+    async def get(self, user_id: Any) -> Optional[AuthState]:
+        if not self.enabled:
+            return None
+        user_id = str(user_id)
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, state = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return state
+            del self._entries[user_id]
+
+        if self._use_redis:
+            try:
+                data = await redis_client.client.hgetall(self._key(user_id))
+            except Exception as e:
+                logger.warning(f"Auth cache: Redis read failed: {e}")
+                data = None
+            if data:
+                state = AuthState(
+                    is_active=data["is_active"] == "1",
+                    token_version=int(data["token_version"]),
+                    role=data["role"],
+                )
+                self._store(user_id, state)
+                self.hits += 1
+                return state
+
+        self.misses += 1
+        return None
+
+    # --------------------- Writes ---------------------
+    def _store(self, user_id: str, state: AuthState) -> None:
+        self._entries[user_id] = (time.monotonic() + settings.AUTH_CACHE_LOCAL_TTL_SECONDS, state)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > settings.AUTH_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    async def set(self, user_id: Any, state: AuthState, epoch: Optional[int] = None) -> None:
+        """Cache ``state``; skipped if an invalidation happened since ``epoch`` was read."""
+        if not self.enabled or (epoch is not None and epoch != self.epoch):
+            return
+        user_id = str(user_id)
+        self._store(user_id, state)
+        if self._use_redis:
+            try:
+                async with redis_client.client.pipeline(transaction=True) as pipe:
+                    pipe.hset(self._key(user_id), mapping={
+                        "is_active": "1" if state.is_active else "0",
+                        "token_version": state.token_version,
+                        "role": state.role,
+                    })
+                    pipe.expire(self._key(user_id), max(1, int(settings.AUTH_CACHE_TTL_SECONDS)))
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Auth cache: Redis write failed: {e}")
+
+    async def invalidate(self, *user_ids: Any) -> None:
+        """Drop the given users (one Redis round trip)."""
+        if not user_ids:
+            return
+        self.epoch += 1
+        keys = []
+        for user_id in map(str, user_ids):
+            self._entries.pop(user_id, None)
+            keys.append(self._key(user_id))
+        if self._use_redis:
+            try:
+                await redis_client.client.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Auth cache: Redis invalidation failed: {e}")
+
+    async def invalidate_all(self) -> None:
+        """
+        Drop every user, on this worker and in Redis (other workers keep
+        their local copies for at most the local TTL). An explicit admin
+        operation: it scans every ``auth:user:*`` key.
+        """
+        self.epoch += 1
+        self._entries.clear()
+        if self._use_redis:
+            try:
+                keys = [k async for k in redis_client.client.scan_iter(match=self._key("*"), count=500)]
+                if keys:
+                    await redis_client.client.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Auth cache: Redis invalidation failed: {e}")
+
+    # --------------------- Stats ---------------------
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+auth_cache = AuthCache()
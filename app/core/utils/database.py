@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import sys
+import asyncio
 import logging
 import pkgutil
 import importlib
@@ -8,38 +8,59 @@ from typing import Type, List, Set
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from beanie import init_beanie, Document
+from pymongo.read_preferences import SecondaryPreferred
 
+from app.core.utils.indexes import index_manager
 from app.core.utils.settings import settings
+from app.core.utils.startup import startup_report
+from app.models.registry import document_models
 
 logger = logging.getLogger(__name__)
 
 
+_SECONDARY_PREFERRED = SecondaryPreferred(max_staleness=settings.MONGO_MAX_STALENESS_SECONDS)
+
+
 class Database:
     def __init__(self):
         self.client: AsyncIOMotorClient | None = None
         self.db: AsyncIOMotorDatabase | None = None
+        self.models: List[Type[Document]] = []
+        self._index_task: asyncio.Task | None = None
 
     # ----------------- PUBLIC -----------------
 
-    async def connect(self, debug_models: bool = False):
-        """Connect to MongoDB and initialize Beanie with all models."""
+    async def connect(self, debug_models: bool = False, sync_indexes: bool | None = None):
+        """
+        Connect to MongoDB and initialize Beanie with all models.
+        Index builds are not awaited: they run as a background sync (see
+        ``app.core.utils.indexes``) unless disabled.
+        """
         if self.client:
             return  # Already connected
 
         try:
             mongo_url = settings.mongo_url
-            self.client = AsyncIOMotorClient(mongo_url)
+            self.client = AsyncIOMotorClient(mongo_url, **self._client_options())
             self.db = self.client[settings.MONGO_DB]
 
             # Test connection
-            await self.client.admin.command("ping")
+            with startup_report.phase("mongodb.ping"):
+                await self.client.admin.command("ping")
 
             # Discover models
-            models = self._get_beanie_models()
-            await init_beanie(
-                database=self.db,
-                document_models=models,
-            )
+            with startup_report.phase("mongodb.models"):
+                models = self._get_beanie_models()
+            with startup_report.phase("mongodb.init_beanie"):
+                await init_beanie(
+                    database=self.db,
+                    document_models=models,
+                    skip_indexes=True,
+                )
+            self.models = models
+
+            if settings.MONGO_SYNC_INDEXES_ON_STARTUP if sync_indexes is None else sync_indexes:
+                self._index_task = index_manager.start_background_sync(models)
 
             # Debug output
             if debug_models:
@@ -55,48 +76,45 @@ class Database:
 
     async def disconnect(self):
         """Disconnect MongoDB client."""
+        if self._index_task and not self._index_task.done():
+            self._index_task.cancel()
+        self._index_task = None
         if self.client:
             self.client.close()
             self.client = None
             self.db = None
             logger.info("MongoDB disconnected.")
 
+    @property
+    def secondary_reads(self) -> SecondaryPreferred | None:
+        """Read preference for routed list reads, or None when they stay on the primary."""
+        if not settings.MONGO_SECONDARY_READS:
+            return None
+        return _SECONDARY_PREFERRED
+
     # ----------------- INTERNAL HELPERS -----------------
 
     @staticmethod
-    def _import_all_model_modules():
-        """
-        Dynamically import all modules inside 'app.models' package so that
-        Beanie can discover all Document subclasses.
-        """
-        import app.models as models_pkg
-
-        for _, module_name, _ in pkgutil.iter_modules(models_pkg.__path__):
-            importlib.import_module(f"{models_pkg.__name__}.{module_name}")
-
-    @classmethod
-    def _get_beanie_models(cls) -> List[Type[Document]]:
-        """
-        Collect all Beanie Document subclasses from imported modules.
-        """
-        cls._import_all_model_modules()
-
-        models: List[Type[Document]] = []
-
-        for module in sys.modules.values():
-            try:
-                for obj in vars(module).values():
-                    if (
-                        isinstance(obj, type)
-                        and issubclass(obj, Document)
-                        and obj is not Document
-                    ):
-                        models.append(obj)
-            except Exception:
-                continue
+    def _client_options() -> dict:
+        """Pool / timeout / compression / monitoring options from settings."""
+        options = {
+            "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+            "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+            "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+            "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        }
+        if settings.MONGO_COMPRESSORS:
+            options["compressors"] = settings.MONGO_COMPRESSORS
+        if settings.MONGO_COMMAND_MONITORING:
+            from app.core.utils.mongo_monitoring import command_metrics
+            options["event_listeners"] = [command_metrics]
+        return options
 
-        # Remove duplicates
-        return list(set(models))
+    @staticmethod
+    def _get_beanie_models() -> List[Type[Document]]:
+        """All Beanie Document models from the registry (see ``app.models.registry``)."""
+        return document_models()
 
     # ----------------- DEBUG -----------------
 
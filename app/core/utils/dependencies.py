@@ -2,8 +2,9 @@ from __future__ import annotations
 from typing import Annotated, TypeAlias, Iterable, Optional
 from fastapi import Request, Depends
 
-from app.models.user_models import User, UserRole
-from app.core.utils.security import security_manager
+from app.models.user_models import UserRole
+from app.core.utils.security import AuthenticatedUser, security_manager
+from app.core.utils.settings import settings
 from app.core.response.exceptions import Exceptions
 
 # -------------------------------
@@ -13,7 +14,7 @@ from app.core.response.exceptions import Exceptions
 async def _require_role(
     request: Request,
     allowed_roles: Optional[Iterable[UserRole]] = None
-) -> User:
+) -> AuthenticatedUser:
     """
     Fetch the currently authenticated user from the request and validate roles.
 
@@ -26,7 +27,7 @@ async def _require_role(
         Exceptions.permission_denied: If the user is not authenticated or does not have an allowed role.
 
     Returns:
-        User: The authenticated user object.
+        AuthenticatedUser: The authenticated user (``.load()`` for the full document).
     """
     user = await security_manager.get_current_user(request)
 
@@ -40,7 +41,7 @@ async def _require_role(
 # Concrete Role Dependencies
 # -------------------------------
 
-async def _current_user(request: Request) -> User:
+async def _current_user(request: Request) -> AuthenticatedUser:
     """
     Dependency for any authenticated user.
 
@@ -48,12 +49,12 @@ async def _current_user(request: Request) -> User:
         request (Request): FastAPI request object.
 
     Returns:
-        User: The authenticated user.
+        AuthenticatedUser: The authenticated user.
     """
     return await _require_role(request)
 
 
-async def _admin_user(request: Request) -> User:
+async def _admin_user(request: Request) -> AuthenticatedUser:
     """
     Dependency for Admin and higher-level users (Admin, Super Admin, Super User).
 
@@ -61,7 +62,7 @@ async def _admin_user(request: Request) -> User:
         request (Request): FastAPI request object.
 
     Returns:
-        User: The authenticated user.
+        AuthenticatedUser: The authenticated user.
 
     Raises:
         Exceptions.permission_denied: If user role is not allowed.
@@ -72,7 +73,7 @@ async def _admin_user(request: Request) -> User:
     )
 
 
-async def _super_admin_user(request: Request) -> User:
+async def _super_admin_user(request: Request) -> AuthenticatedUser:
     """
     Dependency for Super Admin only.
 
@@ -80,7 +81,7 @@ async def _super_admin_user(request: Request) -> User:
         request (Request): FastAPI request object.
 
     Returns:
-        User: The authenticated Super Admin.
+        AuthenticatedUser: The authenticated Super Admin.
 
     Raises:
         Exceptions.permission_denied: If user is not Super Admin.
@@ -88,7 +89,7 @@ async def _super_admin_user(request: Request) -> User:
     return await _require_role(request, allowed_roles=[UserRole.super_admin])
 
 
-async def _super_user(request: Request) -> User:
+async def _super_user(request: Request) -> AuthenticatedUser:
     """
     Dependency for Super User only.
 
@@ -96,7 +97,7 @@ async def _super_user(request: Request) -> User:
         request (Request): FastAPI request object.
 
     Returns:
-        User: The authenticated Super User.
+        AuthenticatedUser: The authenticated Super User.
 
     Raises:
         Exceptions.permission_denied: If user is not Super User.
@@ -104,7 +105,7 @@ async def _super_user(request: Request) -> User:
     return await _require_role(request, allowed_roles=[UserRole.superuser])
 
 
-async def _admin_super_admin(request: Request) -> User:
+async def _admin_super_admin(request: Request) -> AuthenticatedUser:
     """
     Dependency for Admin or Super Admin roles.
 
@@ -112,7 +113,7 @@ async def _admin_super_admin(request: Request) -> User:
         request (Request): FastAPI request object.
 
     Returns:
-        User: Authenticated user with Admin or Super Admin role.
+        AuthenticatedUser: Authenticated user with Admin or Super Admin role.
 
     Raises:
         Exceptions.permission_denied: If user role is not Admin or Super Admin.
@@ -120,7 +121,7 @@ async def _admin_super_admin(request: Request) -> User:
     return await _require_role(request, allowed_roles=[UserRole.admin, UserRole.super_admin])
 
 
-async def _super_user_super_admin(request: Request) -> User:
+async def _super_user_super_admin(request: Request) -> AuthenticatedUser:
     """
     Dependency for Super User or Super Admin roles.
 
@@ -128,7 +129,7 @@ async def _super_user_super_admin(request: Request) -> User:
         request (Request): FastAPI request object.
 
     Returns:
-        User: Authenticated user with Super User or Super Admin role.
+        AuthenticatedUser: Authenticated user with Super User or Super Admin role.
 
     Raises:
         Exceptions.permission_denied: If user role is not Super User or Super Admin.
@@ -138,16 +139,35 @@ async def _super_user_super_admin(request: Request) -> User:
     )
 
 
+async def _sfu_service(request: Request) -> None:
+    """
+    Dependency for calls made by the SFU itself (heartbeats, room events).
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Raises:
+        Exceptions.permission_denied: If the shared secret is missing or wrong.
+    """
+    secret = request.headers.get("X-SFU-Secret", "")
+    if not settings.SFU_SHARED_SECRET or not security_manager.constant_time_compare(
+        secret, settings.SFU_SHARED_SECRET
+    ):
+        raise Exceptions.permission_denied()
+
+
 # -------------------------------
 # FastAPI Annotated Aliases
 # -------------------------------
 
-CurrentUser: TypeAlias = Annotated[User, Depends(_current_user)]
-RegularUser: TypeAlias = Annotated[User, Depends(_current_user)]
+CurrentUser: TypeAlias = Annotated[AuthenticatedUser, Depends(_current_user)]
+RegularUser: TypeAlias = Annotated[AuthenticatedUser, Depends(_current_user)]
+
+AdminUser: TypeAlias = Annotated[AuthenticatedUser, Depends(_admin_user)]
+SuperAdminUser: TypeAlias = Annotated[AuthenticatedUser, Depends(_super_admin_user)]
+SuperUser: TypeAlias = Annotated[AuthenticatedUser, Depends(_super_user)]
 
-AdminUser: TypeAlias = Annotated[User, Depends(_admin_user)]
-SuperAdminUser: TypeAlias = Annotated[User, Depends(_super_admin_user)]
-SuperUser: TypeAlias = Annotated[User, Depends(_super_user)]
+AdminSuperAdmin: TypeAlias = Annotated[AuthenticatedUser, Depends(_admin_super_admin)]
+ElevatedUser: TypeAlias = Annotated[AuthenticatedUser, Depends(_super_user_super_admin)]
 
-AdminSuperAdmin: TypeAlias = Annotated[User, Depends(_admin_super_admin)]
-ElevatedUser: TypeAlias = Annotated[User, Depends(_super_user_super_admin)]
+SFUService: TypeAlias = Annotated[None, Depends(_sfu_service)]
@@ -0,0 +1,236 @@
+"""
+Index registry: compares the indexes declared in Beanie ``Settings.indexes``
+with what MongoDB actually has, builds the missing ones and reports unused
+ones from ``$indexStats``.
+
+    python -m app.core.utils.indexes diff
+    python -m app.core.utils.indexes sync [--drop-extra]
+    python -m app.core.utils.indexes unused
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from beanie import Document
+from beanie.odm.fields import IndexModelField
+from pymongo import ASCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+# Index options that make two indexes on the same keys different.
+_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+IndexKey = Tuple[Tuple[str, Any], ...]
+
+
+@dataclass
+class IndexDiff:
+    collection: str
+    missing: List[IndexModel] = field(default_factory=list)
+    extra: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    # Changed single-field indexes that only differ in their TTL, by name,
+    # with the declared expireAfterSeconds; sync converts these in place.
+    ttl: Dict[str, int] = field(default_factory=dict)
+    # Missing indexes whose build failed during sync, by name.
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing or self.extra or self.changed)
+
+
+class IndexManager:
+    """Declared-vs-actual index management for every registered Beanie model."""
+
+    # --------------------- Declared ---------------------
+    @staticmethod
+    def declared(model: Type[Document]) -> List[IndexModel]:
+        """
+        ``Settings.indexes`` normalized to ``IndexModel``.
+        Accepts a field name, a list of ``(field, direction)`` pairs or an
+        ``IndexModel`` (``init_beanie`` wraps each of them in an
+        ``IndexModelField``); anything else is rejected instead of silently
+        building a different index than the one intended.
+        """
+        indexes: List[IndexModel] = []
+        for spec in getattr(model.get_settings(), "indexes", None) or []:
+            if isinstance(spec, IndexModelField):
+                indexes.append(spec.index)
+            elif isinstance(spec, IndexModel):
+                indexes.append(spec)
+            elif isinstance(spec, str):
+                indexes.append(IndexModel([(spec, ASCENDING)]))
+            elif isinstance(spec, (list, tuple)) and spec and all(isinstance(p, tuple) for p in spec):
+                indexes.append(IndexModel(list(spec)))
+            else:
+                raise ValueError(f"{model.__name__}: unsupported index declaration {spec!r}")
+        return indexes
+
+    @staticmethod
+    def _key(keys: Any) -> IndexKey:
+        # The server may report 1.0 where 1 was declared.
+        return tuple(
+            (name, int(direction) if isinstance(direction, float) else direction)
+            for name, direction in dict(keys).items()
+        )
+
+    @staticmethod
+    def _options(spec: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: spec[k] for k in _OPTIONS if k in spec}
+
+    @staticmethod
+    def _collection(model: Type[Document]):
+        getter = getattr(model, "get_pymongo_collection", None) or model.get_motor_collection
+        return getter()
+
+    # --------------------- Diff / Sync ---------------------
+    async def diff(self, model: Type[Document]) -> IndexDiff:
+        collection = self._collection(model)
+        actual = await collection.index_information()
+        actual_by_key = {
+            self._key(info["key"]): (name, info)
+            for name, info in actual.items()
+            if name != "_id_"
+        }
+
+        result = IndexDiff(collection=model.get_collection_name())
+        wanted = set()
+        for index in self.declared(model):
+            doc = index.document
+            key = self._key(doc["key"])
+            wanted.add(key)
+            if key not in actual_by_key:
+                result.missing.append(index)
+                continue
+            name, info = actual_by_key[key]
+            wanted_options, actual_options = self._options(doc), self._options(info)
+            if wanted_options == actual_options:
+                continue
+            result.changed.append(name)
+            wanted_options.pop("expireAfterSeconds", None)
+            actual_options.pop("expireAfterSeconds", None)
+            if len(key) == 1 and "expireAfterSeconds" in doc and wanted_options == actual_options:
+                result.ttl[name] = doc["expireAfterSeconds"]
+
+        result.extra = [name for key, (name, _) in actual_by_key.items() if key not in wanted]
+        return result
+
+    async def sync(self, models: Sequence[Type[Document]], drop_extra: bool = False) -> List[IndexDiff]:
+        """
+        Create missing indexes (MongoDB builds them without blocking the
+        collection). A changed index that only differs in its TTL (e.g. a
+        plain index on a field later declared with ``expireAfterSeconds``) is
+        converted in place with ``collMod``, which needs MongoDB 5.1+ for a
+        non-TTL index. Any other change is only reported: rebuilding means a
+        drop, which is left to an operator. Missing indexes are built one per
+        command and errors are logged per index, so one bad index (e.g. a
+        unique index over duplicates) does not stop the rest.
+        """
+        diffs = []
+        for model in models:
+            start = time.perf_counter()
+            try:
+                diff = await self.diff(model)
+                for index in diff.missing:
+                    name = index.document["name"]
+                    try:
+                        await self._collection(model).create_indexes([index])
+                    except Exception as e:
+                        diff.failed[name] = str(e)
+                        logger.error(f"Index {name} on {diff.collection} failed to build: {e}")
+                for name, seconds in diff.ttl.items():
+                    try:
+                        await self._set_ttl(model, name, seconds)
+                        diff.changed.remove(name)
+                    except Exception as e:
+                        diff.failed[name] = str(e)
+                        logger.error(f"Index {name} on {diff.collection} failed to set its TTL: {e}")
+                if drop_extra:
+                    for name in diff.extra:
+                        await self._collection(model).drop_index(name)
+            except Exception as e:
+                logger.error(f"Index sync failed for {model.__name__}: {e}")
+                continue
+
+            diffs.append(diff)
+            if diff.missing or diff.ttl or (drop_extra and diff.extra):
+                built = sum(index.document["name"] not in diff.failed for index in diff.missing)
+                ttl_set = sum(name not in diff.failed for name in diff.ttl)
+                logger.info(
+                    f"Indexes for {diff.collection}: built {built}"
+                    f"{f', set TTL on {ttl_set}' if diff.ttl else ''}"
+                    f"{f', dropped {len(diff.extra)}' if drop_extra else ''}"
+                    f" in {time.perf_counter() - start:.2f}s"
+                )
+            if diff.changed:
+                logger.warning(f"Indexes for {diff.collection} differ from declaration: {diff.changed}")
+        return diffs
+
+    async def _set_ttl(self, model: Type[Document], name: str, seconds: int) -> None:
+        collection = self._collection(model)
+        await collection.database.command(
+            {"collMod": collection.name, "index": {"name": name, "expireAfterSeconds": seconds}}
+        )
+
+    # --------------------- Usage ---------------------
+    async def unused(self, model: Type[Document]) -> List[Dict[str, Any]]:
+        """Indexes with no recorded accesses since the server (or index) started counting."""
+        stats = await model.aggregate([{"$indexStats": {}}]).to_list()
+        return [
+            {"name": s["name"], "since": s["accesses"]["since"]}
+            for s in stats
+            if s["name"] != "_id_" and s["accesses"]["ops"] == 0
+        ]
+
+    # --------------------- Background ---------------------
+    def start_background_sync(self, models: Sequence[Type[Document]]) -> asyncio.Task:
+        """Sync indexes without holding up startup."""
+        return asyncio.create_task(self.sync(models))
+
+
+index_manager = IndexManager()
+
+
+async def _cli(command: str, drop_extra: bool) -> None:
+    from app.core.utils.database import mongodb
+
+    await mongodb.connect(sync_indexes=False)
+    try:
+        for model in mongodb.models:
+            name = model.get_collection_name()
+            if command == "unused":
+                for index in await index_manager.unused(model):
+                    print(f"{name}: {index['name']} unused since {index['since']}")
+            elif command == "sync":
+                await index_manager.sync([model], drop_extra=drop_extra)
+            else:
+                diff = await index_manager.diff(model)
+                if diff.in_sync:
+                    continue
+                for index in diff.missing:
+                    print(f"{name}: missing {index.document['name']}")
+                for index_name in diff.extra:
+                    print(f"{name}: undeclared {index_name}")
+                for index_name in diff.changed:
+                    print(f"{name}: options differ {index_name}")
+    finally:
+        await mongodb.disconnect()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Diff, build and audit MongoDB indexes.")
+    parser.add_argument("command", choices=("diff", "sync", "unused"))
+    parser.add_argument("--drop-extra", action="store_true", help="sync: drop undeclared indexes")
+    args = parser.parse_args(argv)
+    asyncio.run(_cli(args.command, args.drop_extra))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
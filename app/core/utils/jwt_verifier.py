@@ -0,0 +1,142 @@
+"""
+JWT signing / verification with prepared keys.
+
+Signing and verification are done by python-jose; what is saved per request
+is the key parsing, since each token type's key is constructed once when
+``SecurityManager`` starts (an unsupported algorithm or unusable key fails
+startup rather than every request). Only the configured algorithm is
+accepted, so a token can never pick its own verification method. Recently
+verified access tokens are memoized by digest until they expire.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
+
+# JWS signature algorithms; the JWE-only entries of ALGORITHMS.SUPPORTED are not.
+SIGNING_ALGORITHMS = ALGORITHMS.HMAC | ALGORITHMS.RSA_DS | ALGORITHMS.EC_DS
+
+
+class TokenError(Exception):
+    """Malformed token or bad signature."""
+
+
+class TokenExpiredError(TokenError):
+    """Well-formed token past its ``exp``."""
+
+
+class PreparedKey:
+    """jose ``Key`` objects for one algorithm, built once from the configured secret or PEM."""
+
+    def __init__(self, algorithm: str, secret: str, public_key: str = ""):
+        if algorithm not in SIGNING_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported JWT algorithm {algorithm!r}; expected one of {', '.join(sorted(SIGNING_ALGORITHMS))}"
+            )
+        self.algorithm = algorithm
+        self.algorithms = [algorithm]
+        self.sign: Optional[Key] = None
+        self.verify: Key
+
+        if algorithm in ALGORITHMS.HMAC:
+            self.sign = self.verify = jwk.construct(secret, algorithm)
+            return
+        # RSA / EC: ``secret`` is the PEM private key (may be empty on services
+        # that only verify); the public key is given or derived from it.
+        if not secret and not public_key:
+            raise ValueError(f"A PEM private or public key is required for {algorithm}")
+        try:
+            self.sign = jwk.construct(secret, algorithm) if secret else None
+            self.verify = jwk.construct(public_key, algorithm) if public_key else self.sign.public_key()
+        except Exception as e:
+            raise ValueError(f"Invalid key for {algorithm}: {e}")
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified payloads keyed by token digest, each valid until the token's ``exp``."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[1])
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        key = self._key(token)
+        self._entries[key] = (float(payload["exp"]), dict(payload))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class JWTCodec:
+    """Encodes / decodes JWTs with python-jose, using keys prepared once per token type."""
+
+    def __init__(self, configs: Mapping[str, Any]):
+        """
+        Prepare a key for every token type with an algorithm configured.
+        Raises ``ValueError`` on an unsupported algorithm or unusable key.
+        """
+        self._keys: Dict[str, PreparedKey] = {
+            token_type: PreparedKey(config.algorithm, config.secret, getattr(config, "public_key", ""))
+            for token_type, config in configs.items()
+            if config.algorithm
+        }
+
+    def key(self, token_type: str) -> PreparedKey:
+        prepared = self._keys.get(token_type)
+        if prepared is None:
+            raise TokenError(f"No JWT algorithm configured for {token_type} tokens")
+        return prepared
+
+    def encode(self, payload: Dict[str, Any], token_type: str) -> str:
+        key = self.key(token_type)
+        if key.sign is None:
+            raise TokenError(f"No signing key configured for {key.algorithm}")
+        return jwt.encode(payload, key.sign, algorithm=key.algorithm)
+
+    def decode(self, token: str, token_type: str) -> Dict[str, Any]:
+        """Verified payload; raises ``TokenExpiredError`` / ``TokenError``."""
+        key = self.key(token_type)
+        try:
+            return jwt.decode(token, key.verify, algorithms=key.algorithms, options={"require_exp": True})
+        except ExpiredSignatureError as e:
+            raise TokenExpiredError(str(e))
+        except JWTError as e:
+            raise TokenError(str(e))
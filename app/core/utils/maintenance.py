@@ -0,0 +1,197 @@
+"""
+Maintenance scheduler for token and verification-code purges.
+
+Each job runs at most once per ``MAINTENANCE_JOB_INTERVAL_SECONDS`` across
+all workers, and only inside the off-peak window
+(``MAINTENANCE_WINDOW_START_HOUR``-``MAINTENANCE_WINDOW_END_HOUR`` UTC). The
+claim is a Redis ``SET NX EX`` on the job name, so whichever worker gets it
+first runs the job and the others skip it until the key expires. Without
+Redis every worker runs the jobs itself; they are idempotent deletes.
+
+Runs inside the app lifespan (``MAINTENANCE_ENABLED``) or standalone:
+
+    python -m app.core.utils.maintenance            # scheduler loop
+    python -m app.core.utils.maintenance --once     # run every job now
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    name: str
+    # Returns the number of documents deleted / updated.
+    run: Callable[[], Awaitable[int]]
+
+
+@dataclass
+class JobReport:
+    name: str
+    rows: int
+    duration_seconds: float
+    finished_at: str
+    error: Optional[str] = None
+
+
+async def _refresh_token_cleanup() -> int:
+    from app.core.utils.token_manager import token_manager
+
+    revoked, expired = await token_manager.cleanup_tokens()
+    return revoked + expired
+
+
+async def _refresh_token_expiry() -> int:
+    from app.crud.user_cruds.refreshed_token_crud import refreshed_token_crud
+
+    return await refreshed_token_crud.revoke_expired_tokens()
+
+
+async def _password_reset_cleanup() -> int:
+    from app.crud.user_cruds.password_reset_crud import password_reset_crud
+
+    return await password_reset_crud.cleanup_expired_tokens()
+
+
+DEFAULT_JOBS = (
+    MaintenanceJob("refresh_tokens.revoke_expired", _refresh_token_expiry),
+    MaintenanceJob("refresh_tokens.cleanup", _refresh_token_cleanup),
+    MaintenanceJob("password_reset_tokens.cleanup", _password_reset_cleanup),
+)
+
+
+class MaintenanceScheduler:
+    def __init__(self, jobs: Sequence[MaintenanceJob] = DEFAULT_JOBS):
+        self.jobs = list(jobs)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.reports: Dict[str, JobReport] = {}
+        self._last_run: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # --------------------- Scheduling ---------------------
+    @staticmethod
+    def in_window(now: Optional[datetime] = None) -> bool:
+        """Whether ``now`` (UTC) is inside the off-peak window; equal bounds mean always."""
+        start, end = settings.MAINTENANCE_WINDOW_START_HOUR, settings.MAINTENANCE_WINDOW_END_HOUR
+        if start == end:
+            return True
+        hour = (now or datetime.now(timezone.utc)).hour
+        return start <= hour < end if start < end else hour >= start or hour < end
+
+    async def _claim(self, job: MaintenanceJob) -> bool:
+        """Take the job for this interval; False if another worker (or this one) already has."""
+        interval = settings.MAINTENANCE_JOB_INTERVAL_SECONDS
+        if redis_client.available:
+            try:
+                return bool(await redis_client.client.set(
+                    f"maintenance:{job.name}", self.worker_id, nx=True, ex=interval
+                ))
+            except Exception as e:
+                logger.warning(f"Maintenance: could not claim {job.name}: {e}")
+                return False
+        last = self._last_run.get(job.name)
+        if last is not None and time.monotonic() - last < interval:
+            return False
+        self._last_run[job.name] = time.monotonic()
+        return True
+
+    # --------------------- Running ---------------------
+    async def run_job(self, job: MaintenanceJob) -> JobReport:
+        start = time.perf_counter()
+        rows, error = 0, None
+        try:
+            rows = await job.run()
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Maintenance job {job.name} failed: {e}")
+        report = JobReport(
+            name=job.name,
+            rows=rows,
+            duration_seconds=round(time.perf_counter() - start, 3),
+            finished_at=datetime.now(timezone.utc).isoformat(),
+            error=error,
+        )
+        self.reports[job.name] = report
+        if error is None:
+            logger.info(f"Maintenance job {job.name}: {rows} rows in {report.duration_seconds:.2f}s")
+        return report
+
+    async def run_due(self, force: bool = False) -> List[JobReport]:
+        """Run every job this worker can claim (``force`` ignores the window and claims)."""
+        if not force and not self.in_window():
+            return []
+        reports = []
+        for job in self.jobs:
+            if force or await self._claim(job):
+                reports.append(await self.run_job(job))
+        return reports
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"Maintenance scheduler error: {e}")
+            await asyncio.sleep(settings.MAINTENANCE_CHECK_INTERVAL_SECONDS)
+
+    # --------------------- Lifecycle ---------------------
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def as_dict(self) -> Dict[str, Dict]:
+        return {name: asdict(report) for name, report in self.reports.items()}
+
+
+maintenance_scheduler = MaintenanceScheduler()
+
+
+async def _cli(once: bool) -> None:
+    from app.core.utils.database import mongodb
+
+    await mongodb.connect(sync_indexes=False)
+    await redis_client.connect()
+    try:
+        if once:
+            for report in await maintenance_scheduler.run_due(force=True):
+                print(f"{report.name}: {report.rows} rows in {report.duration_seconds:.2f}s"
+                      f"{f' (failed: {report.error})' if report.error else ''}")
+        else:
+            await maintenance_scheduler._run()
+    finally:
+        await redis_client.disconnect()
+        await mongodb.disconnect()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run token / verification-code maintenance jobs.")
+    parser.add_argument("--once", action="store_true", help="run every job now and exit")
+    args = parser.parse_args(argv)
+    asyncio.run(_cli(args.once))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
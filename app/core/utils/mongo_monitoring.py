@@ -0,0 +1,188 @@
+"""
+MongoDB command monitoring.
+
+A pymongo ``CommandListener`` records a latency histogram per
+(collection, command) and per route, and flags commands slower than
+``MONGO_SLOW_COMMAND_MS`` together with the *shape* of their filter (values
+replaced by ``?``) so slow queries can be matched to indexes without
+logging user data. The triggering FastAPI route is taken from a contextvar
+set by ``RouteTagMiddleware``.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from pymongo import monitoring
+
+from app.core.utils._logging import get_logger
+from app.core.utils.settings import settings
+
+logger = get_logger(__name__)
+
+# ASGI scope of the request being served; the route is read lazily because
+# routing happens after the middleware runs.
+_request_scope: ContextVar[Optional[dict]] = ContextVar("mongo_request_scope", default=None)
+
+# Upper bounds in ms; the last bucket is open-ended.
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Commands that are driver housekeeping, not application queries.
+_IGNORED = {"ping", "hello", "isMaster", "ismaster", "saslStart", "saslContinue", "endSessions", "buildInfo"}
+
+# Route label of requests no route matched (404s, scanners): they share one
+# bucket instead of one per raw path, so the per-route map stays bounded.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def current_route() -> str:
+    scope = _request_scope.get()
+    if scope is None:
+        return "-"
+    path = getattr(scope.get("route"), "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    return f"{scope.get('method', 'WS')} {path}"
+
+
+def filter_shape(value: Any) -> Any:
+    """Replace every leaf value by ``?``, keeping keys and operators."""
+    if isinstance(value, dict):
+        return {k: filter_shape(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [filter_shape(v) for v in value[:3]]
+    return "?"
+
+
+def _command_filter(name: str, command: dict) -> Any:
+    if name in ("find", "count", "distinct", "findAndModify", "delete", "update"):
+        if "filter" in command:
+            return command["filter"]
+        if "query" in command:
+            return command["query"]
+        for key in ("updates", "deletes"):
+            if command.get(key):
+                return command[key][0].get("q")
+    if name == "aggregate":
+        return [stage for stage in command.get("pipeline", [])[:2]]
+    return None
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        buckets = {f"le_{b}ms": c for b, c in zip(BUCKETS_MS, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """
+    Latency histograms and slow-command log for every MongoDB command.
+    Callbacks may run on driver threads, so state is guarded by a lock.
+    """
+
+    def __init__(self, slow_ms: Optional[float] = None, keep_slow: int = 100):
+        self.slow_ms = slow_ms if slow_ms is not None else settings.MONGO_SLOW_COMMAND_MS
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[Any, int], Tuple[str, Any, str]] = {}
+        self.by_command: Dict[Tuple[str, str], Histogram] = {}
+        self.by_route: Dict[str, Histogram] = {}
+        self.failures: Dict[Tuple[str, str], int] = {}
+        self.slow: Deque[Dict[str, Any]] = deque(maxlen=keep_slow)
+
+    # --------------------- Listener ---------------------
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in _IGNORED:
+            return
+        target = event.command.get(event.command_name)
+        collection = target if isinstance(target, str) else event.database_name
+        info = (collection, _command_filter(event.command_name, event.command), current_route())
+        with self._lock:
+            self._inflight[(event.connection_id, event.request_id)] = info
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool) -> None:
+        with self._lock:
+            info = self._inflight.pop((event.connection_id, event.request_id), None)
+            if info is None:
+                return
+            collection, command_filter, route = info
+            key = (collection, event.command_name)
+            ms = event.duration_micros / 1000
+            self.by_command.setdefault(key, Histogram()).observe(ms)
+            self.by_route.setdefault(route, Histogram()).observe(ms)
+            if failed:
+                self.failures[key] = self.failures.get(key, 0) + 1
+            if ms < self.slow_ms:
+                return
+            entry = {
+                "at": datetime.now(timezone.utc).isoformat(),
+                "collection": collection,
+                "command": event.command_name,
+                "duration_ms": round(ms, 3),
+                "filter": filter_shape(command_filter),
+                "route": route,
+                "failed": failed,
+            }
+            self.slow.append(entry)
+        logger.warning("mongo.slow_command", **entry)
+
+    # --------------------- Export ---------------------
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "slow_threshold_ms": self.slow_ms,
+                "commands": {
+                    f"{collection}.{name}": {**hist.as_dict(), "failures": self.failures.get((collection, name), 0)}
+                    for (collection, name), hist in sorted(self.by_command.items())
+                },
+                "routes": {route: hist.as_dict() for route, hist in sorted(self.by_route.items())},
+                "slow": list(self.slow),
+            }
+
+
+class RouteTagMiddleware:
+    """ASGI middleware exposing the current request to ``current_route``."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            return await self.app(scope, receive, send)
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
+
+
+command_metrics = CommandMetrics()
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+
+from passlib.context import CryptContext
+
+from app.core.response.exceptions import Exceptions
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a dedicated, bounded thread pool.
+
+    At most ``PASSWORD_HASH_WORKERS`` hashes run at once (bcrypt releases the
+    GIL, so they really run in parallel); up to ``PASSWORD_HASH_MAX_QUEUE``
+    more may wait for a slot, beyond which callers get a 429 instead of
+    piling up behind a login storm.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self.workers = workers or settings.PASSWORD_HASH_WORKERS
+        self.max_queue = settings.PASSWORD_HASH_MAX_QUEUE if max_queue is None else max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(self.workers)
+        self._background: Set[asyncio.Task] = set()
+        self.running = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, fn, *args) -> Any:
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            logger.warning(f"Password hashing queue full ({self.queued} waiting)")
+            Exceptions.too_many_requests("Too many login attempts in progress, try again shortly")
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        enqueued = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.perf_counter()
+        self.wait_seconds += started - enqueued
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.run_seconds += time.perf_counter() - started
+            self._slots.release()
+
+    # --------------------- Hashing ---------------------
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(pwd_context.verify, plain, hashed)
+
+    @staticmethod
+    def needs_update(hashed: str) -> bool:
+        """Whether a stored hash uses outdated settings (cheap, no hashing)."""
+        return pwd_context.needs_update(hashed)
+
+    def rehash_in_background(self, user_id: Any, plain: str) -> None:
+        """Re-hash a just-verified password with current settings without delaying the login."""
+        task = asyncio.create_task(self._rehash(user_id, plain))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _rehash(self, user_id: Any, plain: str) -> None:
+        from app.crud import user_crud
+
+        try:
+            await user_crud.update(user_id, {"hashed_password": await self.hash(plain)})
+            logger.info(f"Upgraded password hash for user {user_id}")
+        except Exception as e:
+            logger.warning(f"Password rehash failed for user {user_id}: {e}")
+
+    # --------------------- Lifecycle / Stats ---------------------
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "queue_limit": self.max_queue,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.wait_seconds / self.completed * 1000, 2) if self.completed else 0,
+            "avg_run_ms": round(self.run_seconds / self.completed * 1000, 2) if self.completed else 0,
+        }
+
+
+password_hasher = PasswordHasher()
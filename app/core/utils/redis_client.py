@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+
+from redis.asyncio import Redis
+
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisClient:
+    """
+    Shared asyncio Redis connection.
+
+    Redis is optional: when it is not reachable ``client`` stays ``None`` and
+    callers are expected to fall back to MongoDB.
+    """
+
+    def __init__(self):
+        self.client: Redis | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.client is not None
+
+    # ----------------- PUBLIC -----------------
+
+    async def connect(self):
+        """Open the Redis connection pool (no-op if already connected)."""
+        if self.client:
+            return
+
+        client = Redis.from_url(settings.redis_url, decode_responses=True)
+        try:
+            await client.ping()
+        except Exception as e:
+            logger.warning(f"⚠️  Redis unavailable, continuing without cache: {e}")
+            await client.aclose()
+            return
+
+        self.client = client
+        logger.info("✅ Redis connected.")
+
+    async def disconnect(self):
+        """Close the Redis connection pool."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+            logger.info("Redis disconnected.")
+
+
+# Global instance
+redis_client = RedisClient()
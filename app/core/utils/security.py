@@ -5,18 +5,19 @@ import secrets
 import time
 import hmac
 from dataclasses import dataclass
-from typing import Dict, Any, ClassVar
+from typing import Dict, Any, ClassVar, Optional
 from fastapi import Request
-from jose import jwt, JWTError, ExpiredSignatureError
-from passlib.context import CryptContext
+from beanie import PydanticObjectId
 
 from app.core.response.exceptions import Exceptions
+from app.core.utils.auth_cache import AuthState, auth_cache
+from app.core.utils.jwt_verifier import JWTCodec, TokenError, TokenExpiredError, VerifiedTokenCache
+from app.core.utils.password_hasher import password_hasher
 from app.core.utils.settings import settings
 from app.crud import user_crud
-from app.models.user_models import User
+from app.models.user_models import User, UserRole
 
 logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 @dataclass(frozen=True)
@@ -36,6 +37,25 @@ class TokenConfig:
     allow_login: bool = False
 
 
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    The caller of an authenticated request, as checked by ``get_current_user``.
+
+    Carries only what the auth check reads, so it can be served from
+    ``auth_cache`` without touching the users collection. Use ``load()`` when
+    other ``User`` fields are needed.
+    """
+    id: PydanticObjectId
+    user_role: UserRole
+    is_active: bool
+    token_version: int
+
+    async def load(self) -> Optional[User]:
+        """The full ``User`` document."""
+        return await user_crud.get_user_by_id(self.id)
+
+
 class SecurityManager:
     """
     Centralized manager for authentication and token handling.
@@ -48,11 +68,18 @@ class SecurityManager:
     """
 
     _configs: ClassVar[Dict[str, TokenConfig]]
+    _codec: ClassVar[JWTCodec]
+    _verified: ClassVar[VerifiedTokenCache]
 
     @classmethod
     def initialize(cls) -> None:
-        """Load token configurations from settings."""
+        """
+        Load token configurations from settings and prepare their keys.
+        An unsupported JWT algorithm or unusable key raises here, at startup.
+        """
         cls._configs = settings.DEFAULT_TOKEN_CONFIGS
+        cls._codec = JWTCodec(cls._configs)
+        cls._verified = VerifiedTokenCache(settings.JWT_VERIFY_CACHE_SIZE)
 
     @staticmethod
     def now() -> int:
@@ -60,9 +87,9 @@ class SecurityManager:
         return int(time.time())
 
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password(password: str) -> str:
         """
-        Hash a plaintext password using bcrypt.
+        Hash a plaintext password using bcrypt (on the password hashing pool).
 
         Args:
             password (str): The password to hash (minimum 8 characters).
@@ -75,12 +102,12 @@ class SecurityManager:
         """
         if not password or len(password) < 8:
             raise ValueError("Password must be at least 8 characters")
-        return pwd_context.hash(password)
+        return await password_hasher.hash(password)
 
     @staticmethod
-    def verify_password(plain: str, hashed: str) -> bool:
+    async def verify_password(plain: str, hashed: str) -> bool:
         """
-        Verify a plaintext password against a hashed password.
+        Verify a plaintext password against a hashed password (on the password hashing pool).
 
         Args:
             plain (str): Plaintext password.
@@ -89,7 +116,7 @@ class SecurityManager:
         Returns:
             bool: True if verified, False otherwise.
         """
-        return bool(plain and hashed and pwd_context.verify(plain, hashed))
+        return bool(plain and hashed and await password_hasher.verify(plain, hashed))
 
     @staticmethod
     def constant_time_compare(a: bytes | str, b: bytes | str) -> bool:
@@ -149,20 +176,19 @@ class SecurityManager:
             raise Exceptions.internal_server_error(f"Invalid token type: {token_type}")
         return cfg
 
-    @staticmethod
-    def _encode(payload: Dict[str, Any], secret: str, algorithm: str) -> str:
-        """Encode a payload into a JWT string."""
-        return jwt.encode(payload, secret, algorithm=algorithm)
+    @classmethod
+    def _encode(cls, payload: Dict[str, Any], token_type: str) -> str:
+        """Encode a payload into a JWT string with the token type's prepared key."""
+        return cls._codec.encode(payload, token_type)
 
-    @staticmethod
-    def _decode(token: str, secret: str, algorithm: str) -> Dict[str, Any]:
+    @classmethod
+    def _decode(cls, token: str, token_type: str) -> Dict[str, Any]:
         """
-        Decode a JWT token.
+        Decode and verify a JWT token with the token type's prepared key.
 
         Args:
             token (str): JWT string.
-            secret (str): Secret key used to sign token.
-            algorithm (str): Algorithm used for signing.
+            token_type (str): Token type whose key and algorithm apply.
 
         Raises:
             Exceptions.token_expired_exception: If token is expired.
@@ -172,11 +198,11 @@ class SecurityManager:
             dict: Decoded JWT payload.
         """
         try:
-            return jwt.decode(token, secret, algorithms=[algorithm])
-        except ExpiredSignatureError:
+            return cls._codec.decode(token, token_type)
+        except TokenExpiredError:
             logger.warning("Token expired")
             raise Exceptions.token_expired_exception()
-        except JWTError as e:
+        except TokenError as e:
             logger.warning("Invalid token: %s", e)
             raise Exceptions.permission_denied()
 
@@ -200,13 +226,22 @@ class SecurityManager:
             logger.warning("Token missing subject claim")
             raise Exceptions.permission_denied()
 
+        # allow_login gates authenticating requests with the token, which only
+        # access tokens do; refresh tokens are exchanged, never logged in with.
         cfg = cls._get_config(expected_type)
-        if not cfg.allow_login and payload.get("type") in ["access", "refresh"]:
-            logger.warning("Token type %s not allowed for login", payload.get("type"))
+        if expected_type == "access" and not cfg.allow_login:
+            logger.warning("Token type %s not allowed for login", expected_type)
             raise Exceptions.permission_denied()
 
     @classmethod
-    def create_token(cls, user_id: str, token_type: str, version: int = 1) -> str:
+    def create_token(
+        cls,
+        user_id: str,
+        token_type: str,
+        version: int = 1,
+        jti: str | None = None,
+        claims: Dict[str, Any] | None = None,
+    ) -> str:
         """
         Create a JWT token for a given user and token type.
 
@@ -214,6 +249,8 @@ class SecurityManager:
             user_id (str): ID of the user.
             token_type (str): Type of token ("access", "refresh", etc.).
             version (int): Token version for session invalidation.
+            jti (str | None): Token id to embed (random when omitted).
+            claims (dict | None): Extra claims (e.g. ``sid`` on refresh tokens).
 
         Returns:
             str: Signed JWT token.
@@ -222,14 +259,15 @@ class SecurityManager:
         now = cls.now()
 
         payload = {
+            **(claims or {}),
             "sub": str(user_id),
             "exp": now + cfg.expire_seconds,
             "iat": now,
-            "jti": cls.random_jti(),
+            "jti": jti or cls.random_jti(),
             "version": version,
             "type": token_type,
         }
-        return cls._encode(payload, cfg.secret, cfg.algorithm)
+        return cls._encode(payload, token_type)
 
     @classmethod
     def generate_access_token(cls, user_id: str, version: int = 1) -> str:
@@ -237,9 +275,11 @@ class SecurityManager:
         return cls.create_token(user_id, "access", version)
 
     @classmethod
-    def generate_refresh_token(cls, user_id: str, version: int = 1) -> str:
-        """Generate a refresh token."""
-        return cls.create_token(user_id, "refresh", version)
+    def generate_refresh_token(
+        cls, user_id: str, version: int = 1, jti: str | None = None, session_id: str | None = None
+    ) -> str:
+        """Generate a refresh token (``sid`` ties rotated tokens to one device session)."""
+        return cls.create_token(user_id, "refresh", version, jti, {"sid": session_id} if session_id else None)
 
     @classmethod
     def generate_password_reset_token(cls, user_id: str) -> str:
@@ -255,6 +295,8 @@ class SecurityManager:
     def verify_token(cls, token: str, token_type: str) -> Dict[str, Any]:
         """
         Verify a token for a given type and validate its claims.
+        Access tokens already verified by this worker are answered from an
+        LRU keyed by token digest until they expire.
 
         Args:
             token (str): JWT token string.
@@ -263,11 +305,20 @@ class SecurityManager:
         Returns:
             dict: Validated token payload.
         """
-        cfg = cls._get_config(token_type)
-        payload = cls._decode(token, cfg.secret, cfg.algorithm)
+        memoize = token_type == "access"
+        if memoize and (payload := cls._verified.get(token)) is not None:
+            return payload
+        payload = cls._decode(token, token_type)
         cls._validate_claims(payload, token_type)
+        if memoize:
+            cls._verified.set(token, payload)
         return payload
 
+    @classmethod
+    def verified_token_stats(cls) -> Dict[str, Any]:
+        """Hit/miss stats of the verified access-token LRU."""
+        return cls._verified.stats()
+
     @classmethod
     def verify_access_token(cls, token: str) -> Dict[str, Any]:
         """Verify an access token."""
@@ -339,10 +390,15 @@ class SecurityManager:
 
         return refresh_token
     @classmethod
-    async def get_current_user(cls, request: Request) -> User:
+    async def get_current_user(cls, request: Request) -> AuthenticatedUser:
         """
         Get the currently authenticated user based on access token.
 
+        The (is_active, token_version, role) check is served from ``auth_cache``
+        when possible. On a miss those fields are read straight from MongoDB
+        (never through a document cache, which could be stale on this worker)
+        and cached for every worker.
+
         Args:
             request (Request): FastAPI request object.
 
@@ -350,21 +406,37 @@ class SecurityManager:
             Exceptions.permission_denied: If user is not found, inactive, or token version mismatch.
 
         Returns:
-            User: Authenticated user object.
+            AuthenticatedUser: The caller (``.load()`` for the full ``User``).
         """
         token = await cls.extract_access_token(request)
         payload = cls.verify_access_token(token)
-
-        user = await user_crud.get_user_by_id(payload["sub"])
-        if not user or not getattr(user, "is_active", True):
-            logger.warning("User not found or inactive: %s", payload["sub"])
+        user_id = payload["sub"]
+
+        state = await auth_cache.get(user_id)
+        if state is None:
+            epoch = auth_cache.epoch
+            doc = await user_crud.get_one(
+                {"_id": PydanticObjectId(user_id)},
+                projection=["is_active", "token_version", "user_role"],
+            )
+            if doc:
+                state = AuthState.of_document(doc)
+                await auth_cache.set(user_id, state, epoch=epoch)
+
+        if not state or not state.is_active:
+            logger.warning("User not found or inactive: %s", user_id)
             raise Exceptions.permission_denied()
 
-        if payload.get("version", 0) != getattr(user, "token_version", 0):
-            logger.info("Token version mismatch for user %s", user.id)
+        if payload.get("version", 0) != state.token_version:
+            logger.info("Token version mismatch for user %s", user_id)
             raise Exceptions.permission_denied()
 
-        return user
+        return AuthenticatedUser(
+            id=PydanticObjectId(user_id),
+            user_role=UserRole(state.role),
+            is_active=state.is_active,
+            token_version=state.token_version,
+        )
 
     @classmethod
     async def get_user_from_refresh_token(cls, request: Request) -> User:
@@ -409,10 +481,7 @@ class SecurityManager:
             Exception: If session invalidation fails.
         """
         try:
-            user = await User.get(user_id)
-            if user:
-                user.token_version = getattr(user, "token_version", 0) + 1
-                await user.save()
+            if await user_crud.increment_token_version(user_id):
                 logger.info("Invalidated sessions for user %s", user_id)
         except Exception as e:
             logger.error("Session invalidation failed for %s: %s", user_id, e)
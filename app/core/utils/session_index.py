@@ -0,0 +1,162 @@
+"""
+Per-user session inventory in Redis.
+
+One hash per user (``sessions:{user_id}``) maps each device session id (the
+``sid`` claim, stable across refresh-token rotations) to its current ``jti``,
+device metadata and first/last-seen times. Listing is one ``HGETALL``;
+revoke-all is one ``MULTI`` (drop the hash and stamp the user's
+revoked-before time); revoke-others is one Lua script that marks each other
+session's ``jti`` revoked and removes it. MongoDB (``RefreshedToken``)
+remains the durable store and the fallback when Redis is unavailable.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request
+
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+from app.core.utils.token_revocation import token_revocations
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = session hash; ARGV = session id, entry JSON, key TTL. Keeps the
+# session's original created_at across rotations.
+_TOUCH = """
+local entry = cjson.decode(ARGV[2])
+local previous = redis.call('HGET', KEYS[1], ARGV[1])
+if previous then
+  entry.created_at = cjson.decode(previous).created_at
+end
+redis.call('HSET', KEYS[1], ARGV[1], cjson.encode(entry))
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+# KEYS[1] = session hash; ARGV = session id to keep, now (epoch seconds), jti key prefix.
+_REVOKE_OTHERS = """
+local entries = redis.call('HGETALL', KEYS[1])
+local now = tonumber(ARGV[2])
+local revoked = 0
+for i = 1, #entries, 2 do
+  if entries[i] ~= ARGV[1] then
+    local session = cjson.decode(entries[i + 1])
+    local ttl = math.floor(session.expires_at - now)
+    if ttl > 0 then
+      redis.call('SET', ARGV[3] .. session.jti, 1, 'EX', ttl)
+    end
+    redis.call('HDEL', KEYS[1], entries[i])
+    revoked = revoked + 1
+  end
+end
+return revoked
+"""
+
+
+def device_from_request(request: Optional[Request]) -> Dict[str, Optional[str]]:
+    """``user_agent`` / ``ip_address`` of a request (first ``X-Forwarded-For`` hop when proxied)."""
+    if request is None:
+        return {"user_agent": None, "ip_address": None}
+    forwarded = request.headers.get("X-Forwarded-For", "")
+    ip = forwarded.split(",")[0].strip() or (request.client.host if request.client else None)
+    user_agent = request.headers.get("User-Agent")
+    return {"user_agent": user_agent[:512] if user_agent else None, "ip_address": ip}
+
+
+class SessionIndex:
+    """Redis view of a user's refresh-token sessions; every method degrades to a no-op / None without Redis."""
+
+    @staticmethod
+    def _key(user_id: Any) -> str:
+        return f"sessions:{user_id}"
+
+    @staticmethod
+    def _ttl() -> int:
+        return settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+    # --------------------- Writes ---------------------
+    async def touch(
+        self,
+        user_id: Any,
+        session_id: str,
+        jti: str,
+        expires_at: float,
+        device: Dict[str, Optional[str]],
+    ) -> None:
+        """Record a newly issued refresh token for a session (login or rotation), one round trip."""
+        if not redis_client.available:
+            return
+        now = time.time()
+        entry = {"jti": jti, "expires_at": expires_at, "created_at": now, "last_seen": now, **device}
+        try:
+            await redis_client.client.eval(_TOUCH, 1, self._key(user_id), session_id, json.dumps(entry), self._ttl())
+        except Exception as e:
+            logger.warning(f"Session index: Redis write failed: {e}")
+
+    async def remove(self, user_id: Any, session_id: str) -> None:
+        if not redis_client.available:
+            return
+        try:
+            await redis_client.client.hdel(self._key(user_id), session_id)
+        except Exception as e:
+            logger.warning(f"Session index: Redis write failed: {e}")
+
+    async def revoke_all(self, user_id: Any) -> None:
+        """Forget every session and revoke all tokens issued so far, in one round trip."""
+        if not redis_client.available:
+            return
+        try:
+            async with redis_client.client.pipeline(transaction=True) as pipe:
+                pipe.delete(self._key(user_id))
+                pipe.set(token_revocations.user_key(user_id), int(time.time()), ex=self._ttl())
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Session index: Redis write failed: {e}")
+
+    async def revoke_others(self, user_id: Any, keep_session_id: Optional[str]) -> Optional[int]:
+        """
+        Revoke and forget every session but ``keep_session_id`` (one script
+        call). None without Redis or without a session to keep, which would
+        otherwise revoke the caller's own session too.
+        """
+        if not redis_client.available or not keep_session_id:
+            return None
+        try:
+            return int(await redis_client.client.eval(
+                _REVOKE_OTHERS, 1, self._key(user_id),
+                keep_session_id, time.time(), token_revocations.jti_key(""),
+            ))
+        except Exception as e:
+            logger.warning(f"Session index: Redis revoke failed: {e}")
+            return None
+
+    # --------------------- Reads ---------------------
+    async def list(self, user_id: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Live sessions, most recently seen first. None when Redis cannot
+        answer or has nothing for the user (e.g. sessions from before the
+        index existed), so the caller reads Mongo instead.
+        """
+        if not redis_client.available:
+            return None
+        try:
+            raw = await redis_client.client.hgetall(self._key(user_id))
+        except Exception as e:
+            logger.warning(f"Session index: Redis read failed: {e}")
+            return None
+        if not raw:
+            return None
+        now = time.time()
+        sessions = []
+        for session_id, value in raw.items():
+            entry = json.loads(value)
+            if entry["expires_at"] > now:
+                sessions.append({"session_id": session_id, **entry})
+        return sorted(sessions, key=lambda s: s["last_seen"], reverse=True)
+
+
+session_index = SessionIndex()
@@ -11,6 +11,9 @@ class TokenConfig:
     algorithm: str
     expire_seconds: int
     allow_login: bool = False
+    # PEM public key for RS* / ES* (``secret`` then holds the PEM private
+    # key, and may be empty on services that only verify).
+    public_key: str = ""
 
 
 class Settings(BaseSettings):
@@ -36,6 +39,23 @@ class Settings(BaseSettings):
     MONGO_DB: str = "mia"
     MONGO_AUTH_SOURCE: str = ""
     MONGO_URI: str | None = None
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: int = 300_000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 5_000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 10_000
+    # Wire compression in preference order, e.g. "zstd,snappy,zlib" (zstd/snappy need their packages).
+    MONGO_COMPRESSORS: str = ""
+    # Route read-heavy list queries (feeds, search, comments) to secondaries.
+    MONGO_SECONDARY_READS: bool = False
+    MONGO_MAX_STALENESS_SECONDS: int = 90
+    MONGO_SYNC_INDEXES_ON_STARTUP: bool = True
+    # Per-command latency histograms and slow-command logging (see /metrics/mongo).
+    MONGO_COMMAND_MONITORING: bool = True
+    MONGO_SLOW_COMMAND_MS: float = 100
+    # Discovered model list, reused across boots until a model file changes ("" disables).
+    MODEL_REGISTRY_CACHE: str = ".cache/beanie_models.json"
+    STARTUP_BUDGET_SECONDS: float = 5.0
 
     # === API Security ===
     API_SUPERUSER_EMAIL: str = ""
@@ -60,11 +80,27 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # HS256/384/512 use JWT_SECRET_KEY; RS*/ES* use it as a PEM private key.
+    JWT_PUBLIC_KEY: str = ""
+    # Verified access tokens memoized by digest until expiry (0 disables).
+    JWT_VERIFY_CACHE_SIZE: int = 10_000
 
     PASSWORD_RESET_SECRET_KEY: str = ""
     PASSWORD_RESET_ALGORITHM: str = ""
     PASSWORD_RESET_MINUTES_EXPIRE: int = 15
 
+    # (is_active, token_version, role) per user, so authenticated requests skip Mongo.
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    # Bounds how long another worker may miss an invalidation.
+    AUTH_CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    AUTH_CACHE_MAX_ENTRIES: int = 50_000
+    AUTH_CACHE_REDIS: bool = True
+
+    # bcrypt runs on its own pool; beyond the queue limit logins get a 429.
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
     # -----------------------
     # CORS
     # -----------------------
@@ -82,6 +118,80 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
 
+    # -----------------------
+    # SFU / WebRTC
+    # -----------------------
+    SFU_SHARED_SECRET: str = ""
+    SFU_HEARTBEAT_TTL_SECONDS: int = 30
+    # Lease of a newly registered room until the SFU's first heartbeat reaches it.
+    SFU_REGISTRATION_TTL_SECONDS: int = 300
+    SFU_RECONCILE_INTERVAL_SECONDS: int = 15
+    SFU_NODE_MAX_ROOMS: int = 200
+    SFU_NODE_MAX_PEERS: int = 5000
+    SFU_NODE_MAX_BITRATE_KBPS: int = 1_000_000
+    SFU_SIMULATED: bool = False
+    SFU_SIMULATED_URL: str = "ws://localhost:4443"
+
+    # -----------------------
+    # Recording pipeline
+    # -----------------------
+    RECORDING_WORKER_CONCURRENCY: int = 2
+    RECORDING_UPLOAD_CONCURRENCY: int = 8
+    RECORDING_POLL_INTERVAL_SECONDS: int = 10
+    RECORDING_HLS_SEGMENT_SECONDS: int = 6
+    RECORDING_FFMPEG_THREADS: int = 0
+    # Kill a hung ffmpeg (packaging) / ffprobe or thumbnail run after this long.
+    RECORDING_FFMPEG_TIMEOUT_SECONDS: int = 7200
+    RECORDING_PROBE_TIMEOUT_SECONDS: int = 120
+    # A PROCESSING claim not renewed for this long is treated as abandoned.
+    RECORDING_CLAIM_TIMEOUT_SECONDS: int = 900
+    RECORDING_MAX_ATTEMPTS: int = 3
+
+    # -----------------------
+    # CRUD (read-through cache, bulk writes)
+    # -----------------------
+    CRUD_CACHE_ENABLED: bool = True
+    CRUD_CACHE_REDIS: bool = False
+    CRUD_BULK_CHUNK_SIZE: int = 1000
+    CRUD_BULK_CONCURRENCY: int = 4
+    CRUD_DELETE_BATCH_SIZE: int = 1000
+    CRUD_DELETE_BATCH_PAUSE_SECONDS: float = 0.05
+
+    # -----------------------
+    # Maintenance (token / verification-code purges)
+    # -----------------------
+    MAINTENANCE_ENABLED: bool = True
+    # Off-peak window in UTC hours, [start, end); equal values mean any time.
+    MAINTENANCE_WINDOW_START_HOUR: int = 2
+    MAINTENANCE_WINDOW_END_HOUR: int = 5
+    MAINTENANCE_JOB_INTERVAL_SECONDS: int = 86_400
+    MAINTENANCE_CHECK_INTERVAL_SECONDS: int = 300
+
+    # -----------------------
+    # Livestream participant cache
+    # -----------------------
+    # Idle lifetime of a stream's participant hash; every load / write renews it.
+    PARTICIPANT_CACHE_TTL_SECONDS: int = 43_200
+
+    # -----------------------
+    # Livestream event log
+    # -----------------------
+    EVENT_LOG_BATCH_SIZE: int = 500
+    EVENT_LOG_MAX_BUFFER: int = 10_000
+    EVENT_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    # Retries of a batch that failed as a whole (e.g. a transient Mongo error), with doubling backoff.
+    EVENT_LOG_MAX_RETRIES: int = 3
+    EVENT_LOG_RETRY_BACKOFF_SECONDS: float = 0.5
+
+    # -----------------------
+    # WebSockets
+    # -----------------------
+    WS_HEARTBEAT_INTERVAL_SECONDS: int = 20
+    WS_IDLE_TIMEOUT_SECONDS: int = 60
+    WS_SEND_TIMEOUT_SECONDS: float = 5.0
+    WS_MAX_CONNECTIONS: int = 20_000
+    WS_MAX_CONNECTIONS_PER_ROOM: int = 5_000
+
     CELERY_BROKER_URL: str = ""
     CELERY_RESULT_BACKEND: str = ""
 
@@ -137,12 +247,14 @@ class Settings(BaseSettings):
             "access": TokenConfig(
                 secret=self.JWT_SECRET_KEY,
                 algorithm=self.JWT_ALGORITHM,
+                public_key=self.JWT_PUBLIC_KEY,
                 expire_seconds=self.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
                 allow_login=True,
             ),
             "refresh": TokenConfig(
                 secret=self.JWT_SECRET_KEY,
                 algorithm=self.JWT_ALGORITHM,
+                public_key=self.JWT_PUBLIC_KEY,
                 expire_seconds=self.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
                 allow_login=False,
             ),
@@ -155,6 +267,7 @@ class Settings(BaseSettings):
             "email_verification": TokenConfig(
                 secret=self.JWT_SECRET_KEY,
                 algorithm=self.JWT_ALGORITHM,
+                public_key=self.JWT_PUBLIC_KEY,
                 expire_seconds=24 * 3600,
                 allow_login=False,
             ),
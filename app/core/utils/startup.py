@@ -0,0 +1,52 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """
+    Times named startup phases and logs them against ``STARTUP_BUDGET_SECONDS``.
+
+        with startup_report.phase("mongodb"):
+            await mongodb.connect()
+        startup_report.log()
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self._started
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            "total_seconds": round(self.total, 3),
+            "budget_seconds": settings.STARTUP_BUDGET_SECONDS,
+            "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+        }
+
+    def log(self) -> None:
+        breakdown = ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.phases.items())
+        total = self.total
+        if settings.STARTUP_BUDGET_SECONDS and total > settings.STARTUP_BUDGET_SECONDS:
+            logger.warning(f"Startup took {total:.2f}s, over the {settings.STARTUP_BUDGET_SECONDS}s budget ({breakdown})")
+        else:
+            logger.info(f"Startup took {total:.2f}s ({breakdown})")
+
+
+startup_report = StartupReport()
@@ -1,11 +1,16 @@
 from datetime import datetime, timedelta, timezone
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+
+from fastapi import HTTPException, Request
 
 from app.core.response.exceptions import Exceptions
-from app.models.user_models import User, RefreshedToken
+from app.models.user_models import User
+from app.crud import user_crud
 from app.crud.user_cruds.refreshed_token_crud import refreshed_token_crud
 from app.core.utils.settings import settings
-from app.core.utils.security import SecurityManager
+from app.core.utils.security import AuthenticatedUser, SecurityManager
+from app.core.utils.session_index import device_from_request, session_index
+from app.core.utils.token_revocation import token_revocations
 
 
 class Token:
@@ -16,6 +21,11 @@ class Token:
         self.token_type = token_type
 
 
+def _epoch(value: datetime) -> float:
+    """Mongo hands back naive UTC datetimes."""
+    return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+
+
 class TokenManager:
     """Centralized token management: creation, validation, rotation, revocation, cleanup."""
 
@@ -23,40 +33,35 @@ class TokenManager:
     # Internal Helpers
     # -----------------------
     @staticmethod
-    async def _create_token(user_id: str, token_type: str, version: int = 1) -> str:
+    async def _create_token(
+        user_id: str,
+        token_type: str,
+        version: int = 1,
+        device: Optional[Dict[str, Optional[str]]] = None,
+        session_id: Optional[str] = None,
+    ) -> str:
         """Generic token creation wrapper."""
         if token_type == "access":
             return SecurityManager.generate_access_token(user_id, version)
         elif token_type == "refresh":
-            token = SecurityManager.generate_refresh_token(user_id, version)
+            device = device or device_from_request(None)
+            jti = SecurityManager.random_jti()
+            sid = session_id or SecurityManager.random_jti()
+            token = SecurityManager.generate_refresh_token(user_id, version, jti=jti, session_id=sid)
             exp = datetime.now(timezone.utc) + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
             await refreshed_token_crud.create_refresh_token(
-                user_id=user_id, refresh_token=token, expires_at=exp
+                user_id=user_id, refresh_token=token, jti=jti, expires_at=exp, session_id=sid, **device
             )
+            await session_index.touch(user_id, sid, jti, exp.timestamp(), device)
             return token
         raise ValueError(f"Unsupported token type: {token_type}")
 
     @staticmethod
-    async def _revoke_tokens(tokens: list[RefreshedToken], exclude: Optional[str] = None) -> int:
-        """Revoke multiple tokens, optionally excluding one."""
-        count = 0
-        for token in tokens:
-            if token.refresh_token != exclude:
-                await refreshed_token_crud.revoke_token(token.refresh_token)
-                count += 1
-        return count
-
-    @staticmethod
-    async def _verify_refresh_token(refresh_token: str) -> Optional[RefreshedToken]:
-        """Validate refresh token and return token record if valid."""
+    def _claims(refresh_token: str) -> Optional[Dict[str, Any]]:
+        """Verified refresh-token payload, or None if the token is invalid or expired."""
         try:
-            _ = SecurityManager.verify_refresh_token(refresh_token)
-            token_record = await refreshed_token_crud.get_valid_token(refresh_token)
-            if not token_record or token_record.expires_at < datetime.now(timezone.utc):
-                await refreshed_token_crud.revoke_token(refresh_token)
-                return None
-            return token_record
-        except Exceptions.forbidden():
+            return SecurityManager.verify_refresh_token(refresh_token)
+        except HTTPException:
             return None
 
     # -----------------------
@@ -67,50 +72,124 @@ class TokenManager:
         return await TokenManager._create_token(user_id, "access", token_version)
 
     @staticmethod
-    async def create_refresh_token(user_id: str, token_version: int = 1) -> str:
-        return await TokenManager._create_token(user_id, "refresh", token_version)
+    async def create_refresh_token(
+        user_id: str,
+        token_version: int = 1,
+        device: Optional[Dict[str, Optional[str]]] = None,
+        session_id: Optional[str] = None,
+    ) -> str:
+        return await TokenManager._create_token(user_id, "refresh", token_version, device, session_id)
 
     @staticmethod
-    async def generate_token_pair(user: User) -> Tuple[str, str]:
-        """Generate access + refresh token pair."""
+    async def generate_token_pair(
+        user: User, request: Optional[Request] = None, session_id: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Generate access + refresh token pair; ``session_id`` continues an existing device session."""
         access = await TokenManager.create_access_token(str(user.id), user.token_version)
-        refresh = await TokenManager.create_refresh_token(str(user.id), user.token_version)
+        refresh = await TokenManager.create_refresh_token(
+            str(user.id), user.token_version, device_from_request(request), session_id
+        )
         return access, refresh
 
     # -----------------------
     # Token Rotation
     # -----------------------
     @staticmethod
-    async def rotate_refresh_token(old_token: str) -> Optional[Token]:
-        token_record = await TokenManager._verify_refresh_token(old_token)
-        if not token_record:
+    async def consume_refresh_token(refresh_token: str) -> bool:
+        """
+        Use up a refresh token for rotation. Known-revoked tokens are rejected
+        from Redis; otherwise one conditional update both checks and revokes
+        the stored token, so a replayed or concurrent reuse gets False.
+        """
+        payload = TokenManager._claims(refresh_token)
+        if not payload or await token_revocations.is_revoked(payload):
+            return False
+        if not await refreshed_token_crud.consume_token(refresh_token):
+            return False
+        await token_revocations.revoke([payload])
+        return True
+
+    @staticmethod
+    async def rotate_refresh_token(old_token: str, request: Optional[Request] = None) -> Optional[Token]:
+        payload = TokenManager._claims(old_token)
+        if not payload or not await TokenManager.consume_refresh_token(old_token):
             return None
 
-        user = await token_record.user.fetch()
-        if not user:
-            await refreshed_token_crud.revoke_token(old_token)
+        user = await user_crud.get_user_by_id(payload["sub"])
+        if not user or not user.is_active or payload.get("version", 0) != user.token_version:
             return None
 
-        await refreshed_token_crud.revoke_token(old_token)
-        access = await TokenManager.create_access_token(str(user.id), user.token_version)
-        refresh = await TokenManager.create_refresh_token(str(user.id), user.token_version)
+        access, refresh = await TokenManager.generate_token_pair(user, request, payload.get("sid"))
         return Token(access, refresh)
 
+    # -----------------------
+    # Sessions
+    # -----------------------
+    @staticmethod
+    async def list_sessions(user_id: str, current_refresh_token: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Active device sessions, most recently seen first. Served from the
+        Redis session index; falls back to the stored refresh tokens.
+        """
+        sessions = await session_index.list(user_id)
+        if sessions is None:
+            sessions = [
+                {
+                    "session_id": token.session_id or token.jti,
+                    "user_agent": token.user_agent,
+                    "ip_address": token.ip_address,
+                    "created_at": _epoch(token.created_at),
+                    "last_seen": _epoch(token.updated_at),
+                    "expires_at": _epoch(token.expires_at),
+                }
+                for token in await refreshed_token_crud.get_user_tokens(user_id, active_only=True)
+            ]
+        current = TokenManager._claims(current_refresh_token) if current_refresh_token else None
+        current_sid = current.get("sid") if current else None
+        return [
+            {
+                "session_id": s["session_id"],
+                "user_agent": s.get("user_agent"),
+                "ip_address": s.get("ip_address"),
+                "created_at": s["created_at"],
+                "last_seen": s["last_seen"],
+                "expires_at": s["expires_at"],
+                "current": s["session_id"] == current_sid,
+            }
+            for s in sessions
+        ]
+
     # -----------------------
     # Logout / Revocation
     # -----------------------
     @staticmethod
     async def logout_current_device(refresh_token: str) -> bool:
-        return bool(await refreshed_token_crud.revoke_token(refresh_token))
+        revoked = await refreshed_token_crud.revoke_token(refresh_token)
+        if revoked and (payload := TokenManager._claims(refresh_token)):
+            await token_revocations.revoke([payload])
+            if payload.get("sid"):
+                await session_index.remove(payload["sub"], payload["sid"])
+        return revoked
 
     @staticmethod
-    async def logout_all_other_devices(user: User, current_refresh_token: str) -> int:
-        tokens = await refreshed_token_crud.get_user_tokens(str(user.id))
-        return await TokenManager._revoke_tokens(tokens, exclude=current_refresh_token)
+    async def logout_all_other_devices(user: AuthenticatedUser, current_refresh_token: str) -> int:
+        """
+        One ``update_many`` in Mongo and one script call in Redis, however
+        many devices there are. The current token must be the caller's own
+        valid refresh token, otherwise nothing would identify the session to keep.
+        """
+        payload = TokenManager._claims(current_refresh_token)
+        if not payload or payload.get("sub") != str(user.id):
+            raise Exceptions.permission_denied("Invalid refresh token")
+        revoked = await refreshed_token_crud.revoke_user_tokens(str(user.id), except_token=current_refresh_token)
+        await session_index.revoke_others(str(user.id), payload.get("sid"))
+        return revoked
 
     @staticmethod
     async def logout_all_devices(user_id: str) -> int:
-        return await refreshed_token_crud.revoke_user_tokens(user_id=user_id)
+        revoked = await refreshed_token_crud.revoke_user_tokens(user_id=user_id)
+        await session_index.revoke_all(user_id)
+        return revoked
 
     # -----------------------
     # Cleanup
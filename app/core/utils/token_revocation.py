@@ -0,0 +1,62 @@
+import logging
+import time
+from typing import Any, Dict, Iterable
+
+from app.core.utils.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocations:
+    """
+    Redis fast path for refresh-token revocation.
+
+    A revoked ``jti`` is kept as its own key until the token would have
+    expired anyway, and "revoke everything" is a per-user timestamp
+    (written by ``SessionIndex.revoke_all``) covering every token issued
+    before it, so one ``MGET`` answers whether a token is revoked. MongoDB
+    stays authoritative: rotation still consumes the token with a
+    conditional update, this only rejects known-revoked tokens without that
+    round trip. Without Redis every check says "not
+    revoked" and Mongo decides.
+    """
+
+    @staticmethod
+    def jti_key(jti: str) -> str:
+        return f"rt:revoked:{jti}"
+
+    @staticmethod
+    def user_key(user_id: Any) -> str:
+        return f"rt:revoked_before:{user_id}"
+
+    @staticmethod
+    def _ttl(exp: Any) -> int:
+        return max(1, int(exp) - int(time.time())) if exp else 1
+
+    async def revoke(self, claims: Iterable[Dict[str, Any]]) -> None:
+        """Mark tokens revoked from their ``jti`` / ``exp`` claims."""
+        if not redis_client.available:
+            return
+        try:
+            async with redis_client.client.pipeline(transaction=False) as pipe:
+                for claim in claims:
+                    pipe.set(self.jti_key(claim["jti"]), 1, ex=self._ttl(claim.get("exp")))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Token revocation: Redis write failed: {e}")
+
+    async def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        """Whether a verified refresh-token payload is known to be revoked."""
+        if not redis_client.available:
+            return False
+        try:
+            revoked, revoked_before = await redis_client.client.mget(
+                self.jti_key(payload.get("jti", "")), self.user_key(payload["sub"])
+            )
+        except Exception as e:
+            logger.warning(f"Token revocation: Redis read failed: {e}")
+            return False
+        return bool(revoked) or (revoked_before is not None and int(payload.get("iat", 0)) < int(revoked_before))
+
+
+token_revocations = TokenRevocations()
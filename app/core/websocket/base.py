@@ -1,25 +1,153 @@
-from typing import Dict, Set
-from fastapi import WebSocket
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Set, Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
 from beanie import PydanticObjectId
 
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# "Try again later": sent when a room or the process is full.
+WS_CLOSE_OVERLOADED = 1013
+# Policy violation: sent to connections reaped for missing heartbeats.
+WS_CLOSE_IDLE = 1008
+
 
 class ConnectionManager:
+    """
+    Per-process registry of WebSocket connections grouped by room.
+
+    - Rooms are removed as soon as their last socket leaves.
+    - A heartbeat task pings every socket and reaps those idle for longer
+      than ``WS_IDLE_TIMEOUT_SECONDS``. Endpoints read through ``receive``,
+      which counts every inbound frame (pongs included) as activity.
+    - ``connect`` enforces per-room and per-process caps.
+    """
+
     def __init__(self):
         self.active: Dict[PydanticObjectId, Set[WebSocket]] = {}
+        self.last_seen: Dict[WebSocket, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # ----------------- CONNECTIONS -----------------
+
+    @property
+    def total(self) -> int:
+        return len(self.last_seen)
+
+    async def connect(self, obj_id: PydanticObjectId, ws: WebSocket) -> bool:
+        """Accept and register a socket. Returns False (and closes it) when over capacity."""
+        room = self.active.get(obj_id, set())
+        if self.total >= settings.WS_MAX_CONNECTIONS or len(room) >= settings.WS_MAX_CONNECTIONS_PER_ROOM:
+            await ws.close(code=WS_CLOSE_OVERLOADED)
+            return False
 
-    async def connect(self, obj_id: PydanticObjectId, ws: WebSocket):
         await ws.accept()
         self.active.setdefault(obj_id, set()).add(ws)
+        self.last_seen[ws] = time.monotonic()
+        return True
 
     def disconnect(self, obj_id: PydanticObjectId, ws: WebSocket):
-        self.active.get(obj_id, set()).discard(ws)
+        room = self.active.get(obj_id)
+        if room is not None:
+            room.discard(ws)
+            if not room:
+                del self.active[obj_id]
+        self.last_seen.pop(ws, None)
+
+    def touch(self, ws: WebSocket):
+        """Record inbound activity (pong or any message) for a socket."""
+        if ws in self.last_seen:
+            self.last_seen[ws] = time.monotonic()
+
+    async def receive(self, obj_id: PydanticObjectId, ws: WebSocket) -> AsyncIterator[Any]:
+        """
+        Yield a socket's inbound JSON messages until it closes, then
+        unregister it. Pongs are consumed here; frames that are not JSON
+        still count as activity but are skipped.
+        """
+        try:
+            while True:
+                text = await ws.receive_text()
+                self.touch(ws)
+                try:
+                    message = json.loads(text)
+                except ValueError:
+                    continue
+                if isinstance(message, dict) and message.get("type") == "pong":
+                    continue
+                yield message
+        except (WebSocketDisconnect, RuntimeError):
+            # RuntimeError: the socket was already closed (e.g. reaped) under us.
+            pass
+        finally:
+            self.disconnect(obj_id, ws)
+
+    async def _send(self, obj_id: PydanticObjectId, ws: WebSocket, data: dict):
+        try:
+            await asyncio.wait_for(ws.send_json(data), settings.WS_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            self.disconnect(obj_id, ws)
 
     async def broadcast(self, obj_id: PydanticObjectId, data: dict):
-        for ws in list(self.active.get(obj_id, [])):
+        sockets = list(self.active.get(obj_id, ()))
+        if sockets:
+            await asyncio.gather(*(self._send(obj_id, ws, data) for ws in sockets))
+
+    # ----------------- HEARTBEATS -----------------
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._heartbeat())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
             try:
-                await ws.send_json(data)
-            except:
-                self.disconnect(obj_id, ws)
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(settings.WS_HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                await self.reap_idle()
+                for obj_id in list(self.active):
+                    await self.broadcast(obj_id, {"type": "ping"})
+            except Exception as e:
+                logger.error(f"WebSocket heartbeat failed: {e}")
+
+    async def reap_idle(self) -> int:
+        """Close and forget sockets that have not been heard from within the idle timeout."""
+        deadline = time.monotonic() - settings.WS_IDLE_TIMEOUT_SECONDS
+        reaped = 0
+        for obj_id, room in list(self.active.items()):
+            for ws in list(room):
+                if self.last_seen.get(ws, 0) < deadline:
+                    self.disconnect(obj_id, ws)
+                    reaped += 1
+                    try:
+                        await ws.close(code=WS_CLOSE_IDLE)
+                    except Exception:
+                        pass
+        if reaped:
+            logger.info(f"Reaped {reaped} idle WebSocket connection(s)")
+        return reaped
+
+    # ----------------- GAUGES -----------------
+
+    def gauges(self) -> dict:
+        return {
+            "connections": self.total,
+            "rooms": len(self.active),
+            "per_room": {str(obj_id): len(room) for obj_id, room in self.active.items()},
+        }
 
 
 manager = ConnectionManager()
@@ -0,0 +1,66 @@
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+from beanie import PydanticObjectId
+
+from app.core.utils.redis_client import redis_client
+from app.core.websocket.base import manager
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastBus:
+    """
+    Cross-worker fan-out for WebSocket messages.
+
+    Messages are published on a Redis channel per room; every worker runs a
+    listener that relays them to its own local ``ConnectionManager``. Without
+    Redis the bus degrades to a direct in-process broadcast.
+    """
+
+    PREFIX = "broadcast:"
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, room_id: Any, data: dict) -> None:
+        if not redis_client.available:
+            await manager.broadcast(PydanticObjectId(room_id), data)
+            return
+        await redis_client.client.publish(f"{self.PREFIX}{room_id}", json.dumps(data, default=str))
+
+    # ----------------- LISTENER -----------------
+
+    async def start(self) -> None:
+        if self._task or not redis_client.available:
+            return
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        pubsub = redis_client.client.pubsub()
+        await pubsub.psubscribe(f"{self.PREFIX}*")
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                room_id = message["channel"][len(self.PREFIX):]
+                try:
+                    await manager.broadcast(PydanticObjectId(room_id), json.loads(message["data"]))
+                except Exception as e:
+                    logger.warning(f"Dropped broadcast for room {room_id}: {e}")
+        finally:
+            await pubsub.aclose()
+
+
+broadcast_bus = BroadcastBus()
@@ -0,0 +1,150 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from beanie import Document, PydanticObjectId
+
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Per-model read-through cache settings (passed to ``CrudBase``)."""
+    ttl_seconds: float = 60
+    max_entries: int = 10_000
+    # Unique field the cache is keyed by ("_id", or e.g. "zawiya_id" for one-per-zawiya docs).
+    field: str = "_id"
+    # Also keep entries in Redis so other workers can skip Mongo (needs CRUD_CACHE_REDIS).
+    redis: bool = False
+
+
+class DocumentCache:
+    """
+    Bounded LRU + TTL cache of documents by a unique key (``_id`` by default),
+    optionally backed by Redis.
+
+    Lookups return deep copies so callers can mutate what they get without
+    corrupting the cache. Entries are dropped by CrudBase writes on the same
+    model; writes made elsewhere (another worker, ``doc.save()``) are only
+    bounded by the TTL, so keep it short for security-relevant models.
+    """
+
+    instances: List["DocumentCache"] = []
+
+    def __init__(self, model: Type[Document], config: CacheConfig):
+        self.model = model
+        self.config = config
+        self.name = model.__name__
+        self.field = config.field
+        # Keys are stringified so ObjectId and str lookups hit the same entry.
+        self._entries: "OrderedDict[str, Tuple[float, Document]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        DocumentCache.instances.append(self)
+
+    @property
+    def _use_redis(self) -> bool:
+        return self.config.redis and settings.CRUD_CACHE_REDIS and redis_client.available
+
+    def _key(self, key) -> str:
+        return f"crud:{self.name}:{self.field}:{key}"
+
+    def key_of(self, doc: Document) -> Any:
+        return doc.id if self.field == "_id" else getattr(doc, self.field)
+
+    def key_from(self, obj_id: Optional[PydanticObjectId], query: Dict[str, Any]) -> Optional[Any]:
+        """Cache key touched by a write, or None when it cannot be told from the id/filter."""
+        if self.field == "_id" and obj_id is not None:
+            return obj_id
+        key = query.get(self.field)
+        return None if key is None or isinstance(key, dict) else key
+
+    # --------------------- Reads ---------------------
+    async def get(self, key: Any) -> Optional[Document]:
+        key = str(key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, doc = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return doc.model_copy(deep=True)
+            del self._entries[key]
+
+        if self._use_redis:
+            try:
+                payload = await redis_client.client.get(self._key(key))
+            except Exception as e:
+                logger.warning(f"{self.name} cache: Redis read failed: {e}")
+                payload = None
+            if payload:
+                doc = self.model.model_validate_json(payload)
+                self._store(doc)
+                self.hits += 1
+                return doc.model_copy(deep=True)
+
+        self.misses += 1
+        return None
+
+    # --------------------- Writes ---------------------
+    def _store(self, doc: Document) -> None:
+        key = str(self.key_of(doc))
+        self._entries[key] = (time.monotonic() + self.config.ttl_seconds, doc.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def set(self, doc: Document) -> None:
+        self._store(doc)
+        if self._use_redis:
+            try:
+                await redis_client.client.set(
+                    self._key(self.key_of(doc)),
+                    doc.model_dump_json(by_alias=True),
+                    ex=max(1, int(self.config.ttl_seconds)),
+                )
+            except Exception as e:
+                logger.warning(f"{self.name} cache: Redis write failed: {e}")
+
+    async def invalidate(self, key: Optional[Any] = None) -> None:
+        """Drop one key, or everything when the written keys are unknown."""
+        if key is None:
+            self._entries.clear()
+            if self._use_redis:
+                try:
+                    keys = [k async for k in redis_client.client.scan_iter(match=self._key("*"), count=500)]
+                    if keys:
+                        await redis_client.client.delete(*keys)
+                except Exception as e:
+                    logger.warning(f"{self.name} cache: Redis invalidation failed: {e}")
+            return
+
+        key = str(key)
+        self._entries.pop(key, None)
+        if self._use_redis:
+            try:
+                await redis_client.client.delete(self._key(key))
+            except Exception as e:
+                logger.warning(f"{self.name} cache: Redis invalidation failed: {e}")
+
+    # --------------------- Stats ---------------------
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        return {cache.name: cache.stats() for cache in cls.instances}
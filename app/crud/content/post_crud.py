@@ -8,7 +8,7 @@ from app.models import ZawiyaPost, GroupPost, VisibilityStatus
 class ZawiyaPostCrud(CrudBase[ZawiyaPost]):
     """ Zawiya Post Crud Management """
     def __init__(self):
-        super().__init__(ZawiyaPost)
+        super().__init__(ZawiyaPost, read_secondary=True)
 
     async def feed_for_you(self, page: int = 1, per_page: int = 20):
         """ For You feed with live boost, engagement, media richness, and recency."""
@@ -74,7 +74,7 @@ class ZawiyaPostCrud(CrudBase[ZawiyaPost]):
 class GroupPostCrud(CrudBase[GroupPost]):
     """ Group Crud Management """
     def __init__(self):
-        super().__init__(GroupPost)
+        super().__init__(GroupPost, read_secondary=True)
 
     async def feed_by_group(
         self,
@@ -1,16 +1,66 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar, Generic, Union
 from beanie import Document, SortDirection, PydanticObjectId
+from beanie.odm.utils.encoder import Encoder
+from beanie.odm.utils.projection import get_projection
 from bson import ObjectId
+from pydantic import BaseModel
+from pymongo import InsertOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
 from pymongo.results import InsertManyResult
 
+from app.core.utils.database import mongodb
+from app.core.utils.settings import settings
+from app.crud.cache import CacheConfig, DocumentCache
+from app.crud.dataloader import _loaders, loader_for
+
 ModelType = TypeVar("ModelType", bound=Document)
+ProjectionType = Optional[Type[BaseModel]]
+# Read projection: a read model (validated) or a list of field names (raw dicts).
+ReadProjection = Optional[Union[Type[BaseModel], List[str]]]
+
+
+@dataclass
+class BulkResult:
+    """Totals of a ``CrudBase.bulk_write`` plus per-op errors (index into the submitted ops)."""
+    inserted: int = 0
+    matched: int = 0
+    modified: int = 0
+    upserted: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add(self, details: Dict[str, Any], offset: int = 0) -> None:
+        self.inserted += details.get("nInserted", 0)
+        self.matched += details.get("nMatched", 0)
+        self.modified += details.get("nModified", 0)
+        self.upserted += details.get("nUpserted", 0)
+        for error in details.get("writeErrors", []):
+            self.errors.append({
+                "index": error["index"] + offset,
+                "code": error.get("code"),
+                "message": error.get("errmsg"),
+            })
 
 
 class CrudBase(Generic[ModelType]):
     """Reusable CRUD base for Beanie models with pagination, sorting, and filters."""
 
-    def __init__(self, model: Type[ModelType]):
+    def __init__(
+        self,
+        model: Type[ModelType],
+        cache: Optional[CacheConfig] = None,
+        read_secondary: bool = False,
+    ):
         self.model = model
+        # Opt-in read-through cache for get/load by id (see CacheConfig).
+        self.cache = DocumentCache(model, cache) if cache and settings.CRUD_CACHE_ENABLED else None
+        # Default routing of list reads (get_multi/count/paginate/aggregate) to
+        # secondaries when MONGO_SECONDARY_READS is on. Reads by id and all
+        # writes always use the primary.
+        self.read_secondary = read_secondary
 
     # ---------- HELPERS ----------
 
@@ -47,6 +97,134 @@ class CrudBase(Generic[ModelType]):
             return obj_id
         return PydanticObjectId(ObjectId(str(obj_id)))
 
+    @staticmethod
+    def _projection_spec(projection: ReadProjection) -> Optional[Dict[str, int]]:
+        if projection is None:
+            return None
+        if isinstance(projection, (list, tuple)):
+            return {field: 1 for field in projection}
+        return get_projection(projection)
+
+    @staticmethod
+    def _load(raw_doc: Optional[Dict[str, Any]], projection: ReadProjection, raw: bool):
+        """Validate into the projection model unless raw dicts were asked for."""
+        if raw_doc is None or raw or isinstance(projection, (list, tuple)):
+            return raw_doc
+        return projection.model_validate(raw_doc)
+
+    async def _remember(self, doc) -> None:
+        """Keep the request's DataLoader and the cache in step with a freshly written document."""
+        if not isinstance(doc, self.model):
+            return
+        loader = loader_for(self.model)
+        if loader:
+            loader.prime(doc)
+        if self.cache:
+            await self.cache.set(doc)
+
+    async def _forget(self, obj_id: Any = None, query: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Drop a written document from the request's DataLoader and the cache.
+        When the id / cache key cannot be told from ``obj_id`` or the write
+        filter, everything memoized for the model goes.
+        """
+        obj_id = self._normalize_user_id(obj_id) if obj_id is not None else None
+        loaders = _loaders.get()
+        if loaders and self.model in loaders:
+            if obj_id is None:
+                del loaders[self.model]
+            else:
+                loaders[self.model].clear(obj_id)
+        if self.cache:
+            await self.cache.invalidate(self.cache.key_from(obj_id, query or {}))
+
+    @staticmethod
+    def _target_id(query: Dict[str, Any]) -> Optional[Any]:
+        """The single ``_id`` a filter pins down, if any."""
+        obj_id = query.get("_id")
+        return None if isinstance(obj_id, dict) else obj_id
+
+    async def invalidate(self, obj_id: Any) -> None:
+        """Drop a document written outside this CRUD (e.g. ``doc.save()``) from cache."""
+        await self._forget(obj_id)
+
+    def _collection(self, secondary: bool = False):
+        """Underlying driver collection (Beanie 2 name first, Beanie 1 fallback)."""
+        getter = getattr(self.model, "get_pymongo_collection", None) or self.model.get_motor_collection
+        collection = getter()
+        if secondary and (read_preference := mongodb.secondary_reads):
+            collection = collection.with_options(read_preference=read_preference)
+        return collection
+
+    def _secondary(self, secondary: Optional[bool]) -> bool:
+        """Whether a list read goes to a secondary (per-call override, else the CRUD default)."""
+        routed = self.read_secondary if secondary is None else secondary
+        return routed and mongodb.secondary_reads is not None
+
+    def _has_field(self, name: str) -> bool:
+        return name in self.model.model_fields
+
+    def _set(self, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Encode a partial update for ``$set``.
+        Server-side writes bypass Beanie's before_event hooks, so ``updated_at``
+        is stamped here instead.
+        """
+        data = dict(update_data)
+        if self._has_field("updated_at"):
+            data.setdefault("updated_at", datetime.now(timezone.utc))
+        return Encoder(to_db=True).encode(data)
+
+    def _insert_defaults(self, filters: Dict[str, Any], exclude: set) -> Dict[str, Any]:
+        """
+        Field defaults for ``$setOnInsert`` during a native upsert.
+        Equality filters and fields written by other operators are left out
+        (MongoDB copies the former and would reject the latter as conflicts).
+        """
+        seed = {k: v for k, v in filters.items() if not k.startswith("$") and not isinstance(v, dict)}
+        doc = self.model.model_construct(**seed)
+        data = Encoder(to_db=True).encode(doc.model_dump(by_alias=True, exclude={"id", "revision_id"}))
+        return {k: v for k, v in data.items() if k not in exclude and k not in seed and k != "_id"}
+
+    def _upsert_update(self, query: Dict[str, Any], update_data: Dict[str, Any]) -> Dict[str, Any]:
+        set_data = self._set(update_data)
+        update: Dict[str, Any] = {"$set": set_data} if set_data else {}
+        if defaults := self._insert_defaults(query, exclude=set(set_data)):
+            update["$setOnInsert"] = defaults
+        return update
+
+    def _inc_update(self, query: Dict[str, Any], amounts: Dict[str, int], upsert: bool) -> Dict[str, Any]:
+        update: Dict[str, Any] = {"$inc": amounts}
+        if self._has_field("updated_at"):
+            update["$set"] = {"updated_at": datetime.now(timezone.utc)}
+        if upsert:
+            update["$setOnInsert"] = self._insert_defaults(query, exclude=set(amounts) | {"updated_at"})
+        return update
+
+    async def _find_one_and_update(
+        self,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        projection: ProjectionType = None,
+        upsert: bool = False,
+    ):
+        """Single round trip update returning the new document (or ``projection``)."""
+        raw = await self._collection().find_one_and_update(
+            query,
+            update,
+            projection=get_projection(projection) if projection else None,
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER,
+        )
+        if raw is None:
+            return None
+        doc = (projection or self.model).model_validate(raw)
+        if projection is None:
+            await self._remember(doc)
+        else:
+            await self._forget(raw["_id"], query)
+        return doc
+
     # ---------- CREATE ----------
 
     async def create(self, **kwargs: Any) -> ModelType:
@@ -61,13 +239,73 @@ class CrudBase(Generic[ModelType]):
 
     # ---------- READ ----------
 
-    async def get(self, obj_id: Any) -> Optional[ModelType]:
-        """Get document by ID."""
-        return await self.model.get(obj_id)
-
-    async def get_one(self, filters: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[ModelType]:
-        """Find one document by filters."""
-        return await self.model.find_one(self._filters(filters, **kwargs))
+    async def get(self, obj_id: Any, projection: ReadProjection = None, raw: bool = False):
+        """
+        Get document by ID.
+        ``projection`` may be a read model or a list of field names (returns a
+        dict); ``raw=True`` returns the stored dict without validation.
+        """
+        if projection is None and not raw:
+            if self.cache is None or self.cache.field != "_id":
+                return await self.model.get(obj_id)
+            obj_id = self._normalize_user_id(obj_id)
+            doc = await self.cache.get(obj_id)
+            if doc is None:
+                doc = await self.model.get(obj_id)
+                if doc is not None:
+                    await self.cache.set(doc)
+            return doc
+        return await self.get_one({"_id": self._normalize_user_id(obj_id)}, projection=projection, raw=raw)
+
+    async def load(self, obj_id: Any) -> Optional[ModelType]:
+        """
+        ``get`` through the request-scoped DataLoader: lookups issued in the
+        same tick share one ``$in`` query and results are memoized for the
+        request. Falls back to ``get`` outside a request.
+        """
+        loader = loader_for(self.model)
+        if loader is None:
+            return await self.get(obj_id)
+        obj_id = self._normalize_user_id(obj_id)
+        cache = self.cache if self.cache and self.cache.field == "_id" else None
+        if cache and (doc := await cache.get(obj_id)) is not None:
+            return doc
+        doc = await loader.load(obj_id)
+        if doc is not None and cache:
+            await self.cache.set(doc)
+        return doc
+
+    async def load_many(self, obj_ids: List[Any]) -> List[Optional[ModelType]]:
+        return list(await asyncio.gather(*(self.load(i) for i in obj_ids)))
+
+    async def get_cached(self, key: Any) -> Optional[ModelType]:
+        """
+        Read-through lookup by the cache key field (``CacheConfig.field``).
+        Without a cache this is a plain ``find_one`` on that field.
+        """
+        field = self.cache.field if self.cache else "_id"
+        if field == "_id":
+            return await self.get(key)
+        doc = await self.cache.get(key)
+        if doc is None:
+            doc = await self.model.find_one({field: key})
+            if doc is not None:
+                await self.cache.set(doc)
+        return doc
+
+    async def get_one(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: ReadProjection = None,
+        raw: bool = False,
+        **kwargs
+    ):
+        """Find one document by filters (see ``get`` for ``projection`` / ``raw``)."""
+        query = self._filters(filters, **kwargs)
+        if projection is None and not raw:
+            return await self.model.find_one(query)
+        doc = await self._collection().find_one(query, self._projection_spec(projection))
+        return self._load(doc, projection, raw)
 
     async def exists_by_id(self, obj_id):
         """ Check existence of a document by id """
@@ -79,58 +317,186 @@ class CrudBase(Generic[ModelType]):
         order_by: Optional[Union[str, tuple[str, SortDirection], list[tuple[str, SortDirection]]]] = None,
         skip: int = 0,
         limit: int = 100,
+        projection: ReadProjection = None,
+        raw: bool = False,
+        secondary: Optional[bool] = None,
         **kwargs
-    ) -> List[ModelType]:
-        query = self.model.find(self._filters(filters, **kwargs))
+    ) -> List[Any]:
+        sort = self._sort(order_by)
+        routed = self._secondary(secondary)
+
+        if projection is not None or raw or routed:
+            cursor = self._collection(routed).find(
+                self._filters(filters, **kwargs), self._projection_spec(projection)
+            )
+            if sort:
+                cursor = cursor.sort(sort)
+            cursor = cursor.skip(skip).limit(limit)
+            return [self._load(doc, projection or self.model, raw) async for doc in cursor]
 
-        if sort := self._sort(order_by):
+        query = self.model.find(self._filters(filters, **kwargs))
+        if sort:
             query = query.sort(*sort)
 
         return await query.skip(skip).limit(limit).to_list()
 
-    async def count(self, filters: Optional[Dict[str, Any]] = None, **kwargs) -> int:
+    async def count(self, filters: Optional[Dict[str, Any]] = None, secondary: Optional[bool] = None, **kwargs) -> int:
+        if self._secondary(secondary):
+            return await self._collection(True).count_documents(self._filters(filters, **kwargs))
         return await self.model.find(self._filters(filters, **kwargs)).count()
 
     # ---------- UPDATE ----------
 
-    async def update(self, obj_id: Any, update_data: Dict[str, Any]) -> Optional[ModelType]:
-        """Update document by ID."""
-        obj = await self.model.get(obj_id)
-        if not obj:
-            return None
-        await obj.set(update_data)
-        return obj
+    async def update(
+        self,
+        obj_id: Any,
+        update_data: Dict[str, Any],
+        projection: ProjectionType = None,
+    ) -> Optional[ModelType]:
+        """Update document by ID and return the updated document (one round trip)."""
+        return await self._find_one_and_update(
+            {"_id": self._normalize_user_id(obj_id)},
+            {"$set": self._set(update_data)},
+            projection=projection,
+        )
 
     async def update_by_filter(
         self,
         filters: Optional[Dict[str, Any]] = None,
         update_data: Optional[Dict[str, Any]] = None,
+        projection: ProjectionType = None,
         **kwargs
     ) -> Optional[ModelType]:
-        """Find one document and update it."""
-        update_data = update_data or {}
-        obj = await self.model.find_one(self._filters(filters, **kwargs))
-        if not obj:
-            return None
-        await obj.set(update_data)
-        return obj
+        """Find one document and update it (one round trip)."""
+        return await self._find_one_and_update(
+            self._filters(filters, **kwargs),
+            {"$set": self._set(update_data or {})},
+            projection=projection,
+        )
+
+    async def update_one(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        update: Optional[Dict[str, Any]] = None,
+        upsert: bool = False,
+        **kwargs
+    ) -> int:
+        """Apply raw update operators to one document without reading it back. Returns matched count."""
+        query = self._filters(filters, **kwargs)
+        result = await self._collection().update_one(query, update or {}, upsert=upsert)
+        await self._forget(self._target_id(query), query)
+        return result.matched_count or (1 if result.upserted_id is not None else 0)
+
+    async def update_many(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        update_data: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> int:
+        """``$set`` fields on every matching document. Returns modified count."""
+        query = self._filters(filters, **kwargs)
+        result = await self._collection().update_many(query, {"$set": self._set(update_data or {})})
+        await self._forget(self._target_id(query), query)
+        return result.modified_count
+
+    async def increment_by_filter(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        amounts: Optional[Dict[str, int]] = None,
+        upsert: bool = False,
+        projection: ProjectionType = None,
+        **kwargs
+    ) -> Optional[ModelType]:
+        """Atomically ``$inc`` counters, optionally creating the document, and return it."""
+        merged = self._filters(filters, **kwargs)
+        return await self._find_one_and_update(
+            merged, self._inc_update(merged, amounts or {}, upsert), projection=projection, upsert=upsert
+        )
+
     # ---------- DELETE ----------
 
     async def delete(self, obj_id: Any) -> bool:
         """Delete document by ID."""
-        obj = await self.model.get(obj_id)
-        if obj:
-            await obj.delete()
-            return True
-        return False
+        result = await self._collection().delete_one({"_id": self._normalize_user_id(obj_id)})
+        await self._forget(obj_id)
+        return result.deleted_count > 0
 
     async def delete_by_filter(self, filters: Optional[Dict[str, Any]] = None, **kwargs) -> bool:
         """Delete a single document by filter."""
-        obj = await self.model.find_one(self._filters(filters, **kwargs))
-        if obj:
-            await obj.delete()
-            return True
-        return False
+        query = self._filters(filters, **kwargs)
+        result = await self._collection().delete_one(query)
+        await self._forget(self._target_id(query), query)
+        return result.deleted_count > 0
+
+    async def delete_in_batches(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        max_batches: Optional[int] = None,
+        **kwargs
+    ) -> int:
+        """
+        ``delete_many`` in bounded batches of ``_id`` (for purges over large
+        collections): each round trip removes at most ``batch_size``
+        documents, with a pause in between so the purge does not monopolize
+        the primary. Returns the number of deleted documents.
+        """
+        query = self._filters(filters, **kwargs)
+        batch_size = batch_size or settings.CRUD_DELETE_BATCH_SIZE
+        pause = settings.CRUD_DELETE_BATCH_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+        collection = self._collection()
+        deleted = batches = 0
+        while max_batches is None or batches < max_batches:
+            ids = [doc["_id"] async for doc in collection.find(query, {"_id": 1}).limit(batch_size)]
+            if not ids:
+                break
+            deleted += (await collection.delete_many({"_id": {"$in": ids}})).deleted_count
+            batches += 1
+            if len(ids) < batch_size:
+                break
+            await asyncio.sleep(pause)
+        if deleted:
+            await self._forget()
+        return deleted
+
+    async def update_in_batches(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        update_data: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        max_batches: Optional[int] = None,
+        **kwargs
+    ) -> int:
+        """
+        ``update_many`` (``$set``) in bounded batches keyed by ``_id``, with
+        the same batch size and pause as ``delete_in_batches``. Each batch
+        resumes after the last ``_id`` of the previous one, so it terminates
+        whether or not the update removes documents from ``filters``.
+        Returns the number of modified documents.
+        """
+        query = self._filters(filters, **kwargs)
+        batch_size = batch_size or settings.CRUD_DELETE_BATCH_SIZE
+        pause = settings.CRUD_DELETE_BATCH_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+        update = {"$set": self._set(update_data or {})}
+        collection = self._collection()
+        modified = batches = 0
+        last_id = None
+        while max_batches is None or batches < max_batches:
+            page = query if last_id is None else {"$and": [query, {"_id": {"$gt": last_id}}]}
+            ids = [doc["_id"] async for doc in collection.find(page, {"_id": 1}).sort("_id", 1).limit(batch_size)]
+            if not ids:
+                break
+            modified += (await collection.update_many({"_id": {"$in": ids}}, update)).modified_count
+            batches += 1
+            last_id = ids[-1]
+            if len(ids) < batch_size:
+                break
+            await asyncio.sleep(pause)
+        if modified:
+            await self._forget()
+        return modified
 
     # ---------- UPSERT ----------
 
@@ -138,19 +504,124 @@ class CrudBase(Generic[ModelType]):
         self,
         filters: Optional[Dict[str, Any]] = None,
         update_data: Optional[Dict[str, Any]] = None,
+        projection: ProjectionType = None,
         **kwargs
     ) -> ModelType:
-        """Update or insert if not exists."""
-        update_data = update_data or {}
+        """Update or insert if not exists, atomically (native ``upsert=True``)."""
         merged = self._filters(filters, **kwargs)
-        existing = await self.model.find_one(merged)
-        if existing:
-            for k, v in update_data.items():
-                setattr(existing, k, v)
-            await existing.save()
-            return existing
-        new_doc = self.model(**{**merged, **update_data})
-        return await new_doc.insert()
+        return await self._find_one_and_update(
+            merged, self._upsert_update(merged, update_data or {}), projection=projection, upsert=True
+        )
+
+    # ---------- BULK WRITE ----------
+
+    def insert_op(self, **fields: Any) -> InsertOne:
+        """Validated insert for ``bulk_write``."""
+        data = Encoder(to_db=True).encode(self.model(**fields).model_dump(by_alias=True, exclude={"revision_id"}))
+        if data.get("_id") is None:
+            data.pop("_id", None)
+        return InsertOne(data)
+
+    def update_op(self, filters: Dict[str, Any], update_data: Dict[str, Any], many: bool = False):
+        """``$set`` update for ``bulk_write`` (``many=True`` for every match)."""
+        op = UpdateMany if many else UpdateOne
+        return op(self._filters(filters), {"$set": self._set(update_data)})
+
+    def upsert_op(self, filters: Dict[str, Any], update_data: Dict[str, Any]) -> UpdateOne:
+        """Native upsert for ``bulk_write`` (same semantics as ``upsert``)."""
+        query = self._filters(filters)
+        return UpdateOne(query, self._upsert_update(query, update_data), upsert=True)
+
+    def increment_op(self, filters: Dict[str, Any], amounts: Dict[str, int], upsert: bool = False) -> UpdateOne:
+        """``$inc`` update for ``bulk_write`` (same semantics as ``increment_by_filter``)."""
+        query = self._filters(filters)
+        return UpdateOne(query, self._inc_update(query, amounts, upsert), upsert=upsert)
+
+    async def bulk_write(
+        self,
+        ops: List[Union[InsertOne, UpdateOne, UpdateMany]],
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> BulkResult:
+        """
+        Run insert / update / upsert ops (see the ``*_op`` builders) with
+        ``ordered=False``, ``chunk_size`` ops per round trip and at most
+        ``concurrency`` chunks in flight. A failing op does not stop the
+        others; its error is reported in ``BulkResult.errors`` with its index
+        in ``ops``.
+        """
+        chunk_size = chunk_size or settings.CRUD_BULK_CHUNK_SIZE
+        sem = asyncio.Semaphore(concurrency or settings.CRUD_BULK_CONCURRENCY)
+        result = BulkResult()
+
+        async def _run(offset: int, chunk: list):
+            async with sem:
+                try:
+                    res = await self._collection().bulk_write(chunk, ordered=False)
+                    details = res.bulk_api_result
+                except BulkWriteError as e:
+                    details = e.details
+            result.add(details, offset)
+
+        await asyncio.gather(*(
+            _run(i, ops[i:i + chunk_size]) for i in range(0, len(ops), chunk_size)
+        ))
+        if ops:
+            await self._forget()
+        return result
+
+    # ---------- STREAMING ----------
+
+    async def iter_batches(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500,
+        projection: ReadProjection = None,
+        raw: bool = False,
+        after: Optional[Any] = None,
+        **kwargs
+    ) -> AsyncIterator[Tuple[List[Any], PydanticObjectId]]:
+        """
+        Walk every matching document in ``_id`` order, ``batch_size`` at a time.
+
+        Yields ``(batch, checkpoint)``; each batch is its own keyset query
+        (``_id > checkpoint``), so memory stays bounded, no cursor is held
+        between batches and a job can resume by passing the last checkpoint
+        back as ``after``. ``projection`` / ``raw`` behave as in ``get_multi``.
+        """
+        query = self._filters(filters, **kwargs)
+        spec = self._projection_spec(projection)
+        last = self._normalize_user_id(after) if after is not None else None
+
+        while True:
+            page = query if last is None else {"$and": [query, {"_id": {"$gt": last}}]}
+            cursor = self._collection().find(page, spec).sort("_id", 1).limit(batch_size)
+            docs = [doc async for doc in cursor]
+            if not docs:
+                return
+
+            last = docs[-1]["_id"]
+            if projection is None and not raw:
+                yield [self.model.model_validate(doc) for doc in docs], last
+            else:
+                yield [self._load(doc, projection, raw) for doc in docs], last
+
+            if len(docs) < batch_size:
+                return
+
+    async def iterate(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500,
+        projection: ReadProjection = None,
+        raw: bool = False,
+        after: Optional[Any] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """Document-at-a-time view of ``iter_batches``."""
+        async for batch, _ in self.iter_batches(filters, batch_size, projection, raw, after, **kwargs):
+            for doc in batch:
+                yield doc
 
     # ---------- PAGINATION ----------
 
@@ -160,13 +631,14 @@ class CrudBase(Generic[ModelType]):
         per_page: int = 20,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[Union[str, List[str]]] = None,
+        secondary: Optional[bool] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Return paginated data with metadata."""
         page = max(page, 1)
-        total = await self.count(filters, **kwargs)
+        total = await self.count(filters, secondary=secondary, **kwargs)
         skip = (page - 1) * per_page
-        items = await self.get_multi(filters, order_by, skip, per_page, **kwargs)
+        items = await self.get_multi(filters, order_by, skip, per_page, secondary=secondary, **kwargs)
         total_pages = (total + per_page - 1) // per_page if total > 0 else 0
 
         return {
@@ -181,32 +653,31 @@ class CrudBase(Generic[ModelType]):
 
     # ---------- AGGREGATION ----------
 
-    async def aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def aggregate(self, pipeline: List[Dict[str, Any]], secondary: Optional[bool] = None) -> List[Dict[str, Any]]:
         """Run custom MongoDB aggregation pipeline."""
+        if self._secondary(secondary):
+            cursor = self._collection(True).aggregate(pipeline)
+            if inspect.isawaitable(cursor):  # PyMongo async API; Motor returns the cursor directly
+                cursor = await cursor
+            return [doc async for doc in cursor]
         return await self.model.aggregate(pipeline).to_list()
 
-    # ---------- BATCH ----------
-
-        # ------------------- SOFT DELETE -------------------
+    # ------------------- SOFT DELETE -------------------
 
     async def soft_delete(self, obj_id: Any) -> bool:
-        obj = await self.get(obj_id)
-        if not obj:
+        """Mark a SoftDeleteMixin document as deleted (one round trip)."""
+        if not self._has_field("is_deleted"):
             return False
-
-        if hasattr(obj, "soft_delete"):
-            await obj.soft_delete()
-            return True
-
-        return False
+        return bool(await self.update_one(
+            {"_id": self._normalize_user_id(obj_id), "is_deleted": False},
+            {"$set": self._set({"is_deleted": True, "deleted_at": datetime.now(timezone.utc)})},
+        ))
 
     async def restore(self, obj_id: Any) -> bool:
-        obj = await self.model.get(obj_id)
-        if not obj or not getattr(obj, "is_deleted", False):
+        """Undo a soft delete (one round trip)."""
+        if not self._has_field("is_deleted"):
             return False
-
-        if hasattr(obj, "restore"):
-            await obj.restore()
-            return True
-
-        return False
+        return bool(await self.update_one(
+            {"_id": self._normalize_user_id(obj_id), "is_deleted": True},
+            {"$set": self._set({"is_deleted": False, "deleted_at": None})},
+        ))
@@ -0,0 +1,101 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from beanie import Document, PydanticObjectId
+
+# Loaders of the current request, keyed by model. None outside a request scope.
+_loaders: ContextVar[Optional[Dict[Type[Document], "DataLoader"]]] = ContextVar("crud_loaders", default=None)
+
+
+class DataLoader:
+    """
+    Per-request batching loader for one model.
+
+    ``load`` calls made in the same event-loop tick are collected and fetched
+    with a single ``{"_id": {"$in": [...]}}`` query; every result (including
+    misses) is memoized for the rest of the request, so repeated lookups of the
+    same id cost nothing.
+    """
+
+    def __init__(self, model: Type[Document]):
+        self.model = model
+        self._cache: Dict[PydanticObjectId, asyncio.Future] = {}
+        self._queue: List[Tuple[PydanticObjectId, asyncio.Future]] = []
+
+    # --------------------- Loading ---------------------
+    async def load(self, obj_id: PydanticObjectId) -> Optional[Document]:
+        future = self._cache.get(obj_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._cache[obj_id] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append((obj_id, future))
+        return await asyncio.shield(future)
+
+    async def load_many(self, obj_ids: Iterable[PydanticObjectId]) -> List[Optional[Document]]:
+        return list(await asyncio.gather(*(self.load(i) for i in obj_ids)))
+
+    def _dispatch(self) -> None:
+        batch, self._queue = self._queue, []
+        asyncio.ensure_future(self._fetch(batch))
+
+    async def _fetch(self, batch: List[Tuple[PydanticObjectId, asyncio.Future]]) -> None:
+        try:
+            docs = await self.model.find({"_id": {"$in": [obj_id for obj_id, _ in batch]}}).to_list()
+        except Exception as e:
+            for obj_id, future in batch:
+                # Failed lookups are not memoized: the next load retries.
+                if self._cache.get(obj_id) is future:
+                    del self._cache[obj_id]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {doc.id: doc for doc in docs}
+        for obj_id, future in batch:
+            if not future.done():
+                future.set_result(found.get(obj_id))
+
+    # --------------------- Cache Control ---------------------
+    def prime(self, doc: Document) -> None:
+        """Store an already fetched / freshly written document."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(doc)
+        self._cache[doc.id] = future
+
+    def clear(self, obj_id: PydanticObjectId) -> None:
+        self._cache.pop(obj_id, None)
+
+
+def loader_for(model: Type[Document]) -> Optional[DataLoader]:
+    """The request's loader for ``model``, or None outside a request scope."""
+    loaders = _loaders.get()
+    if loaders is None:
+        return None
+    loader = loaders.get(model)
+    if loader is None:
+        loader = loaders[model] = DataLoader(model)
+    return loader
+
+
+class DataLoaderMiddleware:
+    """
+    ASGI middleware giving every HTTP request its own set of loaders.
+    WebSockets are left out on purpose: memoizing for a connection's
+    lifetime would serve stale documents.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        token = _loaders.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _loaders.reset(token)
@@ -1,10 +1,11 @@
 from app.crud import CrudBase
+from app.crud.cache import CacheConfig
 from app.models.group_models import Group
 
 
 class GroupCrud(CrudBase[Group]):
     """ Group Crud Management """
     def __init__(self):
-        super().__init__(Group)
+        super().__init__(Group, cache=CacheConfig(ttl_seconds=300, redis=True))
 
 group_crud = GroupCrud()
\ No newline at end of file
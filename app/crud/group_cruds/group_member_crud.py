@@ -10,9 +10,10 @@ class GroupMemberCrud(CrudBase[GroupMember]):
     def __init__(self):
         super().__init__(GroupMember)
 
-    async def get_member(self, group_id, user_id):
+    async def get_member(self, group_id, user_id, projection=None):
         return await self.get_one(
-            filters={"group_id": group_id, "user_id": user_id}
+            filters={"group_id": group_id, "user_id": user_id},
+            projection=projection,
         )
 
     async def add_member(
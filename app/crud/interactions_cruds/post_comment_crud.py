@@ -9,7 +9,7 @@ from app.models.interactions_models import PostComment
 class PostCommentCrud(CrudBase[PostComment]):
     """ PostComment Crud Management """
     def __init__(self):
-        super().__init__(PostComment)
+        super().__init__(PostComment, read_secondary=True)
 
     async def hot_comments(self, post_id: PydanticObjectId, limit: int = 20):
         pipeline = [
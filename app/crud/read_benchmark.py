@@ -0,0 +1,90 @@
+"""
+Cost of materializing CrudBase reads, per 1k documents.
+
+Compares the three read paths offered by ``CrudBase.get_one`` / ``get_multi``:
+full Beanie documents, a projection read model and raw dicts. Documents are
+synthesized in memory so only decoding/validation is measured, not I/O.
+Beanie is initialized against a client that never connects: indexes are
+skipped and the one ``buildInfo`` command is answered locally, which is all
+``model_validate`` needs.
+
+    python -m app.crud.read_benchmark [--docs 1000] [--rounds 20]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from statistics import median
+from typing import Callable, Dict, List
+
+from beanie import init_beanie
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.models import GroupMember, GroupMemberRole, GroupRole
+
+
+def _raw_members(n: int) -> List[Dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "_id": ObjectId(),
+            "group_id": ObjectId(),
+            "user_id": ObjectId(),
+            "group_role": GroupRole.MEMBER.value,
+            "can_post": bool(i % 2),
+            "can_stream": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+def _time_per_1k(fn: Callable[[Dict], object], docs: List[Dict], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        samples.append(time.perf_counter() - start)
+    return median(samples) / len(docs) * 1000 * 1000  # ms per 1k docs
+
+
+async def _init_models() -> None:
+    database = AsyncIOMotorClient("mongodb://localhost:27017", connect=False)["read_benchmark"]
+
+    async def build_info(*args, **kwargs) -> Dict:
+        # The only command init_beanie issues once indexes are skipped.
+        return {"version": "7.0.0"}
+
+    database.command = build_info
+    await init_beanie(database=database, document_models=[GroupMember], skip_indexes=True)
+
+
+def run(docs: int = 1000, rounds: int = 20) -> Dict[str, float]:
+    asyncio.run(_init_models())
+    raw = _raw_members(docs)
+    projected = [{"_id": d["_id"], "group_role": d["group_role"]} for d in raw]
+
+    return {
+        "document": _time_per_1k(GroupMember.model_validate, raw, rounds),
+        "projection": _time_per_1k(GroupMemberRole.model_validate, projected, rounds),
+        "raw": _time_per_1k(dict, projected, rounds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run(args.docs, args.rounds)
+    baseline = results["document"]
+    for name, ms in results.items():
+        print(f"{name:<12}{ms:8.3f} ms / 1k docs   ({baseline / ms if ms else 0:5.1f}x vs document)")
+
+
+if __name__ == "__main__":
+    main()
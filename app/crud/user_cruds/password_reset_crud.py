@@ -52,22 +52,15 @@ class PasswordResetCRUD(CrudBase[PasswordResetToken]):
 
         return record
 
-    async def cleanup_expired_tokens(self) -> int:
-        """Clean up expired tokens and return count of deleted tokens."""
-        current_time = datetime.now(timezone.utc)
-        expired_tokens = await self.get_multi(
-            filters={
-                "expires_at": {"$lt": current_time}
-            }
+    async def cleanup_expired_tokens(self, batch_size: Optional[int] = None) -> int:
+        """
+        Delete expired tokens in bounded batches and return the count.
+        The TTL index on ``expires_at`` normally gets there first.
+        """
+        return await self.delete_in_batches(
+            {"expires_at": {"$lt": datetime.now(timezone.utc)}}, batch_size=batch_size
         )
 
-        deleted_count = 0
-        for token in expired_tokens:
-            await self.delete(token.id)
-            deleted_count += 1
-
-        return deleted_count
-
     async def revoke_all_user_tokens(self, email: str) -> int:
         """Revoke all existing tokens for a user (when generating new one)."""
         active_tokens = await self.get_multi(
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Sequence
+import hashlib
 import logging
 
 from beanie import SortDirection
@@ -9,6 +10,11 @@ from app.models.user_models import RefreshedToken
 logger = logging.getLogger(__name__)
 
 
+def token_digest(refresh_token: str) -> str:
+    """SHA-256 hex digest a refresh token is stored and looked up by."""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
 class RefreshedTokenCrud(CrudBase[RefreshedToken]):
     """CRUD operations for managing refresh tokens using Beanie + CrudBase with revocation."""
 
@@ -22,15 +28,22 @@ class RefreshedTokenCrud(CrudBase[RefreshedToken]):
             self,
             user_id: str,
             refresh_token: str,
-            expires_at: datetime
+            jti: str,
+            expires_at: datetime,
+            session_id: Optional[str] = None,
+            user_agent: Optional[str] = None,
+            ip_address: Optional[str] = None,
     ) -> Optional[RefreshedToken]:
-        """Create and save a new refresh token with error handling."""
+        """Store a new refresh token (by digest) with error handling."""
         try:
             return await self.create(
-                user_id=user_id,
-                refresh_token=refresh_token,
+                user_id=self._normalize_user_id(user_id),
+                token_hash=token_digest(refresh_token),
+                jti=jti,
                 expires_at=expires_at,
-                created_at=datetime.now(timezone.utc),
+                session_id=session_id,
+                user_agent=user_agent,
+                ip_address=ip_address,
                 revoked=False,
             )
         except Exception as e:
@@ -46,10 +59,9 @@ class RefreshedTokenCrud(CrudBase[RefreshedToken]):
     ) -> Optional[RefreshedToken]:
         """Retrieve a valid, non-expired, non-revoked refresh token."""
         try:
-            now = datetime.now(timezone.utc)
             return await self.get_one(
-                refresh_token=refresh_token,
-                expires_at={"$gt": now},
+                token_hash=token_digest(refresh_token),
+                expires_at={"$gt": datetime.now(timezone.utc)},
                 revoked=False,
             )
         except Exception as e:
@@ -58,12 +70,16 @@ class RefreshedTokenCrud(CrudBase[RefreshedToken]):
 
     async def get_user_tokens(
             self,
-            user_id: str
+            user_id: str,
+            active_only: bool = False,
     ) -> Sequence[RefreshedToken]:
-        """Get all tokens for a user (newest first)."""
+        """Get the tokens of a user (newest first), optionally only unrevoked, unexpired ones."""
+        filters = {"user_id": self._normalize_user_id(user_id)}
+        if active_only:
+            filters.update(revoked=False, expires_at={"$gt": datetime.now(timezone.utc)})
         try:
             return await self.get_multi(
-                user_id=user_id,
+                filters=filters,
                 order_by=[("created_at", SortDirection.DESCENDING)]
             )
         except Exception as e:
@@ -71,56 +87,80 @@ class RefreshedTokenCrud(CrudBase[RefreshedToken]):
             return []
 
     # ------------------------
-    # Update (Revocation) - Production Optimized
+    # Update (Revocation)
     # ------------------------
-    async def revoke_token(self, refresh_token: str) -> Optional[RefreshedToken]:
-        """Mark a specific token as revoked instead of deleting."""
+    @staticmethod
+    def _revocation() -> dict:
+        return {"revoked": True, "revoked_at": datetime.now(timezone.utc)}
+
+    def _revoke_update(self) -> dict:
+        return {"$set": self._set(self._revocation())}
+
+    async def revoke_token(self, refresh_token: str) -> bool:
+        """Revoke one token by its digest (single conditional update)."""
         try:
-            token = await self.get_one(refresh_token=refresh_token)
-            if token:
-                token.revoked = True
-                token.revoked_at = datetime.now(timezone.utc)
-                await token.save()
-                logger.info(f"Token revoked: {refresh_token}")
-            return token
+            revoked = await self.update_one(
+                {"token_hash": token_digest(refresh_token), "revoked": False}, self._revoke_update()
+            )
+            return bool(revoked)
         except Exception as e:
-            logger.error(f"Error revoking token {refresh_token}: {str(e)}")
-            return None
+            logger.error(f"Error revoking token: {str(e)}")
+            return False
 
-    async def revoke_user_tokens(self, user_id: str) -> int:
+    async def consume_token(self, refresh_token: str) -> bool:
         """
-        Mark all active tokens of a user as revoked.
-        Uses MongoDB bulk update for optimal performance.
+        Revoke a token only if it is still valid, in one round trip. Used by
+        rotation: exactly one concurrent caller wins, replays get False.
         """
+        return bool(await self.update_one(
+            {
+                "token_hash": token_digest(refresh_token),
+                "revoked": False,
+                "expires_at": {"$gt": datetime.now(timezone.utc)},
+            },
+            self._revoke_update(),
+        ))
+
+    async def revoke_by_jti(self, jti: str) -> bool:
+        """Revoke one token by its ``jti`` claim."""
+        return bool(await self.update_one({"jti": jti, "revoked": False}, self._revoke_update()))
+
+    async def revoke_user_tokens(
+            self,
+            user_id: str,
+            jtis: Optional[Sequence[str]] = None,
+            except_token: Optional[str] = None,
+    ) -> int:
+        """
+        Revoke all active tokens of a user with a single ``update_many``:
+        only those in ``jtis`` if given, and never ``except_token``.
+        """
+        filters = {"user_id": self._normalize_user_id(user_id), "revoked": False}
+        if jtis is not None:
+            if not jtis:
+                return 0
+            filters["jti"] = {"$in": list(jtis)}
+        if except_token is not None:
+            filters["token_hash"] = {"$ne": token_digest(except_token)}
         try:
-            result = await self.model.find(
-                {"user_id": user_id, "revoked": False}
-            ).update_many(
-                {"$set": {
-                    "revoked": True,
-                    "revoked_at": datetime.now(timezone.utc)
-                }}
-            )
-            modified_count = result.modified_count if result else 0
+            modified_count = await self.update_many(filters, self._revocation())
             logger.info(f"Revoked {modified_count} tokens for user {user_id}")
             return modified_count
         except Exception as e:
             logger.error(f"Error revoking tokens for user {user_id}: {str(e)}")
             return 0
 
-    async def revoke_expired_tokens(self) -> int:
+    async def revoke_expired_tokens(self, batch_size: Optional[int] = None) -> int:
         """
-        Mark all expired tokens as revoked.
-        Uses MongoDB bulk update for optimal performance.
+        Mark all expired tokens as revoked, in bounded batches keyed by ``_id``.
         """
         try:
             now = datetime.now(timezone.utc)
-            result = await self.model.find(
-                {"expires_at": {"$lte": now}, "revoked": False}
-            ).update_many(
-                {"$set": {"revoked": True, "revoked_at": now}}
+            modified_count = await self.update_in_batches(
+                {"expires_at": {"$lte": now}, "revoked": False},
+                {"revoked": True, "revoked_at": now},
+                batch_size=batch_size,
             )
-            modified_count = result.modified_count if result else 0
             if modified_count > 0:
                 logger.info(f"Automatically revoked {modified_count} expired tokens")
             return modified_count
@@ -130,20 +170,19 @@ class RefreshedTokenCrud(CrudBase[RefreshedToken]):
 
     # ------------------------
     # Cleanup & Maintenance
+    # The TTL index on expires_at deletes expired tokens on its own; these
+    # remain for documents written before it existed and for manual runs.
     # ------------------------
-    async def purge_revoked_tokens(self, older_than_days: int = 30) -> int:
+    async def purge_revoked_tokens(self, older_than_days: int = 30, batch_size: Optional[int] = None) -> int:
         """
         Physically delete old revoked tokens to free up storage.
-        Only removes tokens revoked more than specified days ago.
+        Only removes tokens revoked more than specified days ago, in bounded batches.
         """
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-            result = await self.model.find({
-                "revoked": True,
-                "revoked_at": {"$lte": cutoff_date}
-            }).delete_many()
-
-            deleted_count = result.deleted_count if result else 0
+            deleted_count = await self.delete_in_batches(
+                {"revoked": True, "revoked_at": {"$lte": cutoff_date}}, batch_size=batch_size
+            )
             if deleted_count > 0:
                 logger.info(f"Purged {deleted_count} revoked tokens older than {older_than_days} days")
             return deleted_count
@@ -151,18 +190,16 @@ class RefreshedTokenCrud(CrudBase[RefreshedToken]):
             logger.error(f"Error purging revoked tokens: {str(e)}")
             return 0
 
-    async def cleanup_expired_tokens(self, older_than_days: int = 7) -> int:
+    async def cleanup_expired_tokens(self, older_than_days: int = 7, batch_size: Optional[int] = None) -> int:
         """
         Comprehensive cleanup: remove expired tokens (both revoked and non-revoked)
-        that expired more than specified days ago.
+        that expired more than specified days ago, in bounded batches.
         """
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-            result = await self.model.find({
-                "expires_at": {"$lte": cutoff_date}
-            }).delete_many()
-
-            deleted_count = result.deleted_count if result else 0
+            deleted_count = await self.delete_in_batches(
+                {"expires_at": {"$lte": cutoff_date}}, batch_size=batch_size
+            )
             if deleted_count > 0:
                 logger.info(f"Cleaned up {deleted_count} expired tokens older than {older_than_days} days")
             return deleted_count
@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
-from typing import Optional, List, Union
+from typing import Any, Dict, Optional, List, Union
 from pydantic import EmailStr
+from pymongo import UpdateMany
 from beanie import PydanticObjectId
 
+from app.core.utils.auth_cache import auth_cache
 from app.crud.crud_base import CrudBase
 from app.models.user_models import User
 
@@ -10,11 +12,79 @@ from app.models.user_models import User
 class UserCRUD(CrudBase[User]):
     """ User Crud Management """
     def __init__(self):
+        # No document cache: auth and refresh checks read role / is_active /
+        # token_version from here, and a process-local copy would keep serving
+        # them after another worker changed them.
         super().__init__(User)
 
+    # Every user write (token version, role, is_active, ...) also drops the
+    # auth cache entries checked by SecurityManager.get_current_user, per
+    # user: writes by filter read the matched ids first, since the write may
+    # change the very fields the filter selects on.
+    async def _remember(self, doc) -> None:
+        await super()._remember(doc)
+        if isinstance(doc, User):
+            await auth_cache.invalidate(doc.id)
+
+    async def _forget(self, obj_id=None, query=None) -> None:
+        await super()._forget(obj_id, query)
+        if obj_id is not None:
+            await auth_cache.invalidate(obj_id)
+
+    async def _matched_ids(self, filters: Optional[Dict[str, Any]], limit: int = 0, **kwargs) -> List[Any]:
+        query = self._filters(filters, **kwargs)
+        if self._target_id(query) is not None:
+            return []  # _forget already gets the id
+        return [doc["_id"] async for doc in self._collection().find(query, {"_id": 1}, limit=limit)]
+
+    async def update_one(self, filters=None, update=None, upsert: bool = False, **kwargs) -> int:
+        ids = await self._matched_ids(filters, limit=1, **kwargs)
+        matched = await super().update_one(filters, update, upsert, **kwargs)
+        await auth_cache.invalidate(*ids)
+        return matched
+
+    async def update_many(self, filters=None, update_data=None, **kwargs) -> int:
+        ids = await self._matched_ids(filters, **kwargs)
+        modified = await super().update_many(filters, update_data, **kwargs)
+        await auth_cache.invalidate(*ids)
+        return modified
+
+    async def update_in_batches(
+        self, filters=None, update_data=None, batch_size=None, pause_seconds=None, max_batches=None, **kwargs
+    ) -> int:
+        ids = await self._matched_ids(filters, **kwargs)
+        modified = await super().update_in_batches(
+            filters, update_data, batch_size, pause_seconds, max_batches, **kwargs
+        )
+        await auth_cache.invalidate(*ids)
+        return modified
+
+    async def delete_by_filter(self, filters=None, **kwargs) -> bool:
+        ids = await self._matched_ids(filters, limit=1, **kwargs)
+        deleted = await super().delete_by_filter(filters, **kwargs)
+        await auth_cache.invalidate(*ids)
+        return deleted
+
+    async def delete_in_batches(
+        self, filters=None, batch_size=None, pause_seconds=None, max_batches=None, **kwargs
+    ) -> int:
+        ids = await self._matched_ids(filters, **kwargs)
+        deleted = await super().delete_in_batches(filters, batch_size, pause_seconds, max_batches, **kwargs)
+        await auth_cache.invalidate(*ids)
+        return deleted
+
+    async def bulk_write(self, ops, *args, **kwargs):
+        ids = []
+        for op in ops:
+            if (query := getattr(op, "_filter", None)) is not None:
+                ids += await self._matched_ids(query, limit=0 if isinstance(op, UpdateMany) else 1)
+        result = await super().bulk_write(ops, *args, **kwargs)
+        await auth_cache.invalidate(*ids)
+        return result
+
     async def get_user_by_id(self, user_id: Union[str, PydanticObjectId]) -> Optional[User]:
-        """Get user by MongoDB _id."""
-        return await self.get(user_id)
+        """Get user by MongoDB _id (memoized per request)."""
+        return await self.load(user_id)
 
     async def get_by_email(self, email: EmailStr) -> Optional[User]:
         return await self.get_one(email=email)
@@ -44,12 +114,9 @@ class UserCRUD(CrudBase[User]):
         )
 
     async def increment_token_version(self, user_id: str) -> Optional[User]:
-        user = await self.get(user_id)
-        if user:
-            user.token_version += 1
-            await user.save()
-            return user
-        return None
+        return await self.increment_by_filter(
+            {"_id": self._normalize_user_id(user_id)}, {"token_version": 1}
+        )
 
     async def search_users(self, query: str, limit: int = 50) -> List[User]:
         return await self.get_multi(
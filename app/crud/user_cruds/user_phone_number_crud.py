@@ -24,11 +24,10 @@ class UserPhoneNumberCrud(CrudBase[PhoneNumber]):
             raise HTTPException(status_code=400)
 
         if phone_data.is_primary:
-            user_phones = await self.get_multi(
-                filters={"user_id": phone_data.user_id, "is_primary": True}
+            await self.update_many(
+                {"user_id": phone_data.user_id, "is_primary": True},
+                {"is_primary": False},
             )
-            for phone in user_phones:
-                await self.update(phone.id, {"is_primary": False})
 
         return await self.create(**phone_data.model_dump())
 
@@ -61,12 +60,10 @@ class UserPhoneNumberCrud(CrudBase[PhoneNumber]):
         phone = await self.my_get(phone_id, current_user)
 
         if update_data.get("is_primary"):
-            user_phones = await self.get_multi(
-                filters={"user_id": phone.user_id, "is_primary": True}
+            await self.update_many(
+                {"user_id": phone.user_id, "is_primary": True, "_id": {"$ne": phone.id}},
+                {"is_primary": False},
             )
-            for p in user_phones:
-                if str(p.id) != str(phone_id):
-                    await self.update(p.id, {"is_primary": False})
 
         return await self.update(phone_id, update_data)
 
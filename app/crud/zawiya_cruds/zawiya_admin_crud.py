@@ -99,10 +99,9 @@ class ZawiyaAdminCRUD(CrudBase[ZawiyaAdmin]):
             if not existing.is_deleted:
                 raise Exceptions.conflict("User is already an admin")
 
-            existing.is_deleted = False
-            existing.role = role
-            await existing.save()
-            return existing
+            return await self.update(
+                existing.id, {"is_deleted": False, "deleted_at": None, "role": role}
+            )
 
         return await self.create(
             user_id=user_id,
@@ -129,9 +128,7 @@ class ZawiyaAdminCRUD(CrudBase[ZawiyaAdmin]):
         if admin.role == role:
             raise Exceptions.conflict("Role is already assigned")
 
-        admin.role = role
-        await admin.save()
-        return admin
+        return await self.update(admin.id, {"role": role})
 
     async def remove_admin(
         self,
@@ -148,7 +145,7 @@ class ZawiyaAdminCRUD(CrudBase[ZawiyaAdmin]):
         if admin.user_id == owner_id:
             raise Exceptions.conflict("Owner cannot be removed")
 
-        await admin.soft_delete()
+        await self.soft_delete(admin.id)
 
     async def list_admins(
         self,
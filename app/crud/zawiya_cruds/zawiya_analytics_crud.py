@@ -20,10 +20,9 @@ class ZawiyaAnalyticsCrud(CrudBase[ZawiyaAnalytics]):
         field: str,
         amount: int = 1
     ):
-        analytics = await self.get_or_create(zawiya_id)
-        value = getattr(analytics, field)
-        setattr(analytics, field, value + amount)
-        return await analytics.save()
+        return await self.increment_by_filter(
+            {"zawiya_id": zawiya_id}, {field: amount}, upsert=True
+        )
 
     # Example helpers
     async def add_video(self, zawiya_id: PydanticObjectId):
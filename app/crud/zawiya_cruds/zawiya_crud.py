@@ -4,6 +4,7 @@ import re
 from typing import Optional
 from beanie import PydanticObjectId
 
+from app.crud.cache import CacheConfig
 from app.crud.crud_base import CrudBase
 from app.models.zawiya_models import Zawiya
 from app.core.response.exceptions import Exceptions
@@ -12,7 +13,7 @@ from app.core.response.exceptions import Exceptions
 class ZawiyaCrud(CrudBase[Zawiya]):
     """ Zawiya Crud Management """
     def __init__(self):
-        super().__init__(Zawiya)
+        super().__init__(Zawiya, cache=CacheConfig(ttl_seconds=300, redis=True))
 
     # ---------------- CREATE ----------------
     async def create_zawiya(self, *, title, name, description, owner_id):
@@ -32,7 +33,7 @@ class ZawiyaCrud(CrudBase[Zawiya]):
 
     # ---------------- BASIC GET ----------------
     async def get_by_id(self, zawiya_id: PydanticObjectId):
-        return await self.get(zawiya_id)
+        return await self.load(zawiya_id)
 
     async def get_by_title(self, title: str):
         return await self.get_one(title=title.strip())
@@ -90,6 +91,7 @@ class ZawiyaCrud(CrudBase[Zawiya]):
             per_page=per_page,
             filters=filters,
             order_by="created_at",
+            secondary=True,
         )
 
 
@@ -6,12 +6,13 @@ from beanie import PydanticObjectId
 
 from app.core.response.success import Success
 from app.crud import CrudBase
+from app.crud.cache import CacheConfig
 from app.models.zawiya_models import ZawiyaProfile
 
 class ZawiyaProfileCrud(CrudBase[ZawiyaProfile]):
     """ Zawiya Profile Crud Management """
     def __init__(self):
-        super().__init__(ZawiyaProfile)
+        super().__init__(ZawiyaProfile, cache=CacheConfig(ttl_seconds=300, field="zawiya_id", redis=True))
 
     async def create_or_update_profile(
             self,
@@ -39,7 +40,7 @@ class ZawiyaProfileCrud(CrudBase[ZawiyaProfile]):
         return Success.created(message="profile created")
 
     async def get_profile(self, zawiya_id: PydanticObjectId):
-        return await self.get_one(zawiya_id=zawiya_id)
+        return await self.get_cached(zawiya_id)
 
     async def delete_zawiya_profile(self, zawiya_id: PydanticObjectId):
         return await self.delete_by_filter(zawiya_id=zawiya_id)
@@ -35,12 +35,13 @@ class ZawiyaSubscriptionCrud(CrudBase[ZawiyaSubscription]):
         zawiya_id: PydanticObjectId,
         level: NotificationLevel
     ):
-        sub = await self.get_one(user_id=user_id, zawiya_id=zawiya_id)
+        sub = await self.update_by_filter(
+            {"user_id": user_id, "zawiya_id": zawiya_id},
+            {"notification_level": level},
+        )
         if not sub:
             raise Exceptions.bad_request("User is not subscribed")
-
-        sub.notification_level = level
-        return await sub.save()
+        return sub
 
     async def is_subscribed(self, user_id: PydanticObjectId, zawiya_id: PydanticObjectId):
         return await self.get_one(user_id=user_id, zawiya_id=zawiya_id)
@@ -9,7 +9,22 @@ from starlette.staticfiles import StaticFiles
 from app.services.user.superuser_auth import superuser_create
 from app.core.utils.exception_handlers import setup_exception_handlers
 from app.core.utils.settings import settings
+from app.core.utils.startup import startup_report
+from app.core.utils.auth_cache import auth_cache
+from app.core.utils.password_hasher import password_hasher
+from app.core.utils.maintenance import maintenance_scheduler
+from app.core.utils.dependencies import AdminUser
+from app.core.utils.security import security_manager
 from app.core.utils.database import mongodb
+from app.core.utils.mongo_monitoring import RouteTagMiddleware, command_metrics
+from app.core.utils.redis_client import redis_client
+from app.crud.cache import DocumentCache
+from app.crud.dataloader import DataLoaderMiddleware
+from app.core.websocket.base import manager
+from app.core.websocket.bus import broadcast_bus
+from app.services.contents.livestream_service.active_streams import active_stream_directory
+from app.services.contents.livestream_service.event_log import event_log_writer
+from app.services.contents.livestream_service.sfu_registry import sfu_registry
 from app.routes.api_routes import api_router
 
 # Configure logging
@@ -20,21 +35,41 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     # -------------------- STARTUP --------------------
+    startup_report.phases["imports"] = startup_report.total
     await mongodb.connect()
     logger.info("MongoDB connected successfully.")
+    with startup_report.phase("redis"):
+        await redis_client.connect()
+        await broadcast_bus.start()
+    await manager.start()
+    await sfu_registry.start()
+    with startup_report.phase("active_streams"):
+        await active_stream_directory.rebuild()
+    await event_log_writer.start()
+    if settings.MAINTENANCE_ENABLED:
+        await maintenance_scheduler.start()
 
     # Create superuser only once
-    try:
-        await superuser_create()
-        logger.info(f"Superuser checked")
-    except Exception as e:
-        logger.error(f"Superuser creation failed: {e}")
+    with startup_report.phase("superuser"):
+        try:
+            await superuser_create()
+            logger.info(f"Superuser checked")
+        except Exception as e:
+            logger.error(f"Superuser creation failed: {e}")
+    startup_report.log()
 
     yield  # Application runs here
 
     # -------------------- SHUTDOWN --------------------
+    await maintenance_scheduler.stop()
+    await event_log_writer.stop()
+    await sfu_registry.stop()
+    await manager.stop()
+    await broadcast_bus.stop()
+    await redis_client.disconnect()
     await mongodb.disconnect()
     logger.info("MongoDB disconnected.")
+    password_hasher.shutdown()
 
 
 # -------------------- APP SETUP --------------------
@@ -77,6 +112,12 @@ app.add_middleware(
     expose_headers=settings.CORS_EXPOSE_HEADERS.split(",") if settings.CORS_EXPOSE_HEADERS else [],
 )
 
+# Request-scoped DataLoaders for CrudBase.load
+app.add_middleware(DataLoaderMiddleware)
+
+# Tags MongoDB commands with the route that issued them
+app.add_middleware(RouteTagMiddleware)
+
 # Include routes
 app.include_router(api_router)
 
@@ -100,3 +141,43 @@ async def health_check():
         "status": "healthy",
         "environment": settings.APP_ENV,
     }
+
+
+@app.get("/health/startup")
+async def startup_timings(_: AdminUser):
+    """How long this worker took to boot, by phase"""
+    return startup_report.as_dict()
+
+
+@app.get("/health/cache")
+async def cache_stats(_: AdminUser):
+    """CRUD read-through, auth and verified-token cache hit/miss stats for this worker"""
+    return {
+        **DocumentCache.all_stats(),
+        "auth": auth_cache.stats(),
+        "access_tokens": security_manager.verified_token_stats(),
+    }
+
+
+@app.get("/health/maintenance")
+async def maintenance_reports(_: AdminUser):
+    """Last run (rows, duration, error) of each maintenance job on this worker"""
+    return maintenance_scheduler.as_dict()
+
+
+@app.get("/health/websockets")
+async def websocket_gauges(_: AdminUser):
+    """WebSocket connection gauges for this worker (per-room counts, so admins only)"""
+    return manager.gauges()
+
+
+@app.get("/metrics/mongo")
+async def mongo_metrics(_: AdminUser):
+    """MongoDB command latency by collection/command and route, plus recent slow commands"""
+    return command_metrics.snapshot()
+
+
+@app.get("/metrics/password-hashing")
+async def password_hashing_metrics(_: AdminUser):
+    """bcrypt pool concurrency, queue depth and timings for this worker"""
+    return password_hasher.stats()
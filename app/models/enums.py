@@ -46,6 +46,7 @@ class LiveStreamEventType(str, Enum):
     unmute = "unmute"
     kick = "kick"
     ban = "ban"
+    unban = "unban"
     promote = "promote"
     demote = "demote"
     end_stream = "end_stream"
@@ -1,4 +1,6 @@
 from beanie import Document, PydanticObjectId
+from pydantic import BaseModel
+from pymongo import IndexModel
 
 from app.models import TimestampMixin, ZawiyaIdMixin, UserIdMixin, TitleMixin, DescriptionMixin, VisibilityStatus, \
     GroupRole, SoftDeleteMixin, InviteStatus, JoinRequestStatus
@@ -26,10 +28,16 @@ class GroupMember(Document, TimestampMixin):
     class Settings:
         name = "group_members"
         indexes = [
-            ("group_id", "user_id"),
+            IndexModel([("group_id", 1), ("user_id", 1)], unique=True),
+            "user_id",
         ]
 
 
+class GroupMemberRole(BaseModel):
+    """Read model for role checks: projects ``group_role`` only."""
+    group_role: GroupRole = GroupRole.MEMBER
+
+
 class GroupInvite(Document, TimestampMixin):
     group_id: PydanticObjectId
     inviter_id: PydanticObjectId
@@ -38,7 +46,10 @@ class GroupInvite(Document, TimestampMixin):
 
     class Settings:
         name = "group_invites"
-        indexes = [("group_id", "invitee_id")]
+        indexes = [
+            [("group_id", 1), ("invitee_id", 1)],
+            "invitee_id",
+        ]
 
 
 class GroupJoinRequest(Document, TimestampMixin):
@@ -48,4 +59,7 @@ class GroupJoinRequest(Document, TimestampMixin):
 
     class Settings:
         name = "group_join_requests"
-        indexes = [("group_id", "user_id")]
+        indexes = [
+            [("group_id", 1), ("user_id", 1)],
+            "user_id",
+        ]
@@ -3,6 +3,7 @@ from typing import Optional
 
 from beanie import Document, PydanticObjectId
 from pydantic import Field
+from pymongo import IndexModel
 
 from app.models import TimestampMixin, VisibilityStatus, StreamType, ParticipantRole, TitleMixin, \
     DescriptionMixin, ZawiyaIdMixin, UserIdMixin, GroupIdMixin
@@ -26,6 +27,7 @@ class LiveStream(Document, TimestampMixin, ZawiyaIdMixin, TitleMixin, Descriptio
             "zawiya_id",
             "status",
             "visibility",
+            IndexModel([("status", 1), ("zawiya_id", 1), ("started_at", -1)]),
         ]
 
 
@@ -38,7 +40,7 @@ class StreamAnalytics(Document, TimestampMixin):
     class Settings:
         name = "stream_analytics"
         indexes = [
-            "stream_id",
+            IndexModel([("stream_id", 1)], unique=True),
         ]
 
 class LiveStreamParticipant(Document, TimestampMixin):
@@ -72,9 +74,19 @@ class Recording(Document, TimestampMixin):
     size_bytes: Optional[int] = None
     status: RecordingStatus = RecordingStatus.PENDING
 
+    # Post-processing output
+    hls_playlist_path: Optional[str] = None
+    thumbnail_path: Optional[str] = None
+    processing_started_at: Optional[datetime] = None
+    # Claim lease, renewed while a worker is processing; see RecordingPipeline.
+    claimed_at: Optional[datetime] = None
+    attempts: int = 0
+    completed_at: Optional[datetime] = None
+    error: Optional[str] = None
+
     class Settings:
         name = "recordings"
-        indexes = ["stream_id"]
+        indexes = ["stream_id", "status"]
 
 
 
@@ -88,4 +100,8 @@ class LiveStreamEvent(Document, TimestampMixin):
 
     class Settings:
         name = "live_stream_events"
-        indexes = ["stream_id", "actor_id", "target_id"]
\ No newline at end of file
+        indexes = [
+            IndexModel([("stream_id", 1), ("_id", 1)]),  # per-stream replay
+            "actor_id",
+            "target_id",
+        ]
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Registry of Beanie ``Document`` models.
+
+Models are discovered from the ``app.models`` namespace only (never by
+walking ``sys.modules``) and returned in a stable ``module.name`` order.
+The resulting dotted paths are cached on disk together with a fingerprint
+of the model sources, so later boots import the listed classes directly and
+skip discovery until a model file changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Type
+
+from beanie import Document
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = Path(__file__).resolve().parent
+
+
+def _fingerprint() -> str:
+    """Cheap change detector: name, size and mtime of every model source file."""
+    digest = hashlib.sha256()
+    for path in sorted(MODELS_DIR.glob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _discover() -> List[Type[Document]]:
+    import app.models as models_pkg
+
+    found = {
+        obj for obj in vars(models_pkg).values()
+        if isinstance(obj, type) and issubclass(obj, Document) and obj is not Document
+    }
+    return sorted(found, key=lambda m: (m.__module__, m.__name__))
+
+
+def _load_cached(path: Path, fingerprint: str) -> Optional[List[Type[Document]]]:
+    try:
+        data = json.loads(path.read_text())
+        if data.get("fingerprint") != fingerprint:
+            return None
+        models = []
+        for dotted in data["models"]:
+            module, _, name = dotted.rpartition(".")
+            models.append(getattr(importlib.import_module(module), name))
+        return models
+    except (OSError, ValueError, KeyError, ImportError, AttributeError):
+        return None
+
+
+def _store_cached(path: Path, fingerprint: str, models: List[Type[Document]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "fingerprint": fingerprint,
+            "models": [f"{m.__module__}.{m.__name__}" for m in models],
+        }, indent=1))
+        os.replace(tmp, path)
+    except OSError as e:
+        # A read-only filesystem only costs the discovery on every boot.
+        logger.debug(f"Model registry cache not written: {e}")
+
+
+@lru_cache(maxsize=1)
+def document_models() -> List[Type[Document]]:
+    """All Beanie document models, in deterministic order (computed once per process)."""
+    from app.core.utils.settings import settings
+
+    path = Path(settings.MODEL_REGISTRY_CACHE) if settings.MODEL_REGISTRY_CACHE else None
+    fingerprint = _fingerprint()
+
+    if path and (models := _load_cached(path, fingerprint)) is not None:
+        return models
+
+    models = _discover()
+    if path:
+        _store_cached(path, fingerprint, models)
+    return models
@@ -131,9 +131,15 @@ class VerificationCode(Document, TimestampMixin):
 # ------------------------------
 
 class RefreshedToken(Document, TimestampMixin):
-    """Refresh tokens for JWT rotation."""
+    """
+    Refresh tokens for JWT rotation, stored by SHA-256 digest (never the raw JWT).
+    Expired documents are removed by the TTL index on ``expires_at``.
+    """
     user_id: PydanticObjectId
-    refresh_token: str = Field(..., max_length=510)
+    token_hash: str = Field(..., min_length=64, max_length=64)
+    jti: str
+    # Stable across rotations of the same device's token (the ``sid`` claim).
+    session_id: Optional[str] = None
     expires_at: datetime
     revoked: bool = False
     revoked_at: Optional[datetime] = None
@@ -143,12 +149,11 @@ class RefreshedToken(Document, TimestampMixin):
     class Settings:
         name = "refreshed_tokens"
         indexes = [
-            "user_id",
-            "refresh_token",
-            "expires_at",
-            "revoked",
-            [("expires_at", 1), ("revoked", 1)],
-            [("user_id", 1), ("created_at", -1)]
+            # Sparse: documents from before hashing have neither field until they expire.
+            IndexModel([("token_hash", 1)], unique=True, sparse=True),
+            IndexModel([("jti", 1)], unique=True, sparse=True),
+            [("user_id", 1), ("created_at", -1)],
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0),
         ]
 
 class PasswordResetToken(Document):
@@ -161,4 +166,8 @@ class PasswordResetToken(Document):
 
     class Settings:
         name = "password_reset_tokens"
-        indexes = ["email", "token", "expires_at"]
\ No newline at end of file
+        indexes = [
+            "email",
+            "token",
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0),
+        ]
\ No newline at end of file
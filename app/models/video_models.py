@@ -10,4 +10,4 @@ class Video(Document, TimestampMixin, TitleMixin, DescriptionMixin, ZawiyaIdMixi
 
     class Settings:
         name = "videos"
-        indexes = ["content_id"]
+        indexes = ["zawiya_id", "group_id", "user_id"]
@@ -11,6 +11,8 @@ class WebRTCSession(Document, TimestampMixin):
     stream_id: PydanticObjectId
     sfu_type: SFUType = SFUType.MEDIA_SOUP  # media-soup / livekit / janus / custom
     sfu_room_id: str  # SFU room identifier
+    sfu_node_id: Optional[str] = None  # node chosen by placement
+    sfu_url: Optional[str] = None
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
 
@@ -34,6 +36,6 @@ class WebRTCPeer(Document, TimestampMixin):
     class Settings:
         name = "webrtc_peers"
         indexes = [
-            [("session_id", 1)],
+            [("session_id", 1), ("peer_id", 1)],
             [("user_id", 1)],
         ]
@@ -74,6 +74,7 @@ class ZawiyaAddress(Document, TimestampMixin, SoftDeleteMixin):
 
     class Settings:
         name = "zawiya_address"
+        indexes = ["zawiya_id"]
 
 
 # --------------------- ANALYTICS ---------------------
@@ -88,6 +89,12 @@ class ZawiyaAnalytics(Document, TimestampMixin):
 
     class Settings:
         name = "zawiya_analytics"
+        indexes = [
+            IndexModel(
+                [("zawiya_id", ASCENDING)],
+                unique=True
+            )
+        ]
 
 
 # --------------------- SUBSCRIPTIONS ---------------------
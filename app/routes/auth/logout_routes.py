@@ -1,10 +1,22 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from app.core.utils.dependencies import CurrentUser
 from app.core.utils.token_manager import token_manager
 from app.core.response.success import Success
 
 router = APIRouter()
 
+@router.get("/sessions")
+async def list_sessions(current_user: CurrentUser, request: Request):
+    """
+    Lists the current user's active device sessions, most recent first.
+    The current device is flagged when its refresh token comes in the
+    refresh cookie or the X-Refresh-Token header (Authorization carries the
+    access token here).
+    """
+    refresh_token = request.cookies.get("refresh_token") or request.headers.get("X-Refresh-Token")
+    sessions = await token_manager.list_sessions(str(current_user.id), refresh_token)
+    return Success.ok("Active sessions", data={"sessions": sessions})
+
 @router.post("/logout/current")
 async def logout_current(_: CurrentUser, refresh_token: str):
     """
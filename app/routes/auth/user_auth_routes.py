@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Request
 import logging
 from app.schemas.user.user_auth_schema import UserCreate, UserLogin
 from app.services.user.user_service import user_service
@@ -11,5 +11,5 @@ async def _user_create(user_data: UserCreate = Body(...)):
     return await user_service.create_user(user_data)
 
 @router.post("/login")
-async def _login_user(user_data: UserLogin = Body(...)):
-    return await user_service.login_user(user_data)
\ No newline at end of file
+async def _login_user(request: Request, user_data: UserLogin = Body(...)):
+    return await user_service.login_user(user_data, request)
\ No newline at end of file
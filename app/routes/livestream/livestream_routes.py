@@ -1,11 +1,15 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
 from beanie import PydanticObjectId
 
+from app.core.utils.dependencies import CurrentUser
 from app.models import ParticipantRole
 from app.schemas.livestream.livestream_schema import StreamResponseSchema, StreamCreateSchema, ParticipantResponseSchema, \
-    ParticipantAddSchema, AnalyticsResponseSchema
+    ParticipantAddSchema, AnalyticsResponseSchema, BulkModerationSchema, BulkModerationResponseSchema, \
+    ActiveStreamsPageSchema, StreamEventsPageSchema
+from app.services.contents.livestream_service.event_log import event_log_writer
 from app.services.contents.livestream_service.livestream_service import LiveStreamService
+from app.services.contents.livestream_service.participant_services import participant_service, BULK_ACTIONS
 
 router = APIRouter(prefix="/streams", tags=["LiveStreams"])
 
@@ -38,10 +42,14 @@ async def end_stream(stream_id: PydanticObjectId):
         raise HTTPException(status_code=404, detail="Stream not found")
     return stream
 
-@router.get("/active", response_model=List[StreamResponseSchema])
-async def get_active_streams(zawiya_id: Optional[PydanticObjectId] = None):
-    streams = await LiveStreamService.get_active_streams(zawiya_id)
-    return streams
+@router.get("/active", response_model=ActiveStreamsPageSchema)
+async def get_active_streams(
+    zawiya_id: Optional[PydanticObjectId] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    streams, next_cursor = await LiveStreamService.get_active_streams(zawiya_id, cursor, limit)
+    return ActiveStreamsPageSchema(items=streams, next_cursor=next_cursor)
 
 
 # --------------------- Participants Endpoints ---------------------
@@ -68,6 +76,38 @@ async def remove_participant(stream_id: PydanticObjectId, user_id: PydanticObjec
     return {"status": "removed"}
 
 
+# --------------------- Moderation Endpoints ---------------------
+
+@router.post("/{stream_id}/moderation/bulk", response_model=BulkModerationResponseSchema)
+async def bulk_moderate(stream_id: PydanticObjectId, payload: BulkModerationSchema, current_user: CurrentUser):
+    if payload.action not in BULK_ACTIONS:
+        raise HTTPException(status_code=400, detail=f"Unsupported bulk action: {payload.action.value}")
+    try:
+        user_ids = await participant_service.bulk_moderate(
+            stream_id=stream_id,
+            actor_id=current_user.id,
+            action=payload.action,
+            user_ids=payload.user_ids,
+            reason=payload.reason,
+        )
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    return BulkModerationResponseSchema(action=payload.action, affected=len(user_ids), user_ids=user_ids)
+
+@router.get("/{stream_id}/events", response_model=StreamEventsPageSchema)
+async def replay_events(
+    stream_id: PydanticObjectId,
+    current_user: CurrentUser,
+    cursor: Optional[PydanticObjectId] = None,
+    limit: int = Query(100, ge=1, le=500),
+):
+    if not await participant_service.has_role(stream_id, current_user.id, ParticipantRole.OWNER, ParticipantRole.CO_HOST):
+        raise HTTPException(status_code=403, detail="Only the owner or a co-host can review events")
+
+    events, next_cursor = await event_log_writer.replay(stream_id, cursor, limit)
+    return StreamEventsPageSchema(items=events, next_cursor=next_cursor)
+
+
 # --------------------- Analytics Endpoints ---------------------
 
 @router.post("/{stream_id}/viewers")
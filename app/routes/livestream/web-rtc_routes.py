@@ -1,9 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from beanie import PydanticObjectId
 from typing import List
+from app.models import SFUType
 
+from app.core.utils.dependencies import SFUService
 from app.schemas.livestream.web_rtc_schema import WebRTCSessionResponseSchema, WebRTCSessionCreateSchema, \
-    WebRTCPeerResponseSchema, WebRTCPeerCreateSchema
+    WebRTCPeerResponseSchema, WebRTCPeerCreateSchema, SFUHeartbeatSchema, SFUPeerStateSchema, SFUNodeHeartbeatSchema
+from app.services.contents.livestream_service.sfu_placement import sfu_placement_service, SFUNodeLoad
+from app.services.contents.livestream_service.sfu_registry import sfu_registry
 from app.services.contents.livestream_service.web_rtc_peer_service import web_rtc_peer_service
 from app.services.contents.livestream_service.web_rtc_service import webrtc_session_service
 
@@ -45,3 +49,33 @@ async def get_peers(session_id: PydanticObjectId):
 async def remove_peer(session_id: PydanticObjectId, peer_id: str):
     await web_rtc_peer_service.remove_webrtc_peer(session_id, peer_id)
     return {"status": "removed"}
+
+
+# --------------------- SFU Callback Endpoints ---------------------
+@webrtc_router.post("/sfu/heartbeat", response_model=dict)
+async def sfu_heartbeat(payload: SFUHeartbeatSchema, _: SFUService):
+    alive = await sfu_registry.heartbeat(payload.room_ids)
+    return {"status": "ok", "rooms": alive}
+
+@webrtc_router.post("/sfu/rooms/{room_id}/peers/{peer_id}/state", response_model=dict)
+async def sfu_peer_state(room_id: str, peer_id: str, payload: SFUPeerStateSchema, _: SFUService):
+    peer = await web_rtc_peer_service.update_peer_state(room_id, peer_id, **payload.model_dump(exclude_none=True))
+    if peer is None:
+        raise HTTPException(status_code=404, detail="Peer not found")
+    return {"status": "ok", "peer": peer}
+
+@webrtc_router.post("/sfu/rooms/{room_id}/close", response_model=dict)
+async def sfu_room_closed(room_id: str, _: SFUService):
+    closed = await sfu_registry.close_room(room_id)
+    return {"status": "closed", "peers": closed}
+
+@webrtc_router.post("/sfu/nodes/heartbeat", response_model=dict)
+async def sfu_node_heartbeat(payload: SFUNodeHeartbeatSchema, _: SFUService):
+    utilization = await sfu_placement_service.report(
+        SFUNodeLoad(**payload.model_dump(exclude_none=True))
+    )
+    return {"status": "ok", "utilization": utilization}
+
+@webrtc_router.get("/sfu/nodes/{sfu_type}", response_model=List[dict])
+async def sfu_nodes(sfu_type: SFUType, _: SFUService):
+    return await sfu_placement_service.get_nodes(sfu_type)
@@ -1,7 +1,8 @@
-from typing import Optional
+from datetime import datetime
+from typing import Optional, List
 from pydantic import BaseModel, Field
 from beanie import PydanticObjectId
-from app.models.enums import ParticipantRole, StreamStatus, StreamType, VisibilityStatus
+from app.models.enums import ParticipantRole, StreamStatus, StreamType, VisibilityStatus, LiveStreamEventType
 
 # --------------------- Stream ---------------------
 class StreamCreateSchema(BaseModel):
@@ -21,8 +22,12 @@ class StreamResponseSchema(BaseModel):
     visibility: VisibilityStatus
     stream_type: StreamType
     is_recorded: bool
-    started_at: Optional[str]
-    ended_at: Optional[str]
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+
+class ActiveStreamsPageSchema(BaseModel):
+    items: List[StreamResponseSchema]
+    next_cursor: Optional[str] = None
 
 
 # --------------------- Participant ---------------------
@@ -37,6 +42,30 @@ class ParticipantResponseSchema(BaseModel):
     role: ParticipantRole
 
 
+# --------------------- Moderation ---------------------
+class BulkModerationSchema(BaseModel):
+    action: LiveStreamEventType
+    user_ids: List[PydanticObjectId] = Field(min_length=1, max_length=500)
+    reason: Optional[str] = Field(default=None, max_length=500)
+
+class StreamEventResponseSchema(BaseModel):
+    id: PydanticObjectId
+    actor_id: PydanticObjectId
+    target_id: Optional[PydanticObjectId] = None
+    event_type: LiveStreamEventType
+    reason: Optional[str] = None
+    created_at: datetime
+
+class StreamEventsPageSchema(BaseModel):
+    items: List[StreamEventResponseSchema]
+    next_cursor: Optional[PydanticObjectId] = None
+
+class BulkModerationResponseSchema(BaseModel):
+    action: LiveStreamEventType
+    affected: int
+    user_ids: List[PydanticObjectId]
+
+
 # --------------------- Analytics ---------------------
 class AnalyticsResponseSchema(BaseModel):
     stream_id: PydanticObjectId
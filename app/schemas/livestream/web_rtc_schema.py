@@ -1,15 +1,19 @@
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 from beanie import PydanticObjectId
+from app.models.enums import SFUType
 
 class WebRTCSessionCreateSchema(BaseModel):
-    sfu_type: str  # e.g., "media-soup", "janus"
-    sfu_room_id: str
+    sfu_type: SFUType = SFUType.MEDIA_SOUP
+    sfu_room_id: Optional[str] = None  # omit to let the backend place the room
 
 class WebRTCSessionResponseSchema(BaseModel):
     id: PydanticObjectId
     stream_id: PydanticObjectId
     sfu_type: str
     sfu_room_id: str
+    sfu_node_id: Optional[str] = None
+    sfu_url: Optional[str] = None
 
 class WebRTCPeerCreateSchema(BaseModel):
     user_id: PydanticObjectId
@@ -20,3 +24,24 @@ class WebRTCPeerResponseSchema(BaseModel):
     session_id: PydanticObjectId
     user_id: PydanticObjectId
     peer_id: str
+
+
+# --------------------- SFU Callbacks ---------------------
+class SFUHeartbeatSchema(BaseModel):
+    room_ids: List[str] = Field(default_factory=list, max_length=10000)
+
+class SFUPeerStateSchema(BaseModel):
+    is_publishing_audio: Optional[bool] = None
+    is_publishing_video: Optional[bool] = None
+    is_screen_sharing: Optional[bool] = None
+
+class SFUNodeHeartbeatSchema(BaseModel):
+    node_id: str = Field(min_length=1, max_length=128)
+    url: str
+    sfu_types: List[SFUType] = Field(min_length=1)
+    rooms: int = Field(default=0, ge=0)
+    peers: int = Field(default=0, ge=0)
+    bitrate_kbps: int = Field(default=0, ge=0)
+    max_rooms: Optional[int] = Field(default=None, gt=0)
+    max_peers: Optional[int] = Field(default=None, gt=0)
+    max_bitrate_kbps: Optional[int] = Field(default=None, gt=0)
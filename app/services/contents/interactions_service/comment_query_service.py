@@ -24,7 +24,7 @@ class CommentQueryService:
             limit=per_page,
         )
 
-        total = post_comment_crud.count(
+        total = await post_comment_crud.count(
             filters={
                 "post_id": post_id,
                 "parent_comment_id": None,
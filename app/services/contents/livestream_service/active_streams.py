@@ -0,0 +1,219 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple, Union
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel, Field
+
+from app.core.response.exceptions import Exceptions
+from app.core.utils.redis_client import redis_client
+from app.crud.content.livestream_cruds.livestream_crud import live_stream_crud
+from app.models import LiveStream, StreamStatus
+
+ACTIVE_STATUSES = (StreamStatus.CREATED, StreamStatus.LIVE)
+
+# Release the rebuild lock only if this rebuild still holds it.
+_RELEASE_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ActiveStreamEntry(BaseModel):
+    """The LiveStream fields the directory is built from."""
+    id: PydanticObjectId = Field(alias="_id")
+    zawiya_id: PydanticObjectId
+    started_at: Optional[datetime] = None
+
+
+class ActiveStreamDirectory:
+    """
+    Redis index of streams that are CREATED or LIVE.
+
+    One sorted set holds every active stream and one more per zawiya; the
+    score is ``started_at`` in epoch ms (0 while not started yet), so the
+    order is "most recently started first, then not-yet-started streams by
+    id" — exactly the order of the MongoDB fallback on
+    ``(status, zawiya_id, started_at)``. Both paths use the same opaque
+    ``"<score>:<stream_id>"`` cursor.
+    """
+
+    GLOBAL = "streams:active"
+    READY = "streams:active:ready"
+    # Held by the one worker rebuilding the directory.
+    LOCK = "streams:active:rebuilding"
+    # Staging keys and the lock of an in-progress rebuild expire if the worker dies midway.
+    STAGING_TTL_SECONDS = 600
+
+    @staticmethod
+    def _zawiya(zawiya_id) -> str:
+        return f"streams:active:zawiya:{zawiya_id}"
+
+    @staticmethod
+    def _score(stream: Union[LiveStream, ActiveStreamEntry]) -> int:
+        if not stream.started_at:
+            return 0
+        started_at = stream.started_at
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        return int(started_at.timestamp() * 1000)
+
+    @staticmethod
+    def encode_cursor(score: int, stream_id) -> str:
+        return f"{int(score)}:{stream_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, PydanticObjectId]:
+        try:
+            score, stream_id = cursor.split(":", 1)
+            return int(score), PydanticObjectId(stream_id)
+        except Exception:
+            raise Exceptions.bad_request("Invalid cursor")
+
+    # --------------------- Maintenance ---------------------
+    async def sync(self, stream: LiveStream) -> None:
+        """Add, move or remove a stream according to its current status."""
+        if not redis_client.available:
+            return
+        member = str(stream.id)
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            if stream.status in ACTIVE_STATUSES:
+                score = self._score(stream)
+                pipe.zadd(self.GLOBAL, {member: score})
+                pipe.zadd(self._zawiya(stream.zawiya_id), {member: score})
+            else:
+                pipe.zrem(self.GLOBAL, member)
+                pipe.zrem(self._zawiya(stream.zawiya_id), member)
+            await pipe.execute()
+
+    async def rebuild(self, batch_size: int = 500) -> Optional[int]:
+        """
+        Rebuild the directory from MongoDB (startup / after a Redis flush).
+
+        Only one worker rebuilds at a time (``SET NX EX`` lock); the others
+        get None and keep reading MongoDB until READY is set. Each batch of
+        streams is written to staging keys and flushed before the next one
+        is read, so memory stays bounded by ``batch_size``; one final
+        transaction swaps the staging keys in, so readers never see a
+        half-built directory.
+        """
+        if not redis_client.available:
+            return None
+        client = redis_client.client
+        rebuild_id = str(PydanticObjectId())
+        if not await client.set(self.LOCK, rebuild_id, nx=True, ex=self.STAGING_TTL_SECONDS):
+            return None
+        try:
+            return await self._rebuild(rebuild_id, batch_size)
+        finally:
+            await client.eval(_RELEASE_LOCK, 1, self.LOCK, rebuild_id)
+
+    async def _rebuild(self, rebuild_id: str, batch_size: int) -> int:
+        client = redis_client.client
+        suffix = f":rebuild:{rebuild_id}"
+        staged = set()
+        count = 0
+        async for batch, _ in live_stream_crud.iter_batches(
+            {"status": {"$in": list(ACTIVE_STATUSES)}},
+            batch_size=batch_size,
+            projection=ActiveStreamEntry,
+        ):
+            async with client.pipeline(transaction=False) as pipe:
+                for stream in batch:
+                    score = self._score(stream)
+                    for key in (self.GLOBAL, self._zawiya(stream.zawiya_id)):
+                        pipe.zadd(key + suffix, {str(stream.id): score})
+                        if key not in staged:
+                            staged.add(key)
+                            pipe.expire(key + suffix, self.STAGING_TTL_SECONDS)
+                await pipe.execute()
+            count += len(batch)
+
+        stale = [self.GLOBAL] + [self._zawiya(z) async for z in self._indexed_zawiyas()]
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(*stale)
+            for key in staged:
+                pipe.rename(key + suffix, key)
+                pipe.persist(key)
+            pipe.set(self.READY, "1")
+            await pipe.execute()
+        return count
+
+    async def _indexed_zawiyas(self):
+        async for key in redis_client.client.scan_iter(match=self._zawiya("*"), count=500):
+            if ":rebuild:" not in key:
+                yield key.rsplit(":", 1)[-1]
+
+    # --------------------- Listing ---------------------
+    async def page(
+        self,
+        zawiya_id: Optional[PydanticObjectId] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+    ) -> Tuple[List[LiveStream], Optional[str]]:
+        """Return one page of active streams and the cursor of the next page."""
+        after = self.decode_cursor(cursor) if cursor else None
+
+        # A missing READY marker means Redis lost the directory: one request
+        # rebuilds it, the ones that lose the rebuild lock read MongoDB.
+        if redis_client.available and (
+            await redis_client.client.exists(self.READY) or await self.rebuild() is not None
+        ):
+            entries = await self._page_ids(zawiya_id, after, limit + 1)
+            ids = [PydanticObjectId(member) for member, _ in entries[:limit]]
+            docs = {s.id: s for s in await LiveStream.find({"_id": {"$in": ids}}).to_list()}
+            streams = [docs[i] for i in ids if i in docs]
+            next_cursor = None
+            if len(entries) > limit and streams:
+                member, score = entries[limit - 1]
+                next_cursor = self.encode_cursor(score, member)
+            return streams, next_cursor
+
+        return await self._list_from_mongo(zawiya_id, after, limit)
+
+    async def _page_ids(self, zawiya_id, after, count: int) -> List[Tuple[str, float]]:
+        key = self._zawiya(zawiya_id) if zawiya_id else self.GLOBAL
+        client = redis_client.client
+
+        if after is None:
+            return await client.zrevrange(key, 0, count - 1, withscores=True)
+
+        score, stream_id = after
+        rank = await client.zrevrank(key, str(stream_id))
+        if rank is not None:
+            return await client.zrevrange(key, rank + 1, rank + count, withscores=True)
+        # Cursor stream left the directory meanwhile: resume strictly below its score.
+        return await client.zrevrangebyscore(key, f"({score}", "-inf", start=0, num=count, withscores=True)
+
+    async def _list_from_mongo(self, zawiya_id, after, limit: int) -> Tuple[List[LiveStream], Optional[str]]:
+        filters: dict = {"status": {"$in": list(ACTIVE_STATUSES)}}
+        if zawiya_id:
+            filters["zawiya_id"] = zawiya_id
+
+        if after:
+            score, stream_id = after
+            if score:
+                started_at = datetime.fromtimestamp(score / 1000, tz=timezone.utc)
+                filters["$or"] = [
+                    {"started_at": {"$lt": started_at}},
+                    {"started_at": started_at, "_id": {"$lt": stream_id}},
+                    {"started_at": None},
+                ]
+            else:
+                filters["started_at"] = None
+                filters["_id"] = {"$lt": stream_id}
+
+        streams = await LiveStream.find(filters).sort(
+            [("started_at", -1), ("_id", -1)]
+        ).limit(limit + 1).to_list()
+
+        next_cursor = None
+        if len(streams) > limit:
+            streams = streams[:limit]
+            last = streams[-1]
+            next_cursor = self.encode_cursor(self._score(last), last.id)
+        return streams, next_cursor
+
+
+active_stream_directory = ActiveStreamDirectory()
@@ -9,21 +9,15 @@ class AnalyticsService:
     @staticmethod
     async def increment_viewers(stream_id: PydanticObjectId, count: int = 1):
         """Increment viewers count in analytics."""
-        analytics = await analytics_crud.get_one({"stream_id": stream_id})
-        if analytics:
-            analytics.viewers += count
-            await analytics.save()
-        else:
-            await analytics_crud.create(stream_id=stream_id, viewers=count)
+        return await analytics_crud.increment_by_filter(
+            {"stream_id": stream_id}, {"viewers": count}, upsert=True
+        )
 
     @staticmethod
     async def add_like(stream_id: PydanticObjectId, count: int = 1):
         """Increment likes count in analytics."""
-        analytics = await analytics_crud.get_one({"stream_id": stream_id})
-        if analytics:
-            analytics.likes += count
-            await analytics.save()
-        else:
-            await analytics_crud.create(stream_id=stream_id, likes=count)
+        return await analytics_crud.increment_by_filter(
+            {"stream_id": stream_id}, {"likes": count}, upsert=True
+        )
 
 analytics_service = AnalyticsService()
\ No newline at end of file
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from beanie import PydanticObjectId
+from pymongo.errors import BulkWriteError
+
+from app.core.utils.settings import settings
+from app.models import LiveStreamEvent
+
+logger = logging.getLogger(__name__)
+
+_DUPLICATE_KEY = 11000
+
+
+class EventLogWriter:
+    """
+    Append-only, batched writer for ``LiveStreamEvent``.
+
+    Events are buffered in memory and written with ``insert_many(ordered=False)``
+    by a background task, woken when the batch size is reached or every flush
+    interval, whichever comes first; ``append`` never waits on MongoDB. The
+    buffer is bounded: events appended while it is full (Mongo down or too
+    slow) are dropped and counted in ``dropped``. Ids are assigned on append
+    so replay order matches the order events were logged, and so a batch
+    that failed as a whole can be retried (with backoff,
+    ``EVENT_LOG_MAX_RETRIES`` times) without duplicating the events an
+    earlier attempt did insert.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        max_buffer: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        self.batch_size = batch_size or settings.EVENT_LOG_BATCH_SIZE
+        self.max_buffer = max_buffer or settings.EVENT_LOG_MAX_BUFFER
+        self.flush_interval = flush_interval or settings.EVENT_LOG_FLUSH_INTERVAL_SECONDS
+        self._buffer: List[LiveStreamEvent] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self.written = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+
+    # --------------------- Writing ---------------------
+    async def append(self, *events: LiveStreamEvent) -> None:
+        for event in events:
+            if event.id is None:
+                event.id = PydanticObjectId()
+
+        if self._task is None:
+            # Writer not running (scripts, tests): write through.
+            await self._write(list(events))
+            return
+
+        room = max(self.max_buffer - len(self._buffer), 0)
+        if len(events) > room:
+            dropped = len(events) - room
+            self.dropped += dropped
+            logger.warning(f"Event log buffer full ({self.max_buffer}): dropped {dropped} events")
+            events = events[:room]
+        self._buffer.extend(events)
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        async with self._lock:
+            written = 0
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                written += await self._write(batch)
+            return written
+
+    async def _write(self, batch: List[LiveStreamEvent]) -> int:
+        if not batch:
+            return 0
+        for attempt in range(settings.EVENT_LOG_MAX_RETRIES + 1):
+            try:
+                await LiveStreamEvent.insert_many(batch, ordered=False)
+                inserted = len(batch)
+            except BulkWriteError as e:
+                # ordered=False: everything except the reported errors was inserted.
+                # A duplicate id means an earlier attempt already wrote that event.
+                errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != _DUPLICATE_KEY]
+                inserted = len(batch) - len(errors)
+                if errors:
+                    self.failed += len(errors)
+                    logger.error(f"Event log batch had {len(errors)} failed inserts: {errors[:1]}")
+            except Exception as e:
+                if attempt < settings.EVENT_LOG_MAX_RETRIES:
+                    delay = settings.EVENT_LOG_RETRY_BACKOFF_SECONDS * 2 ** attempt
+                    self.retried += 1
+                    logger.warning(f"Event log batch of {len(batch)} failed ({e}); retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                self.failed += len(batch)
+                logger.error(f"Event log batch of {len(batch)} dropped after {attempt + 1} attempts: {e}")
+                return 0
+            self.written += inserted
+            return inserted
+        return 0
+
+    # --------------------- Lifecycle ---------------------
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and drain whatever is still buffered."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                # Shielded: stop() cancelling the loop must not abort a batch in flight.
+                await asyncio.shield(self.flush())
+            except Exception as e:
+                logger.error(f"Event log flush failed: {e}")
+
+    # --------------------- Replay ---------------------
+    @staticmethod
+    async def replay(
+        stream_id: PydanticObjectId,
+        cursor: Optional[PydanticObjectId] = None,
+        limit: int = 100,
+    ) -> Tuple[List[LiveStreamEvent], Optional[PydanticObjectId]]:
+        """Events of a stream in logging order, starting after ``cursor``."""
+        filters: dict = {"stream_id": stream_id}
+        if cursor:
+            filters["_id"] = {"$gt": cursor}
+
+        events = await LiveStreamEvent.find(filters).sort("_id").limit(limit + 1).to_list()
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = events[-1].id
+        return events, next_cursor
+
+
+event_log_writer = EventLogWriter()
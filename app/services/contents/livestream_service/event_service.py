@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Optional, Iterable, List
 
 from beanie import PydanticObjectId
 
-from app.crud.content.livestream_cruds.livestream_event_crud import event_crud
+from app.models import LiveStreamEvent
+from app.services.contents.livestream_service.event_log import event_log_writer
 
 
 class EventSrvice:
@@ -15,11 +16,37 @@ class EventSrvice:
         target_id: Optional[PydanticObjectId] = None,
         reason: Optional[str] = None
     ):
-        """Log moderation or action event."""
-        return await event_crud.create(
+        """Log moderation or action event (buffered, written in batches)."""
+        event = LiveStreamEvent(
             stream_id=stream_id,
             actor_id=actor_id,
             target_id=target_id,
             event_type=event_type,
             reason=reason
         )
+        await event_log_writer.append(event)
+        return event
+
+    @staticmethod
+    async def log_events(
+        stream_id: PydanticObjectId,
+        actor_id: PydanticObjectId,
+        event_type: str,
+        target_ids: Iterable[PydanticObjectId],
+        reason: Optional[str] = None
+    ) -> List[LiveStreamEvent]:
+        """Log the same moderation action against many targets in one batch."""
+        events = [
+            LiveStreamEvent(
+                stream_id=stream_id,
+                actor_id=actor_id,
+                target_id=target_id,
+                event_type=event_type,
+                reason=reason,
+            )
+            for target_id in target_ids
+        ]
+        await event_log_writer.append(*events)
+        return events
+
+event_service = EventSrvice()
@@ -0,0 +1,87 @@
+from typing import Dict, FrozenSet
+
+from beanie import PydanticObjectId, UpdateResponse
+
+from app.core.response.exceptions import Exceptions
+from app.core.websocket.bus import broadcast_bus
+from app.crud import live_stream_crud
+from app.crud.content.livestream_cruds.participant_crud import participant_crud
+from app.models import LiveStream, StreamStatus, utc_now
+from app.services.contents.livestream_service.active_streams import active_stream_directory
+from app.services.contents.livestream_service.participant_cache import participant_cache
+
+# Target status -> statuses it may be entered from.
+TRANSITIONS: Dict[StreamStatus, FrozenSet[StreamStatus]] = {
+    StreamStatus.LIVE: frozenset({StreamStatus.CREATED}),
+    StreamStatus.ENDED: frozenset({StreamStatus.CREATED, StreamStatus.LIVE}),
+    StreamStatus.PROCESSING: frozenset({StreamStatus.ENDED}),
+    StreamStatus.READY: frozenset({StreamStatus.PROCESSING}),
+    StreamStatus.ERROR: frozenset({StreamStatus.LIVE, StreamStatus.PROCESSING}),
+}
+
+
+class StreamLifecycle:
+    """
+    Stream status state machine.
+
+    Each transition is a single conditional ``find_one_and_update`` that only
+    matches when the stream is in an allowed source state, so concurrent
+    double-starts or out-of-order transitions lose atomically.
+    """
+
+    @staticmethod
+    async def transition(
+        stream_id: PydanticObjectId,
+        to_status: StreamStatus,
+        **fields,
+    ) -> LiveStream:
+        """Move a stream to ``to_status`` or raise 404/409."""
+        allowed = TRANSITIONS.get(to_status)
+        if not allowed:
+            raise Exceptions.bad_request(f"Unknown target status: {to_status}")
+
+        stream = await LiveStream.find_one(
+            {"_id": stream_id, "status": {"$in": list(allowed)}}
+        ).update(
+            {"$set": {"status": to_status, "updated_at": utc_now(), **fields}},
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+
+        if stream is None:
+            # Slow path only: tell "missing" apart from "wrong state".
+            current = await live_stream_crud.get(stream_id)
+            if not current:
+                raise Exceptions.not_found("LiveStream")
+            raise Exceptions.conflict(
+                f"Cannot move stream from {current.status.value} to {to_status.value}"
+            )
+
+        await active_stream_directory.sync(stream)
+        await broadcast_bus.publish(stream_id, {
+            "type": "lifecycle",
+            "stream_id": str(stream_id),
+            "status": to_status.value,
+        })
+        return stream
+
+    @classmethod
+    async def start(cls, stream_id: PydanticObjectId) -> LiveStream:
+        """CREATED → LIVE, then warm the participant cache."""
+        stream = await cls.transition(stream_id, StreamStatus.LIVE, started_at=utc_now())
+        participants = await participant_crud.model.find({"stream_id": stream_id}).to_list()
+        await participant_cache.load(stream_id, participants)
+        return stream
+
+    @classmethod
+    async def end(cls, stream_id: PydanticObjectId) -> LiveStream:
+        """CREATED/LIVE → ENDED, then drop the participant cache."""
+        stream = await cls.transition(stream_id, StreamStatus.ENDED, ended_at=utc_now())
+        await participant_cache.drop(stream_id)
+        return stream
+
+    @staticmethod
+    def can_transition(from_status: StreamStatus, to_status: StreamStatus) -> bool:
+        return from_status in TRANSITIONS.get(to_status, frozenset())
+
+
+stream_lifecycle = StreamLifecycle()
@@ -1,9 +1,13 @@
+import asyncio
+
 from beanie import PydanticObjectId
-from typing import  Optional
+from typing import  Optional, List, Tuple
 from app.crud import live_stream_crud
 from app.crud.content.livestream_cruds.livestream_anaytics_crud import analytics_crud
 from app.crud.content.livestream_cruds.participant_crud import participant_crud
-from app.models import LiveStream, StreamStatus, ParticipantRole, utc_now
+from app.models import LiveStream, StreamStatus, ParticipantRole
+from app.services.contents.livestream_service.active_streams import active_stream_directory
+from app.services.contents.livestream_service.lifecycle import stream_lifecycle
 
 
 class LiveStreamService:
@@ -19,49 +23,76 @@ class LiveStreamService:
         visibility=LiveStream.visibility,
         is_recorded=True,
     ) -> LiveStream:
-        """Create a new live stream and add the owner as participant."""
-        stream = await live_stream_crud.create(
-            streamer_id=streamer_id,
-            zawiya_id=zawiya_id,
-            title=title,
-            description=description,
-            stream_type=stream_type,
-            visibility=visibility,
-            is_recorded=is_recorded,
-            status=StreamStatus.CREATED,
-        )
+        """
+        Create a new live stream, add the owner as participant and initialize analytics.
 
-        # Add owner as participant with full permissions
-        await participant_crud.create(
-            stream_id=stream.id,
-            user_id=streamer_id,
-            role=ParticipantRole.OWNER,
-            can_publish_audio=True,
-            can_publish_video=True,
-            can_share_screen=True,
+        The stream id is allocated up front so the three inserts run concurrently;
+        if any of them fails the others are rolled back.
+        """
+        stream_id = PydanticObjectId()
+
+        results = await asyncio.gather(
+            live_stream_crud.create(
+                id=stream_id,
+                streamer_id=streamer_id,
+                user_id=streamer_id,
+                zawiya_id=zawiya_id,
+                title=title,
+                description=description,
+                stream_type=stream_type,
+                visibility=visibility,
+                is_recorded=is_recorded,
+                status=StreamStatus.CREATED,
+            ),
+            # Add owner as participant with full permissions
+            participant_crud.create(
+                stream_id=stream_id,
+                user_id=streamer_id,
+                role=ParticipantRole.OWNER,
+                can_publish_audio=True,
+                can_publish_video=True,
+                can_share_screen=True,
+            ),
+            analytics_crud.create(stream_id=stream_id),
+            return_exceptions=True,
         )
 
-        # Initialize analytics
-        await analytics_crud.create(stream_id=stream.id)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await asyncio.gather(
+                live_stream_crud.model.find({"_id": stream_id}).delete(),
+                participant_crud.model.find({"stream_id": stream_id}).delete(),
+                analytics_crud.model.find({"stream_id": stream_id}).delete(),
+                return_exceptions=True,
+            )
+            raise errors[0]
 
+        stream = results[0]
+        await active_stream_directory.sync(stream)
         return stream
 
     @staticmethod
     async def start_stream(stream_id: PydanticObjectId):
-        """Set stream as LIVE and record start time."""
-        return await live_stream_crud.update(stream_id, {"status": StreamStatus.LIVE, "started_at": utc_now()})
+        """Set stream as LIVE and record start time (only from CREATED)."""
+        return await stream_lifecycle.start(stream_id)
 
     @staticmethod
     async def end_stream(stream_id: PydanticObjectId):
         """Set stream as ENDED and record end time."""
-        return await live_stream_crud.update(stream_id, {"status": StreamStatus.ENDED, "ended_at": utc_now()})
+        return await stream_lifecycle.end(stream_id)
 
 
     # --------------------- Fetch Active Streams ---------------------
     @staticmethod
-    async def get_active_streams(zawiya_id: Optional[PydanticObjectId] = None):
-        """Return streams that are LIVE or CREATED (not ended)."""
-        filters = {"status": {"$in": [StreamStatus.CREATED, StreamStatus.LIVE]}}
-        if zawiya_id:
-            filters["zawiya_id"] = zawiya_id
-        return await live_stream_crud.get_multi(filters=filters)
+    async def get_active_streams(
+        zawiya_id: Optional[PydanticObjectId] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+    ) -> Tuple[List[LiveStream], Optional[str]]:
+        """
+        Return one page of streams that are LIVE or CREATED (not ended) and the next cursor.
+
+        Served from the Redis active-stream directory; falls back to MongoDB
+        on the (status, zawiya_id, started_at) index.
+        """
+        return await active_stream_directory.page(zawiya_id=zawiya_id, cursor=cursor, limit=limit)
@@ -0,0 +1,139 @@
+import json
+import logging
+from typing import Dict, Iterable, Optional
+
+from beanie import PydanticObjectId
+
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+from app.models import LiveStreamParticipant, ParticipantRole
+
+logger = logging.getLogger(__name__)
+
+# Marker field proving the hash was loaded, so a missing user field means
+# "not a participant" rather than "cache cold".
+_LOADED = "__loaded__"
+
+# KEYS[1] = stream hash; ARGV = TTL, loaded marker, then field/value pairs.
+# Checks and writes in one step, so a concurrent drop cannot be undone.
+_PUT_IF_LOADED = """
+if redis.call('HEXISTS', KEYS[1], ARGV[2]) == 0 then
+  return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+_PUT_CHUNK = 1000
+
+
+class ParticipantCache:
+    """
+    Per-stream Redis hash of ``user_id -> role and permission flags``.
+
+    The hash is loaded when a stream goes live, kept in sync write-through by
+    the participant mutations and dropped when the stream ends (or, as a
+    backstop, after ``PARTICIPANT_CACHE_TTL_SECONDS`` without writes). Every
+    method is a no-op (or returns ``None``) when Redis is not connected so
+    callers can fall back to MongoDB.
+    """
+
+    FIELDS = (
+        "role",
+        "can_publish_audio",
+        "can_publish_video",
+        "can_share_screen",
+        "is_muted",
+        "is_banned",
+    )
+
+    @staticmethod
+    def _key(stream_id: PydanticObjectId) -> str:
+        return f"livestream:{stream_id}:participants"
+
+    @classmethod
+    def _serialize(cls, participant: LiveStreamParticipant) -> str:
+        data = {field: getattr(participant, field) for field in cls.FIELDS}
+        data["role"] = ParticipantRole(data["role"]).value
+        return json.dumps(data, separators=(",", ":"))
+
+    # --------------------- Lifecycle ---------------------
+    @classmethod
+    async def load(cls, stream_id: PydanticObjectId, participants: Iterable[LiveStreamParticipant]) -> None:
+        """Replace the stream hash with the given participants in one pipeline."""
+        if not redis_client.available:
+            return
+
+        mapping = {str(p.user_id): cls._serialize(p) for p in participants}
+        mapping[_LOADED] = "1"
+
+        key = cls._key(stream_id)
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, settings.PARTICIPANT_CACHE_TTL_SECONDS)
+            await pipe.execute()
+
+    @classmethod
+    async def drop(cls, stream_id: PydanticObjectId) -> None:
+        if not redis_client.available:
+            return
+        await redis_client.client.delete(cls._key(stream_id))
+
+    # --------------------- Write-through ---------------------
+    @classmethod
+    async def put(cls, participant: LiveStreamParticipant) -> None:
+        """Write a participant into the hash if the stream is cached."""
+        await cls.put_many(participant.stream_id, [participant])
+
+    @classmethod
+    async def put_many(cls, stream_id: PydanticObjectId, participants: Iterable[LiveStreamParticipant]) -> None:
+        if not redis_client.available:
+            return
+
+        mapping = {str(p.user_id): cls._serialize(p) for p in participants}
+        if not mapping:
+            return
+
+        # Only touch streams that are already loaded; never resurrect a dropped hash.
+        # Chunked to stay well inside Lua's unpack() limit on bulk moderation.
+        items = list(mapping.items())
+        for start in range(0, len(items), _PUT_CHUNK):
+            args = [settings.PARTICIPANT_CACHE_TTL_SECONDS, _LOADED]
+            for field, value in items[start:start + _PUT_CHUNK]:
+                args += [field, value]
+            if not await redis_client.client.eval(_PUT_IF_LOADED, 1, cls._key(stream_id), *args):
+                return
+
+    @classmethod
+    async def remove(cls, stream_id: PydanticObjectId, user_id: PydanticObjectId) -> None:
+        await cls.remove_many(stream_id, [user_id])
+
+    @classmethod
+    async def remove_many(cls, stream_id: PydanticObjectId, user_ids: Iterable[PydanticObjectId]) -> None:
+        if not redis_client.available:
+            return
+        fields = [str(user_id) for user_id in user_ids]
+        if fields:
+            await redis_client.client.hdel(cls._key(stream_id), *fields)
+
+    # --------------------- Reads ---------------------
+    @classmethod
+    async def get(cls, stream_id: PydanticObjectId, user_id: PydanticObjectId) -> Optional[Dict]:
+        """
+        Return the cached permission dict for a participant.
+
+        Raises ``LookupError`` when the stream is not cached so the caller
+        knows to fall back to MongoDB. Returns ``None`` when the stream is
+        cached but the user is not a participant.
+        """
+        if not redis_client.available:
+            raise LookupError(stream_id)
+
+        value, loaded = await redis_client.client.hmget(cls._key(stream_id), str(user_id), _LOADED)
+        if not loaded:
+            raise LookupError(stream_id)
+        return json.loads(value) if value else None
+
+
+participant_cache = ParticipantCache()
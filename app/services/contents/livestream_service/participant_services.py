@@ -1,7 +1,30 @@
+from typing import Optional, Dict, List
+
 from beanie import PydanticObjectId
 
+from app.core.websocket.bus import broadcast_bus
 from app.crud.content.livestream_cruds.participant_crud import participant_crud
-from app.models import ParticipantRole, LiveStreamParticipant
+from app.models import ParticipantRole, LiveStreamParticipant, LiveStreamEventType
+from app.services.contents.livestream_service.event_service import event_service
+from app.services.contents.livestream_service.participant_cache import participant_cache
+
+# Flag changes applied by each bulk moderation action (kick removes the row instead).
+BULK_ACTIONS: Dict[LiveStreamEventType, Dict[str, bool]] = {
+    LiveStreamEventType.mute: {"is_muted": True},
+    LiveStreamEventType.unmute: {"is_muted": False},
+    LiveStreamEventType.ban: {"is_banned": True},
+    LiveStreamEventType.unban: {"is_banned": False},
+    LiveStreamEventType.kick: {},
+}
+
+# Moderators can only act on participants ranked strictly below them.
+ROLE_RANK: Dict[ParticipantRole, int] = {
+    ParticipantRole.OWNER: 3,
+    ParticipantRole.CO_HOST: 2,
+    ParticipantRole.SPEAKER: 1,
+    ParticipantRole.VIEWER: 0,
+}
+MODERATOR_ROLES = (ParticipantRole.OWNER, ParticipantRole.CO_HOST)
 
 
 class ParticipantService:
@@ -17,7 +40,7 @@ class ParticipantService:
         can_share_screen=False,
     ) -> LiveStreamParticipant:
         """Add participant to a live stream with permissions."""
-        return await participant_crud.create(
+        participant = await participant_crud.create(
             stream_id=stream_id,
             user_id=user_id,
             role=role,
@@ -25,60 +48,159 @@ class ParticipantService:
             can_publish_video=can_publish_video,
             can_share_screen=can_share_screen,
         )
+        await participant_cache.put(participant)
+        return participant
 
     @staticmethod
     async def remove_participant(stream_id: PydanticObjectId, user_id: PydanticObjectId):
         """Remove participant from stream."""
         await participant_crud.delete_by_filter(stream_id=stream_id, user_id=user_id)
+        await participant_cache.remove(stream_id, user_id)
 
     @staticmethod
     async def promote_participant(stream_id: PydanticObjectId, user_id: PydanticObjectId, role: ParticipantRole):
         """Promote or change participant role (e.g., viewer → co-host)."""
-        participant = await participant_crud.get_one(stream_id=stream_id, user_id=user_id)
+        changes = {"role": role}
+        if role in [ParticipantRole.OWNER, ParticipantRole.CO_HOST]:
+            changes.update(can_publish_audio=True, can_publish_video=True, can_share_screen=True)
+        return await ParticipantService._set_flag(stream_id, user_id, **changes)
+
+    @staticmethod
+    async def _set_flag(stream_id: PydanticObjectId, user_id: PydanticObjectId, **flags):
+        participant = await participant_crud.update_by_filter(
+            {"stream_id": stream_id, "user_id": user_id}, flags
+        )
         if participant:
-            participant.role = role
-            if role in [ParticipantRole.OWNER, ParticipantRole.CO_HOST]:
-                participant.can_publish_audio = True
-                participant.can_publish_video = True
-                participant.can_share_screen = True
-            await participant.save()
-            return participant
-        return None
+            await participant_cache.put(participant)
+        return participant
 
     @staticmethod
     async def mute_participant(stream_id: PydanticObjectId, user_id: PydanticObjectId):
-        participant = await participant_crud.get_one(stream_id=stream_id, user_id=user_id)
-        if participant:
-            participant.is_muted = True
-            await participant.save()
-            return participant
-        return None
+        return await ParticipantService._set_flag(stream_id, user_id, is_muted=True)
 
     @staticmethod
     async def unmute_participant(stream_id: PydanticObjectId, user_id: PydanticObjectId):
-        participant = await participant_crud.get_one(stream_id=stream_id, user_id=user_id)
-        if participant:
-            participant.is_muted = False
-            await participant.save()
-            return participant
-        return None
+        return await ParticipantService._set_flag(stream_id, user_id, is_muted=False)
 
     @staticmethod
     async def ban_participant(stream_id: PydanticObjectId, user_id: PydanticObjectId):
-        participant = await participant_crud.get_one(stream_id=stream_id, user_id=user_id)
-        if participant:
-            participant.is_banned = True
-            await participant.save()
-            return participant
-        return None
+        return await ParticipantService._set_flag(stream_id, user_id, is_banned=True)
 
     @staticmethod
     async def unban_participant(stream_id: PydanticObjectId, user_id: PydanticObjectId):
+        return await ParticipantService._set_flag(stream_id, user_id, is_banned=False)
+
+    # --------------------- Bulk Moderation ---------------------
+    @staticmethod
+    async def bulk_moderate(
+        stream_id: PydanticObjectId,
+        actor_id: PydanticObjectId,
+        action: LiveStreamEventType,
+        user_ids: List[PydanticObjectId],
+        reason: Optional[str] = None,
+    ) -> List[PydanticObjectId]:
+        """
+        Apply one moderation action to many participants at once.
+
+        The actor must be an unbanned owner or co-host, and only participants
+        ranked below the actor are touched (a co-host cannot moderate another
+        co-host or the owner). One read selects the targets, one
+        ``update_many``/``delete_many`` applies the change, one ``insert_many``
+        logs the events and a single control message goes to connected clients.
+        Returns the ids of the participants that were actually moderated.
+        """
+        if action not in BULK_ACTIONS:
+            raise ValueError(f"Unsupported bulk action: {action}")
+
+        actor = await ParticipantService.get_permissions(stream_id, actor_id)
+        if not actor or actor["is_banned"] or ParticipantRole(actor["role"]) not in MODERATOR_ROLES:
+            raise PermissionError("Only the owner or a co-host can moderate")
+        actor_rank = ROLE_RANK[ParticipantRole(actor["role"])]
+
+        targets = await participant_crud.model.find({
+            "stream_id": stream_id,
+            "user_id": {"$in": list(set(user_ids) - {actor_id})},
+            "role": {"$in": [role for role, rank in ROLE_RANK.items() if rank < actor_rank]},
+        }).to_list()
+        if not targets:
+            return []
+
+        target_ids = [p.user_id for p in targets]
+        query = participant_crud.model.find({"stream_id": stream_id, "user_id": {"$in": target_ids}})
+        flags = BULK_ACTIONS[action]
+
+        if action == LiveStreamEventType.kick:
+            await query.delete_many()
+            await participant_cache.remove_many(stream_id, target_ids)
+        else:
+            await query.update_many({"$set": flags})
+            for participant in targets:
+                for k, v in flags.items():
+                    setattr(participant, k, v)
+            await participant_cache.put_many(stream_id, targets)
+
+        await event_service.log_events(stream_id, actor_id, action, target_ids, reason)
+        await broadcast_bus.publish(stream_id, {
+            "type": "moderation",
+            "action": action.value,
+            "user_ids": [str(user_id) for user_id in target_ids],
+            "reason": reason,
+        })
+        return target_ids
+
+    # --------------------- Permission Checks ---------------------
+    @staticmethod
+    async def get_permissions(stream_id: PydanticObjectId, user_id: PydanticObjectId) -> Optional[Dict]:
+        """
+        Return the participant's role and flags.
+
+        Live streams answer from the Redis hash with a single read; anything
+        else (stream not live, Redis down) falls back to MongoDB.
+        """
+        try:
+            return await participant_cache.get(stream_id, user_id)
+        except LookupError:
+            pass
+
         participant = await participant_crud.get_one(stream_id=stream_id, user_id=user_id)
-        if participant:
-            participant.is_banned = False
-            await participant.save()
-            return participant
-        return None
+        if not participant:
+            return None
+        return {field: getattr(participant, field) for field in participant_cache.FIELDS}
+
+    @staticmethod
+    async def is_banned(stream_id: PydanticObjectId, user_id: PydanticObjectId) -> bool:
+        perms = await ParticipantService.get_permissions(stream_id, user_id)
+        return bool(perms and perms["is_banned"])
+
+    @staticmethod
+    async def is_muted(stream_id: PydanticObjectId, user_id: PydanticObjectId) -> bool:
+        perms = await ParticipantService.get_permissions(stream_id, user_id)
+        return bool(perms and perms["is_muted"])
+
+    @staticmethod
+    async def can_publish(
+        stream_id: PydanticObjectId,
+        user_id: PydanticObjectId,
+        kind: str = "video",
+    ) -> bool:
+        """Check whether a participant may publish ``audio``, ``video`` or ``screen``."""
+        return ParticipantService.may_publish(await ParticipantService.get_permissions(stream_id, user_id), kind)
+
+    @staticmethod
+    def may_publish(perms: Optional[Dict], kind: str = "video") -> bool:
+        """``can_publish`` on permissions already read with ``get_permissions``."""
+        if not perms or perms["is_banned"]:
+            return False
+        if kind == "audio":
+            return bool(perms["can_publish_audio"] and not perms["is_muted"])
+        if kind == "screen":
+            return bool(perms["can_share_screen"])
+        return bool(perms["can_publish_video"])
+
+    @staticmethod
+    async def has_role(stream_id: PydanticObjectId, user_id: PydanticObjectId, *roles: ParticipantRole) -> bool:
+        """Whether the participant holds one of ``roles`` and is not banned."""
+        perms = await ParticipantService.get_permissions(stream_id, user_id)
+        return bool(perms and not perms["is_banned"] and ParticipantRole(perms["role"]) in roles)
 
 participant_service = ParticipantService()
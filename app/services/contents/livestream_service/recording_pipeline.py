@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import mimetypes
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import aiofiles
+from beanie import UpdateResponse
+
+from app.core.processing.video.hls import HLSPackager
+from app.core.storage import storage
+from app.core.storage.base import StorageBackend
+from app.core.utils.settings import settings
+from app.crud.content.livestream_cruds.recording_crud import recording_crud
+from app.models import Recording, RecordingStatus, utc_now
+
+logger = logging.getLogger(__name__)
+
+_CONTENT_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".ts": "video/mp2t",
+    ".jpg": "image/jpeg",
+}
+
+
+class RecordingPipeline:
+    """
+    Post-processing worker for finished recordings.
+
+    Claims PENDING recordings atomically (PENDING → PROCESSING), transcodes
+    them into an HLS ladder with ffmpeg, extracts a thumbnail and
+    duration/size metadata, uploads every output file to the storage
+    backend concurrently and finally marks the recording COMPLETED or
+    FAILED. ``concurrency`` bounds recordings in flight per worker and
+    ``upload_concurrency`` bounds parallel uploads per recording.
+
+    A claim is a lease: the worker renews ``claimed_at`` while it works, so a
+    recording left in PROCESSING by a crashed worker is claimed again once
+    the lease is ``RECORDING_CLAIM_TIMEOUT_SECONDS`` old, up to
+    ``RECORDING_MAX_ATTEMPTS`` times before it is marked FAILED. A worker
+    whose lease was taken over stops processing, and its final COMPLETED /
+    FAILED write only applies while it still holds the claim (same
+    ``attempts``), so it never overwrites the new owner's result.
+    """
+
+    def __init__(
+        self,
+        backend: StorageBackend = storage,
+        concurrency: Optional[int] = None,
+        upload_concurrency: Optional[int] = None,
+    ):
+        self.backend = backend
+        self.concurrency = concurrency or settings.RECORDING_WORKER_CONCURRENCY
+        self.upload_concurrency = upload_concurrency or settings.RECORDING_UPLOAD_CONCURRENCY
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._stopping = asyncio.Event()
+
+    # --------------------- Claiming ---------------------
+    @staticmethod
+    def _stale_claim(cutoff) -> dict:
+        # Also matches PROCESSING documents claimed before claimed_at existed.
+        return {"status": RecordingStatus.PROCESSING, "claimed_at": {"$not": {"$gte": cutoff}}}
+
+    @classmethod
+    async def claim(cls) -> Optional[Recording]:
+        """
+        Atomically take a PENDING recording, or one whose PROCESSING lease
+        has lapsed, so no two workers process the same one.
+        """
+        now = utc_now()
+        cutoff = now - timedelta(seconds=settings.RECORDING_CLAIM_TIMEOUT_SECONDS)
+        await recording_crud.update_many(
+            {**cls._stale_claim(cutoff), "attempts": {"$gte": settings.RECORDING_MAX_ATTEMPTS}},
+            {
+                "status": RecordingStatus.FAILED,
+                "error": f"Abandoned after {settings.RECORDING_MAX_ATTEMPTS} processing attempts",
+            },
+        )
+        return await Recording.find_one(
+            {"$or": [{"status": RecordingStatus.PENDING}, cls._stale_claim(cutoff)]},
+        ).update(
+            {
+                "$set": {
+                    "status": RecordingStatus.PROCESSING,
+                    "processing_started_at": now,
+                    "claimed_at": now,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+
+    @staticmethod
+    def _held(recording: Recording) -> Dict[str, Any]:
+        """Filter matching the recording only while this worker's claim stands."""
+        return {"_id": recording.id, "status": RecordingStatus.PROCESSING, "attempts": recording.attempts}
+
+    @classmethod
+    async def _renew_claim(cls, recording: Recording, work: asyncio.Task) -> None:
+        """Keep the lease fresh while processing; cancels ``work`` if another worker took the recording over."""
+        while True:
+            await asyncio.sleep(settings.RECORDING_CLAIM_TIMEOUT_SECONDS / 3)
+            renewed = await recording_crud.update_one(cls._held(recording), {"$set": {"claimed_at": utc_now()}})
+            if not renewed:
+                logger.warning(f"Recording {recording.id}: claim lost to another worker, stopping")
+                work.cancel()
+                return
+
+    @classmethod
+    async def _finish(cls, recording: Recording, fields: Dict[str, Any]) -> bool:
+        """Record the outcome if the claim is still ours; False if it was taken over meanwhile."""
+        if await recording_crud.update_by_filter(cls._held(recording), fields) is None:
+            logger.warning(f"Recording {recording.id}: claim lost, {fields['status'].value} result discarded")
+            return False
+        return True
+
+    # --------------------- Processing ---------------------
+    async def process(self, recording: Recording) -> None:
+        work = asyncio.create_task(self._process(recording))
+        lease = asyncio.create_task(self._renew_claim(recording, work))
+        try:
+            await self._finish(recording, await work)
+        except asyncio.CancelledError:
+            if not lease.done():
+                raise  # the worker itself is shutting down
+            # Claim lost: the new owner records the outcome.
+        except Exception as e:
+            logger.error(f"Recording {recording.id} failed: {e}")
+            await self._finish(recording, {"status": RecordingStatus.FAILED, "error": str(e)[:1000]})
+        finally:
+            lease.cancel()
+
+    async def _process(self, recording: Recording) -> Dict[str, Any]:
+        """Package and upload the recording; returns the COMPLETED fields to record."""
+        prefix = f"recordings/{recording.stream_id}/{recording.id}"
+
+        with tempfile.TemporaryDirectory(prefix="recording-") as tmp:
+            workdir = Path(tmp)
+            source = workdir / f"source.{recording.format}"
+            await self.backend.download_to(recording.storage_path, source)
+
+            info = await asyncio.to_thread(HLSPackager.probe, source, settings.RECORDING_PROBE_TIMEOUT_SECONDS)
+            renditions = HLSPackager.ladder_for(info.height)
+            hls_dir = workdir / "hls"
+            thumb_at = min(1.0, (info.duration_seconds or 0) / 2)
+
+            await asyncio.gather(
+                asyncio.to_thread(
+                    HLSPackager.package, source, hls_dir, renditions, info.has_audio,
+                    settings.RECORDING_HLS_SEGMENT_SECONDS, settings.RECORDING_FFMPEG_THREADS,
+                    settings.RECORDING_FFMPEG_TIMEOUT_SECONDS,
+                ),
+                asyncio.to_thread(
+                    HLSPackager.thumbnail, source, workdir / "thumbnail.jpg", thumb_at,
+                    timeout=settings.RECORDING_PROBE_TIMEOUT_SECONDS,
+                ),
+            )
+
+            await self._upload_dir(hls_dir, f"{prefix}/hls")
+            thumbnail_key = f"{prefix}/thumbnail.jpg"
+            await self._upload_file(workdir / "thumbnail.jpg", thumbnail_key)
+
+        logger.info(f"Recording {recording.id} packaged into {len(renditions)} renditions")
+        return {
+            "status": RecordingStatus.COMPLETED,
+            "duration_seconds": int(info.duration_seconds) if info.duration_seconds else None,
+            "size_bytes": info.size_bytes,
+            "hls_playlist_path": f"{prefix}/hls/master.m3u8",
+            "thumbnail_path": thumbnail_key,
+            "completed_at": utc_now(),
+            "error": None,
+        }
+
+    async def _upload_dir(self, root: Path, key_prefix: str) -> None:
+        sem = asyncio.Semaphore(self.upload_concurrency)
+
+        async def _run(path: Path):
+            async with sem:
+                await self._upload_file(path, f"{key_prefix}/{path.relative_to(root).as_posix()}")
+
+        await asyncio.gather(*(_run(p) for p in root.rglob("*") if p.is_file()))
+
+    async def _upload_file(self, path: Path, key: str) -> None:
+        async with aiofiles.open(path, "rb") as f:
+            data = await f.read()
+        content_type = _CONTENT_TYPES.get(path.suffix) or mimetypes.guess_type(path.name)[0]
+        await self.backend.upload(data, key, content_type=content_type)
+
+    # --------------------- Worker Loop ---------------------
+    async def run(self) -> None:
+        """Keep up to ``concurrency`` recordings in flight until ``stop`` is called."""
+        tasks: set[asyncio.Task] = set()
+        while not self._stopping.is_set():
+            await self._slots.acquire()
+            recording = await self.claim()
+            if recording is None:
+                self._slots.release()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), settings.RECORDING_POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            task = asyncio.create_task(self.process(recording))
+            tasks.add(task)
+            task.add_done_callback(lambda t: (tasks.discard(t), self._slots.release()))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+
+async def main() -> None:
+    from app.core.utils.database import mongodb
+
+    await mongodb.connect()
+    pipeline = RecordingPipeline()
+    try:
+        await pipeline.run()
+    finally:
+        await mongodb.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    asyncio.run(main())
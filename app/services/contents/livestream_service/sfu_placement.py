@@ -0,0 +1,139 @@
+import logging
+import secrets
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from app.core.response.exceptions import Exceptions
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+from app.models import SFUType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SFUNodeLoad:
+    """Load report sent by an SFU node on every heartbeat."""
+    node_id: str
+    url: str
+    sfu_types: List[SFUType]
+    rooms: int = 0
+    peers: int = 0
+    bitrate_kbps: int = 0
+    max_rooms: int = field(default_factory=lambda: settings.SFU_NODE_MAX_ROOMS)
+    max_peers: int = field(default_factory=lambda: settings.SFU_NODE_MAX_PEERS)
+    max_bitrate_kbps: int = field(default_factory=lambda: settings.SFU_NODE_MAX_BITRATE_KBPS)
+
+    @property
+    def utilization(self) -> float:
+        """Highest saturation across rooms, peers and bitrate (1.0 = full)."""
+        return max(
+            self.rooms / max(self.max_rooms, 1),
+            self.peers / max(self.max_peers, 1),
+            self.bitrate_kbps / max(self.max_bitrate_kbps, 1),
+        )
+
+
+@dataclass
+class SFUPlacement:
+    node_id: str
+    url: str
+    sfu_type: SFUType
+    sfu_room_id: str
+
+
+class SFUPlacementService:
+    """
+    Assigns new rooms to the least-loaded SFU node.
+
+    Each node's latest load report lives in ``sfu:node:{node_id}`` (expiring
+    with the heartbeat TTL) and its utilization is the score in one sorted
+    set per supported ``SFUType``. Placement reads the lowest-scored live
+    node and bumps its score so concurrent placements spread out before the
+    next heartbeat arrives.
+    """
+
+    SIMULATED_NODE = "sim-local"
+
+    @staticmethod
+    def _node(node_id: str) -> str:
+        return f"sfu:node:{node_id}"
+
+    @staticmethod
+    def _pool(sfu_type: SFUType) -> str:
+        return f"sfu:nodes:{SFUType(sfu_type).value}"
+
+    # --------------------- Heartbeats ---------------------
+    async def report(self, load: SFUNodeLoad) -> float:
+        """Store a node's load report and return its utilization."""
+        if not redis_client.available:
+            raise Exceptions.service_unavailable("SFU placement requires Redis")
+
+        utilization = load.utilization
+        key = self._node(load.node_id)
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={
+                "url": load.url,
+                "sfu_types": ",".join(SFUType(t).value for t in load.sfu_types),
+                "rooms": load.rooms,
+                "peers": load.peers,
+                "bitrate_kbps": load.bitrate_kbps,
+                "max_rooms": load.max_rooms,
+                "utilization": utilization,
+            })
+            pipe.expire(key, settings.SFU_HEARTBEAT_TTL_SECONDS)
+            for sfu_type in SFUType:
+                if sfu_type in load.sfu_types:
+                    pipe.zadd(self._pool(sfu_type), {load.node_id: utilization})
+                else:
+                    pipe.zrem(self._pool(sfu_type), load.node_id)
+            await pipe.execute()
+        return utilization
+
+    async def get_nodes(self, sfu_type: SFUType) -> List[Dict]:
+        """Live nodes supporting ``sfu_type``, least loaded first."""
+        if not redis_client.available:
+            return []
+        node_ids = await redis_client.client.zrange(self._pool(sfu_type), 0, -1)
+        if not node_ids:
+            return []
+        async with redis_client.client.pipeline(transaction=False) as pipe:
+            for node_id in node_ids:
+                pipe.hgetall(self._node(node_id))
+            reports = await pipe.execute()
+        return [{"node_id": node_id, **report} for node_id, report in zip(node_ids, reports) if report]
+
+    # --------------------- Placement ---------------------
+    async def assign(self, sfu_type: SFUType, room_prefix: str) -> SFUPlacement:
+        """Pick the least-loaded live node that supports ``sfu_type``."""
+        room_id = f"{room_prefix}-{secrets.token_hex(4)}"
+
+        if redis_client.available:
+            pool = self._pool(sfu_type)
+            candidates = await redis_client.client.zrange(pool, 0, 9, withscores=True)
+            for node_id, utilization in candidates:
+                if utilization >= 1.0:
+                    break
+                url, max_rooms = await redis_client.client.hmget(self._node(node_id), "url", "max_rooms")
+                if url is None:
+                    # Heartbeat expired: prune lazily.
+                    await redis_client.client.zrem(pool, node_id)
+                    continue
+                # Provisional cost of one room until the next heartbeat reports real load.
+                await redis_client.client.zincrby(pool, 1 / max(int(max_rooms or 1), 1), node_id)
+                return SFUPlacement(node_id=node_id, url=url, sfu_type=sfu_type, sfu_room_id=room_id)
+
+        if settings.SFU_SIMULATED:
+            logger.info(f"No SFU node available for {sfu_type}, using simulated SFU")
+            return SFUPlacement(
+                node_id=self.SIMULATED_NODE,
+                url=settings.SFU_SIMULATED_URL,
+                sfu_type=sfu_type,
+                sfu_room_id=room_id,
+            )
+
+        raise Exceptions.service_unavailable(f"No SFU node available for {SFUType(sfu_type).value}")
+
+
+sfu_placement_service = SFUPlacementService()
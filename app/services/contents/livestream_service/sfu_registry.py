@@ -0,0 +1,290 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from beanie import BulkWriter, PydanticObjectId
+
+from app.core.utils.redis_client import redis_client
+from app.core.utils.settings import settings
+from app.models import WebRTCPeer, WebRTCSession, utc_now
+
+logger = logging.getLogger(__name__)
+
+# HDEL each (field, value) pair of ARGV only if the field still holds that
+# value, so a leave recorded while reconcile ran is kept for the next pass.
+_HDEL_IF_UNCHANGED = """
+local removed = 0
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        removed = removed + redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return removed
+"""
+
+
+class SFURegistry:
+    """
+    Live view of SFU rooms and their peers, held in Redis.
+
+    Keys (every room key expires unless the SFU keeps heart-beating the room;
+    a new room gets ``SFU_REGISTRATION_TTL_SECONDS`` to see its first
+    heartbeat):
+        sfu:room:{room_id}        hash  session metadata
+        sfu:room:{room_id}:peers  hash  peer_id -> peer state JSON
+        sfu:room:{room_id}:left   hash  peer_id -> disconnect timestamp
+        sfu:dirty                 set   rooms with state not yet in MongoDB
+
+    Publish-state signals only touch Redis; ``reconcile`` periodically folds
+    the dirty rooms into ``WebRTCPeer`` documents with one bulk write.
+    """
+
+    DIRTY = "sfu:dirty"
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _room(room_id: str) -> str:
+        return f"sfu:room:{room_id}"
+
+    @staticmethod
+    def _peers(room_id: str) -> str:
+        return f"sfu:room:{room_id}:peers"
+
+    @staticmethod
+    def _left(room_id: str) -> str:
+        return f"sfu:room:{room_id}:left"
+
+    @property
+    def ttl(self) -> int:
+        return settings.SFU_HEARTBEAT_TTL_SECONDS
+
+    def _expire_room(self, pipe, room_id: str, ttl: Optional[int] = None) -> None:
+        """Queue an expiry on every key of the room (a no-op for keys not created yet)."""
+        for key in (self._room(room_id), self._peers(room_id), self._left(room_id)):
+            pipe.expire(key, ttl or self.ttl)
+
+    def _expire_peer_keys(self, pipe, room_id: str) -> None:
+        """
+        Peer writes renew the peer hashes with the registration lease, so
+        they survive until the room's first heartbeat. Only heartbeats renew
+        the room key itself, so a dead SFU's rooms still lapse on time.
+        """
+        pipe.expire(self._peers(room_id), settings.SFU_REGISTRATION_TTL_SECONDS)
+        pipe.expire(self._left(room_id), settings.SFU_REGISTRATION_TTL_SECONDS)
+
+    # --------------------- Sessions ---------------------
+    async def register_session(self, session: WebRTCSession) -> None:
+        if not redis_client.available:
+            return
+        key = self._room(session.sfu_room_id)
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={
+                "session_id": str(session.id),
+                "stream_id": str(session.stream_id),
+                "sfu_type": session.sfu_type.value if hasattr(session.sfu_type, "value") else session.sfu_type,
+            })
+            self._expire_room(pipe, session.sfu_room_id, settings.SFU_REGISTRATION_TTL_SECONDS)
+            await pipe.execute()
+
+    async def get_session_id(self, room_id: str) -> Optional[PydanticObjectId]:
+        if not redis_client.available:
+            return None
+        session_id = await redis_client.client.hget(self._room(room_id), "session_id")
+        return PydanticObjectId(session_id) if session_id else None
+
+    async def get_stream_id(self, room_id: str) -> Optional[PydanticObjectId]:
+        if not redis_client.available:
+            return None
+        stream_id = await redis_client.client.hget(self._room(room_id), "stream_id")
+        return PydanticObjectId(stream_id) if stream_id else None
+
+    async def heartbeat(self, room_ids: Iterable[str]) -> int:
+        """Refresh the TTL of every key belonging to the given rooms. Returns rooms still known."""
+        if not redis_client.available:
+            return 0
+        room_ids = list(room_ids)
+        async with redis_client.client.pipeline(transaction=False) as pipe:
+            for room_id in room_ids:
+                self._expire_room(pipe, room_id)
+            results = await pipe.execute()
+        return sum(1 for alive in results[::3] if alive)
+
+    # --------------------- Peers ---------------------
+    async def put_peer(self, room_id: str, peer: WebRTCPeer) -> None:
+        """Add or replace a peer's live state."""
+        await self._write_peer(room_id, peer.peer_id, {
+            "session_id": str(peer.session_id),
+            "user_id": str(peer.user_id),
+            "is_publishing_audio": peer.is_publishing_audio,
+            "is_publishing_video": peer.is_publishing_video,
+            "is_screen_sharing": peer.is_screen_sharing,
+            "connected_at": peer.connected_at.isoformat(),
+        })
+
+    async def update_peer_state(self, room_id: str, peer_id: str, **state: bool) -> Optional[Dict]:
+        """Apply a publish-state signal from the SFU. Returns the new state or ``None`` if unknown."""
+        peer = await self.get_peer(room_id, peer_id)
+        if peer is None:
+            return None
+        peer.update(state)
+        await self._write_peer(room_id, peer_id, peer)
+        return peer
+
+    async def _write_peer(self, room_id: str, peer_id: str, data: Dict) -> None:
+        if not redis_client.available:
+            return
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._peers(room_id), peer_id, json.dumps(data))
+            pipe.hdel(self._left(room_id), peer_id)
+            pipe.sadd(self.DIRTY, room_id)
+            self._expire_peer_keys(pipe, room_id)
+            await pipe.execute()
+
+    async def get_peer(self, room_id: str, peer_id: str) -> Optional[Dict]:
+        if not redis_client.available:
+            return None
+        value = await redis_client.client.hget(self._peers(room_id), peer_id)
+        return json.loads(value) if value else None
+
+    async def get_peers(self, room_id: str) -> Dict[str, Dict]:
+        if not redis_client.available:
+            return {}
+        peers = await redis_client.client.hgetall(self._peers(room_id))
+        return {peer_id: json.loads(value) for peer_id, value in peers.items()}
+
+    async def remove_peer(self, room_id: str, peer_id: str) -> bool:
+        if not redis_client.available:
+            return False
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            pipe.hdel(self._peers(room_id), peer_id)
+            pipe.hset(self._left(room_id), peer_id, utc_now().isoformat())
+            pipe.sadd(self.DIRTY, room_id)
+            self._expire_peer_keys(pipe, room_id)
+            removed, *_ = await pipe.execute()
+        return bool(removed)
+
+    async def close_room(self, room_id: str) -> int:
+        """
+        Drop a room reported closed by the SFU and disconnect all its peers in MongoDB.
+        Returns the number of peer documents closed.
+        """
+        session_id = await self.get_session_id(room_id)
+        if redis_client.available:
+            await redis_client.client.delete(self._room(room_id), self._peers(room_id), self._left(room_id))
+            await redis_client.client.srem(self.DIRTY, room_id)
+
+        if session_id is None:
+            session = await WebRTCSession.find_one({"sfu_room_id": room_id, "ended_at": None})
+            if not session:
+                return 0
+            session_id = session.id
+
+        now = utc_now()
+        await WebRTCSession.find({"_id": session_id}).update_many({"$set": {"ended_at": now}})
+        result = await WebRTCPeer.find(
+            {"session_id": session_id, "disconnected_at": None}
+        ).update_many({"$set": {"disconnected_at": now}})
+        return result.modified_count if result else 0
+
+    # --------------------- Reconciliation ---------------------
+    async def reconcile(self) -> int:
+        """
+        Flush live peer state of dirty rooms into ``WebRTCPeer`` documents.
+        Rooms go back into the dirty set if the bulk write fails, and leave
+        events are only cleared once it committed.
+        """
+        if not redis_client.available:
+            return 0
+
+        rooms: List[str] = await redis_client.client.spop(self.DIRTY, 500) or []
+        if not rooms:
+            return 0
+        try:
+            async with BulkWriter() as writer:
+                written, flushed_left = await self._queue_rooms(rooms, writer)
+        except Exception:
+            await redis_client.client.sadd(self.DIRTY, *rooms)
+            raise
+
+        for room_id, left in flushed_left.items():
+            await redis_client.client.eval(
+                _HDEL_IF_UNCHANGED, 1, self._left(room_id), *(v for pair in left.items() for v in pair)
+            )
+        return written
+
+    async def _queue_rooms(self, rooms: List[str], writer: BulkWriter) -> Tuple[int, Dict[str, Dict[str, str]]]:
+        """Queue the rooms' peer upserts and leave updates on ``writer``; returns the count and the leaves read."""
+        written = 0
+        flushed_left: Dict[str, Dict[str, str]] = {}
+        for room_id in rooms:
+            session_id = await self.get_session_id(room_id)
+            if session_id is None:
+                # Room expired without a close event: treat it as closed.
+                written += await self.close_room(room_id)
+                continue
+
+            for peer_id, state in (await self.get_peers(room_id)).items():
+                await WebRTCPeer.find_one(
+                    {"session_id": session_id, "peer_id": peer_id}
+                ).upsert(
+                    {"$set": {
+                        "is_publishing_audio": state["is_publishing_audio"],
+                        "is_publishing_video": state["is_publishing_video"],
+                        "is_screen_sharing": state["is_screen_sharing"],
+                        "updated_at": utc_now(),
+                    }},
+                    on_insert=WebRTCPeer(
+                        session_id=session_id,
+                        user_id=PydanticObjectId(state["user_id"]),
+                        peer_id=peer_id,
+                        is_publishing_audio=state["is_publishing_audio"],
+                        is_publishing_video=state["is_publishing_video"],
+                        is_screen_sharing=state["is_screen_sharing"],
+                        connected_at=datetime.fromisoformat(state["connected_at"]),
+                    ),
+                    bulk_writer=writer,
+                )
+                written += 1
+
+            left = await redis_client.client.hgetall(self._left(room_id))
+            for peer_id, ts in left.items():
+                await WebRTCPeer.find_one(
+                    {"session_id": session_id, "peer_id": peer_id, "disconnected_at": None}
+                ).update(
+                    {"$set": {"disconnected_at": datetime.fromisoformat(ts)}},
+                    bulk_writer=writer,
+                )
+                written += 1
+            if left:
+                flushed_left[room_id] = left
+        return written, flushed_left
+
+    async def start(self) -> None:
+        if self._task or not redis_client.available:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.reconcile()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.SFU_RECONCILE_INTERVAL_SECONDS)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"SFU reconciliation failed: {e}")
+
+
+sfu_registry = SFURegistry()
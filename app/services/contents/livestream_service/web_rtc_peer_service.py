@@ -1,21 +1,104 @@
+from typing import Dict, List, Optional
+
 from beanie import PydanticObjectId
 
+from app.core.response.exceptions import Exceptions
+from app.crud.content.livestream_cruds.web_rtc_crud import webrtc_session_crud
 from app.crud.content.livestream_cruds.web_rtc_peer_crud import webrtc_peer_crud
-from app.models import WebRTCPeer
+from app.models import WebRTCPeer, WebRTCSession, utc_now
+from app.services.contents.livestream_service.participant_services import participant_service
+from app.services.contents.livestream_service.sfu_registry import sfu_registry
+
+# Publish-state flag reported by the SFU -> publish kind checked for it.
+_PUBLISH_KINDS = {
+    "is_publishing_audio": "audio",
+    "is_publishing_video": "video",
+    "is_screen_sharing": "screen",
+}
 
 
 class WebRTCPeerService:
+    @staticmethod
+    async def _session(session_id: PydanticObjectId) -> WebRTCSession:
+        session = await webrtc_session_crud.get(session_id)
+        if not session:
+            raise Exceptions.not_found("WebRTCSession")
+        return session
+
+    @staticmethod
+    async def _room_id(session_id: PydanticObjectId) -> str:
+        return (await WebRTCPeerService._session(session_id)).sfu_room_id
+
     @staticmethod
     async def add_webrtc_peer(session_id: PydanticObjectId, user_id: PydanticObjectId, peer_id: str) -> WebRTCPeer:
-        """Register a new peer in the WebRTC session."""
-        return await webrtc_peer_crud.create(session_id=session_id, user_id=user_id, peer_id=peer_id)
+        """Register a new peer in the WebRTC session (refused for participants banned from the stream)."""
+        session = await WebRTCPeerService._session(session_id)
+        if await participant_service.is_banned(session.stream_id, user_id):
+            raise Exceptions.forbidden("Banned from this stream")
+        peer = await webrtc_peer_crud.create(session_id=session_id, user_id=user_id, peer_id=peer_id)
+        await sfu_registry.put_peer(room_id=session.sfu_room_id, peer=peer)
+        return peer
+
+    @staticmethod
+    async def update_peer_state(room_id: str, peer_id: str, **state: bool) -> Optional[Dict]:
+        """
+        Apply a publish-state signal from the SFU. Turning a kind on is
+        refused (403) unless the participant may publish it, checked with
+        one permissions read (the Redis participant hash while live).
+        Returns the new state or ``None`` if the peer is unknown.
+        """
+        peer = await sfu_registry.get_peer(room_id, peer_id)
+        if peer is None:
+            return None
+        started = [_PUBLISH_KINDS[flag] for flag, on in state.items() if on and flag in _PUBLISH_KINDS]
+        if started:
+            stream_id = await sfu_registry.get_stream_id(room_id)
+            perms = await participant_service.get_permissions(stream_id, PydanticObjectId(peer["user_id"]))
+            denied = [kind for kind in started if not participant_service.may_publish(perms, kind)]
+            if denied:
+                raise Exceptions.forbidden(f"Not allowed to publish {', '.join(denied)}")
+        return await sfu_registry.update_peer_state(room_id, peer_id, **state)
+
+    @staticmethod
+    async def get_peers(session_id: PydanticObjectId) -> List[WebRTCPeer]:
+        """
+        Connected peers of a session.
+
+        Served from the live SFU registry when the room is known there,
+        otherwise from the last reconciled ``WebRTCPeer`` documents.
+        """
+        room_id = await WebRTCPeerService._room_id(session_id)
+        live = await sfu_registry.get_peers(room_id)
+        if live:
+            docs = await webrtc_peer_crud.get_multi(
+                filters={"session_id": session_id, "peer_id": {"$in": list(live)}},
+                limit=len(live),
+            )
+            for doc in docs:
+                state = live[doc.peer_id]
+                doc.is_publishing_audio = state["is_publishing_audio"]
+                doc.is_publishing_video = state["is_publishing_video"]
+                doc.is_screen_sharing = state["is_screen_sharing"]
+            return docs
+
+        return await webrtc_peer_crud.get_multi(
+            filters={"session_id": session_id, "disconnected_at": None},
+            limit=1000,
+        )
 
     @staticmethod
-    async def get_peers(session_id: PydanticObjectId):
-        pass
+    async def get_peer(room_id: str, peer_id: str) -> Optional[dict]:
+        """O(1) live lookup of a peer by SFU room."""
+        return await sfu_registry.get_peer(room_id, peer_id)
 
     @staticmethod
-    async def remove_webrtc_peer(session_id: PydanticObjectId):
-        pass
+    async def remove_webrtc_peer(session_id: PydanticObjectId, peer_id: str) -> None:
+        """Disconnect a peer; MongoDB is updated directly if the registry is unavailable."""
+        room_id = await WebRTCPeerService._room_id(session_id)
+        if not await sfu_registry.remove_peer(room_id, peer_id):
+            await webrtc_peer_crud.update_by_filter(
+                filters={"session_id": session_id, "peer_id": peer_id, "disconnected_at": None},
+                update_data={"disconnected_at": utc_now()},
+            )
 
 web_rtc_peer_service = WebRTCPeerService()
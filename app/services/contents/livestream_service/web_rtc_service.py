@@ -1,21 +1,55 @@
+from typing import List, Optional
+
 from beanie import PydanticObjectId
 
 from app.crud.content.livestream_cruds.web_rtc_crud import webrtc_session_crud
-from app.crud.content.livestream_cruds.web_rtc_peer_crud import webrtc_peer_crud
-from app.models import WebRTCSession, WebRTCPeer
+from app.models import WebRTCSession, WebRTCPeer, SFUType
+from app.services.contents.livestream_service.sfu_placement import sfu_placement_service
+from app.services.contents.livestream_service.web_rtc_peer_service import web_rtc_peer_service
+from app.services.contents.livestream_service.sfu_registry import sfu_registry
 
 
 class WebRTCSessionService:
 
     # --------------------- WebRTC Sessions ---------------------
     @staticmethod
-    async def create_webrtc_session(stream_id: PydanticObjectId, sfu_type: str, sfu_room_id: str) -> WebRTCSession:
-        """Create a WebRTC session for the SFU."""
-        return await webrtc_session_crud.create(stream_id=stream_id, sfu_type=sfu_type, sfu_room_id=sfu_room_id)
+    async def create_webrtc_session(
+        stream_id: PydanticObjectId,
+        sfu_type: SFUType = SFUType.MEDIA_SOUP,
+        sfu_room_id: Optional[str] = None,
+    ) -> WebRTCSession:
+        """
+        Create a WebRTC session for the SFU and register its room.
+
+        Without an explicit ``sfu_room_id`` the room is placed on the
+        least-loaded SFU node that supports ``sfu_type``.
+        """
+        node_id = sfu_url = None
+        if not sfu_room_id:
+            placement = await sfu_placement_service.assign(sfu_type, room_prefix=str(stream_id))
+            sfu_room_id, node_id, sfu_url = placement.sfu_room_id, placement.node_id, placement.url
+
+        session = await webrtc_session_crud.create(
+            stream_id=stream_id,
+            sfu_type=sfu_type,
+            sfu_room_id=sfu_room_id,
+            sfu_node_id=node_id,
+            sfu_url=sfu_url,
+        )
+        await sfu_registry.register_session(session)
+        return session
+
+    @staticmethod
+    async def get_sessions(stream_id: PydanticObjectId) -> List[WebRTCSession]:
+        """List WebRTC sessions of a stream."""
+        return await webrtc_session_crud.get_multi(
+            filters={"stream_id": stream_id},
+            order_by="created_at",
+        )
 
     @staticmethod
     async def add_webrtc_peer(session_id: PydanticObjectId, user_id: PydanticObjectId, peer_id: str) -> WebRTCPeer:
         """Register a new peer in the WebRTC session."""
-        return await webrtc_peer_crud.create(session_id=session_id, user_id=user_id, peer_id=peer_id)
+        return await web_rtc_peer_service.add_webrtc_peer(session_id, user_id, peer_id)
 
-webrtc_session_service = WebRTCSessionService()
\ No newline at end of file
+webrtc_session_service = WebRTCSessionService()
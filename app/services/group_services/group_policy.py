@@ -1,11 +1,11 @@
 from app.crud.group_cruds.group_member_crud import group_member_crud
-from app.models import GroupRole
+from app.models import GroupRole, GroupMemberRole
 
 
 class GroupPolicy:
     @staticmethod
     async def has_role(group_id, user_id, *roles: GroupRole) -> bool:
-        member = await group_member_crud.get_member(group_id, user_id)
+        member = await group_member_crud.get_member(group_id, user_id, projection=GroupMemberRole)
         return bool(member and member.group_role in roles)
 
     @staticmethod
@@ -1,5 +1,9 @@
+from typing import Optional
+
+from fastapi import Request
 from pydantic import EmailStr
 
+from app.core.utils.password_hasher import password_hasher
 from app.core.utils.security import SecurityManager
 from app.core.utils.token_manager import token_manager
 from app.core.response.exceptions import Exceptions
@@ -13,7 +17,7 @@ class AdminAuthService:
     """Handles login for superuser, super_admin, and admin users."""
 
     @staticmethod
-    async def login(email: EmailStr, unique_id: str, password: str):
+    async def login(email: EmailStr, unique_id: str, password: str, request: Optional[Request] = None):
         """
         Login flow for superuser, super_admin, or admin.
 
@@ -21,6 +25,7 @@ class AdminAuthService:
             email (EmailStr): User email.
             unique_id (str): Unique ID assigned to user.
             password (str): Plain password.
+            request (Request, optional): Login request, for the session's device metadata.
 
         Returns:
             Success: Access and refresh tokens with user info.
@@ -32,13 +37,16 @@ class AdminAuthService:
         if (
             not user
             or user.user_role not in [UserRole.superuser, UserRole.super_admin, UserRole.admin]
-            or not SecurityManager.verify_password(password, user.hashed_password)
+            or not await SecurityManager.verify_password(password, user.hashed_password)
             or user.unique_id != unique_id
         ):
             SecurityManager.constant_time_compare("0.5", "i.5")
             raise Exceptions.forbidden(detail="Invalid credentials")
 
-        access_token, refresh_token = await token_manager.generate_token_pair(user)
+        if password_hasher.needs_update(user.hashed_password):
+            password_hasher.rehash_in_background(user.id, password)
+
+        access_token, refresh_token = await token_manager.generate_token_pair(user, request)
         await user_crud.update_last_login(str(user.id))
         user_dict = UserOut.model_validate(user).model_dump()
         return Success.login_success(access_token, refresh_token, user=user_dict)
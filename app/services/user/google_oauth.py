@@ -38,7 +38,7 @@ class GoogleOAuth:
         if not code:
             return await oauth.google.authorize_redirect(request, self.redirect_uri)
 
-        result = await self.exchange(code)
+        result = await self.exchange(code, request)
 
         # Encode user safely for URL
         encoded_user = self._encode(result['user'])
@@ -53,7 +53,7 @@ class GoogleOAuth:
         """
         body = await request.json()
         if "code" in body:
-            result = await self.exchange(body["code"])
+            result = await self.exchange(body["code"], request)
             return Success.login_success(
                 access_token=result['access'],
                 refresh_token=result['refresh'],
@@ -68,7 +68,7 @@ class GoogleOAuth:
         )
         return {"authorization_url": auth_url}
 
-    async def exchange(self, code: str) -> dict:
+    async def exchange(self, code: str, request: Request | None = None) -> dict:
         """
         Exchange Google auth code for access & refresh tokens.
         Returns a dict with 'access', 'refresh', 'user'.
@@ -100,7 +100,7 @@ class GoogleOAuth:
             )
 
         await user_crud.update_last_login(user.id)
-        access, refresh = await TokenManager.generate_token_pair(user)
+        access, refresh = await TokenManager.generate_token_pair(user, request)
 
         # Return plain dict with serialized user
         return {
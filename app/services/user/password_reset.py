@@ -171,17 +171,15 @@ class PasswordResetService:
 
         # Update password
         try:
-            hashed_password = SecurityManager.hash_password(new_password)
+            hashed_password = await SecurityManager.hash_password(new_password)
             user.hashed_password = hashed_password
             user.token_version += 1
             await user.save()
+            await user_crud.invalidate(user.id)
 
-            # Mark token as used
+            # Mark token as used (expired ones are purged by the maintenance scheduler)
             await password_reset_crud.mark_token_used(token)
 
-            # Clean up any expired tokens
-            await password_reset_crud.cleanup_expired_tokens()
-
             logger.info(f"Password successfully reset for user: {email}")
             return Success.ok(message="Password reset successfully")
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from fastapi import Request
 from typing import Tuple, Any
+from app.core.response.exceptions import Exceptions
 from app.core.utils.security import security_manager
 from app.core.utils.token_manager import token_manager
 from app.models.user_models import User
@@ -23,7 +24,15 @@ class RefreshService:
             Tuple[str, str, User]: (access_token, refresh_token, user)
         """
         # Extract refresh token from headers or cookies
+        old_token = await security_manager.extract_refresh_token(request)
         user = await security_manager.get_user_from_refresh_token(request)
-        access_token, refresh_token = await token_manager.generate_token_pair(user)
+
+        # Refresh tokens are single use: revoked, replayed or unknown ones are refused
+        if not await token_manager.consume_refresh_token(old_token):
+            raise Exceptions.permission_denied("Refresh token revoked")
+
+        # Same device session: keep its sid so the session index entry is updated in place
+        session_id = security_manager.verify_refresh_token(old_token).get("sid")
+        access_token, refresh_token = await token_manager.generate_token_pair(user, request, session_id)
 
         return access_token, refresh_token, user
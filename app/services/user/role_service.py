@@ -4,6 +4,7 @@ from starlette.responses import JSONResponse
 from app.core.response.exceptions import Exceptions
 from app.core.response.success import Success
 from app.core.utils.generator import IDPrefix, GeneratorManager
+from app.core.utils.security import AuthenticatedUser
 from app.crud import user_crud
 from app.models.user_models import User, UserRole
 
@@ -12,7 +13,7 @@ class RoleService:
     """Handles user role validation and updates."""
 
     @staticmethod
-    async def _validate_permissions(actor: User, target_user: User, new_role: UserRole):
+    async def _validate_permissions(actor: AuthenticatedUser, target_user: User, new_role: UserRole):
         """Validate permissions for role changes between actor and target user."""
         actor_role = actor.user_role
         target_role = target_user.user_role
@@ -51,9 +52,10 @@ class RoleService:
             user.user_role = UserRole.user
             user.unique_id = None
         await user.save()
+        await user_crud.invalidate(user.id)
 
     @staticmethod
-    async def update_role(actor: User, target_email: EmailStr, new_role: UserRole) -> JSONResponse:
+    async def update_role(actor: AuthenticatedUser, target_email: EmailStr, new_role: UserRole) -> JSONResponse:
         """Update a user's role with proper validation and permissions."""
         db_user = await user_crud.get_by_email(target_email)
         if not db_user:
@@ -1,3 +1,6 @@
+from typing import Optional
+
+from fastapi import Request
 from starlette.responses import JSONResponse
 
 from app.core.response.exceptions import Exceptions
@@ -35,12 +38,13 @@ class UserService:
         return Success.account_created(user=user_result)
 
     @staticmethod
-    async def login_user(user_data: UserLogin) -> JSONResponse:
+    async def login_user(user_data: UserLogin, request: Optional[Request] = None) -> JSONResponse:
         """
         Login a regular user via email and verification code.
 
         Args:
             user_data (UserLogin): User login input containing email and optional verification code.
+            request (Request, optional): Login request, for the session's device metadata.
 
         Returns:
             Success: Response containing access and refresh tokens, or info about a send verification code.
@@ -58,7 +62,7 @@ class UserService:
                 raise Exceptions.invalid_verification_code()
 
             await user_crud.update_last_login(db_user.id)
-            access_token, refresh_token = await TokenManager.generate_token_pair(db_user)
+            access_token, refresh_token = await TokenManager.generate_token_pair(db_user, request)
             user_response = UserOut.model_validate(db_user.model_dump())
 
             return Success.login_success(
@@ -57,6 +57,7 @@ class VerificationService:
 
         db_user.is_email_verified = True
         await db_user.save()
+        await user_crud.invalidate(db_user.id)
         return Success.ok(message="Email verified successfully")
 
 
@@ -23,12 +23,9 @@ class ZawiyaAnalyticsService:
         Increment a specific field in analytics by a given amount.
         Raises exception if field does not exist.
         """
-        analytics = await self.get_or_create_analytics(zawiya_id)
-        if not hasattr(analytics, field):
+        if field not in ZawiyaAnalytics.model_fields:
             raise Exceptions.bad_request(f"Field '{field}' does not exist in analytics")
-        current_value = getattr(analytics, field)
-        setattr(analytics, field, current_value + amount)
-        updated = await analytics.save()
+        updated = await zawiya_analytics_crud.increment(zawiya_id, field, amount)
         return {
             "success": True,
             "zawiya_id": str(zawiya_id),
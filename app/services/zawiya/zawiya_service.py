@@ -124,7 +124,7 @@ class ZawiyaService:
 
     # ---------------- UPDATE ----------------
     async def update(self, *, zawiya_id, data, user_id):
-        zawiya = await zawiya_crud.get(zawiya_id)
+        zawiya = await zawiya_crud.get_by_id(zawiya_id)
         if not zawiya:
             raise Exceptions.not_found("Zawiya not found")
 
@@ -133,12 +133,12 @@ class ZawiyaService:
 
     # ---------------- SOFT DELETE ----------------
     async def soft_delete(self, *, zawiya_id, user_id):
-        zawiya = await zawiya_crud.get(zawiya_id)
+        zawiya = await zawiya_crud.get_by_id(zawiya_id)
         if not zawiya:
             raise Exceptions.not_found("Zawiya not found")
 
         await zawiya_permission.require_owner(zawiya, user_id)
-        await zawiya.soft_delete()
+        await zawiya_crud.soft_delete(zawiya_id)
         return {"deleted": True}
 
 
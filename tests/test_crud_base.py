@@ -0,0 +1,225 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+import pytest_asyncio
+from beanie import Document, PydanticObjectId, init_beanie
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.errors import BulkWriteError
+
+from app.crud.cache import CacheConfig, DocumentCache
+from app.crud.crud_base import CrudBase
+from app.crud.dataloader import _loaders, loader_for
+from app.models.models_base import SoftDeleteMixin, TimestampMixin
+
+
+class Item(Document, TimestampMixin, SoftDeleteMixin):
+    name: str
+    score: int = 0
+    tags: List[str] = []
+
+    class Settings:
+        name = "crud_items"
+
+
+@pytest_asyncio.fixture
+async def crud():
+    await init_beanie(database=AsyncMongoMockClient()["test"], document_models=[Item])
+    return CrudBase(Item, cache=CacheConfig(ttl_seconds=60))
+
+
+async def _seed(n: int) -> List[Item]:
+    return [await Item(name=f"item-{i}", score=i).insert() for i in range(n)]
+
+
+# ---------- UPSERT ----------
+
+@pytest.mark.asyncio
+async def test_upsert_seeds_defaults_only_on_insert(crud):
+    created = await crud.upsert({"name": "a"}, {"score": 5})
+    assert created.name == "a" and created.score == 5
+    assert created.tags == [] and created.is_deleted is False
+
+    raw = await crud._collection().find_one({"_id": created.id})
+    assert raw["tags"] == [] and "created_at" in raw
+
+    await crud._collection().update_one({"_id": created.id}, {"$set": {"tags": ["kept"]}})
+    updated = await crud.upsert({"name": "a"}, {"score": 6})
+    assert updated.id == created.id
+    assert updated.score == 6 and updated.tags == ["kept"]
+    assert await crud.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_increment_upsert_creates_then_increments(crud):
+    first = await crud.increment_by_filter({"name": "hits"}, {"score": 1}, upsert=True)
+    second = await crud.increment_by_filter({"name": "hits"}, {"score": 2}, upsert=True)
+    assert first.id == second.id and second.score == 3
+
+
+# ---------- BULK WRITE ----------
+
+@pytest.mark.asyncio
+async def test_bulk_write_chunks_and_offsets_errors(crud, monkeypatch):
+    # mongomock's bulk API does not accept the current pymongo op objects, so
+    # the driver call is faked; what is under test is the chunking around it.
+    chunks = []
+
+    async def fake_bulk_write(ops, ordered):
+        assert ordered is False
+        chunks.append(len(ops))
+        if len(chunks) == 2:
+            raise BulkWriteError({
+                "nInserted": 2, "nMatched": 0, "nModified": 0, "nUpserted": 0,
+                "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+            })
+        return SimpleNamespace(bulk_api_result={"nInserted": len(ops), "nMatched": 0, "nModified": 0, "nUpserted": 0})
+
+    monkeypatch.setattr(crud, "_collection", lambda: SimpleNamespace(bulk_write=fake_bulk_write))
+    ops = [crud.insert_op(name=f"bulk-{i}") for i in range(7)]
+
+    result = await crud.bulk_write(ops, chunk_size=3, concurrency=1)
+
+    assert chunks == [3, 3, 1]
+    assert result.inserted == 6
+    assert result.errors == [{"index": 4, "code": 11000, "message": "duplicate key"}]
+
+
+def test_write_op_builders_match_single_writes(crud):
+    upsert = crud.upsert_op({"name": "x"}, {"score": 1})
+    assert upsert._upsert is True
+    assert upsert._doc["$set"]["score"] == 1
+    assert upsert._doc["$setOnInsert"]["tags"] == [] and "name" not in upsert._doc["$setOnInsert"]
+
+    increment = crud.increment_op({"name": "x"}, {"score": 2}, upsert=True)
+    assert increment._doc["$inc"] == {"score": 2}
+    assert "score" not in increment._doc["$setOnInsert"]
+
+
+# ---------- STREAMING ----------
+
+@pytest.mark.asyncio
+async def test_iter_batches_walks_by_id_and_resumes(crud):
+    items = await _seed(7)
+
+    batches = [(len(batch), checkpoint) async for batch, checkpoint in crud.iter_batches(batch_size=3)]
+    assert [size for size, _ in batches] == [3, 3, 1]
+    assert batches[0][1] == items[2].id
+
+    resumed = [doc.name async for doc in crud.iterate(batch_size=3, after=batches[0][1])]
+    assert resumed == [item.name for item in items[3:]]
+
+    raw = [doc async for doc in crud.iterate({"score": {"$gte": 5}}, raw=True)]
+    assert [doc["score"] for doc in raw] == [5, 6]
+
+
+@pytest.mark.asyncio
+async def test_update_in_batches_terminates_when_filter_changes(crud):
+    await _seed(5)
+    modified = await crud.update_in_batches({"is_deleted": False}, {"is_deleted": True}, batch_size=2, pause_seconds=0)
+    assert modified == 5
+    assert await crud.count({"is_deleted": True}) == 5
+
+
+# ---------- SOFT DELETE ----------
+
+@pytest.mark.asyncio
+async def test_soft_delete_and_restore_are_conditional(crud):
+    (item,) = await _seed(1)
+
+    assert await crud.soft_delete(item.id) is True
+    assert await crud.soft_delete(item.id) is False
+    deleted = await crud.get(item.id)
+    assert deleted.is_deleted and deleted.deleted_at is not None
+
+    assert await crud.restore(item.id) is True
+    assert await crud.restore(item.id) is False
+    restored = await crud.get(item.id)
+    assert not restored.is_deleted and restored.deleted_at is None
+
+
+# ---------- DATALOADER ----------
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_one_tick_into_one_query(crud, monkeypatch):
+    items = await _seed(3)
+    crud.cache = None
+    queries = []
+    find = Item.find
+
+    def counting_find(*args, **kwargs):
+        queries.append(args[0])
+        return find(*args, **kwargs)
+
+    monkeypatch.setattr(Item, "find", counting_find)
+    token = _loaders.set({})
+    try:
+        docs = await crud.load_many([item.id for item in items] + [items[0].id])
+        assert [doc.id for doc in docs] == [item.id for item in items] + [items[0].id]
+        assert len(queries) == 1 and len(queries[0]["_id"]["$in"]) == 3
+
+        # Memoized for the rest of the request, misses included.
+        assert (await crud.load(items[1].id)).id == items[1].id
+        assert len(queries) == 1
+
+        # A CrudBase write drops the stale entry from the request's loader.
+        await crud.update(items[1].id, {"name": "renamed"})
+        assert (await crud.load(items[1].id)).name == "renamed"
+        await crud.update_one({"_id": items[2].id}, {"$set": {"name": "raw"}})
+        assert items[2].id not in loader_for(Item)._cache
+    finally:
+        _loaders.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_does_not_memoize_failures(crud, monkeypatch):
+    (item,) = await _seed(1)
+    token = _loaders.set({})
+    try:
+        loader = loader_for(Item)
+        monkeypatch.setattr(Item, "find", lambda *a, **kw: (_ for _ in ()).throw(RuntimeError("down")))
+        with pytest.raises(RuntimeError):
+            await loader.load(item.id)
+        monkeypatch.undo()
+        assert (await loader.load(item.id)).id == item.id
+    finally:
+        _loaders.reset(token)
+
+
+# ---------- DOCUMENT CACHE ----------
+
+@pytest.mark.asyncio
+async def test_cache_serves_copies_and_is_dropped_by_writes(crud):
+    (item,) = await _seed(1)
+
+    cached = await crud.get(item.id)
+    cached.name = "mutated"
+    assert (await crud.get(item.id)).name == item.name
+    assert crud.cache.hits == 1
+
+    await crud.update_many({"_id": item.id}, {"name": "written"})
+    assert (await crud.get(item.id)).name == "written"
+
+    await crud.get(item.id)
+    await crud.update_many({"name": "written"}, {"score": 42})
+    assert len(crud.cache._entries) == 0
+    assert (await crud.get(item.id)).score == 42
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_evicts():
+    cache = DocumentCache(Item, CacheConfig(ttl_seconds=0.05, max_entries=2))
+    items = [Item(name=f"c-{i}") for i in range(3)]
+    for item in items:
+        item.id = PydanticObjectId()
+        await cache.set(item)
+    assert await cache.get(items[0].id) is None and cache.evictions == 1
+    assert (await cache.get(items[2].id)).name == "c-2"
+
+    await asyncio.sleep(0.06)
+    assert await cache.get(items[2].id) is None
+
+    await cache.set(items[1])
+    await cache.invalidate(str(items[1].id))
+    assert await cache.get(items[1].id) is None
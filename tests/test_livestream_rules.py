@@ -0,0 +1,127 @@
+import pytest
+import pytest_asyncio
+from beanie import PydanticObjectId, init_beanie
+from fastapi import HTTPException
+from mongomock_motor import AsyncMongoMockClient
+
+from app.models import LiveStream, LiveStreamEvent, LiveStreamEventType, LiveStreamParticipant, ParticipantRole, StreamStatus
+from app.services.contents.livestream_service.lifecycle import stream_lifecycle
+from app.services.contents.livestream_service.participant_services import participant_service
+
+
+@pytest_asyncio.fixture
+async def stream():
+    await init_beanie(
+        database=AsyncMongoMockClient()["test"],
+        document_models=[LiveStream, LiveStreamParticipant, LiveStreamEvent],
+    )
+    owner = PydanticObjectId()
+    return await LiveStream(
+        title="Live", user_id=owner, streamer_id=owner, zawiya_id=PydanticObjectId()
+    ).insert()
+
+
+async def _join(stream: LiveStream, role: ParticipantRole, **flags) -> PydanticObjectId:
+    user_id = PydanticObjectId()
+    await participant_service.add_participant(stream.id, user_id, role)
+    if flags:
+        await LiveStreamParticipant.find_one({"user_id": user_id}).update({"$set": flags})
+    return user_id
+
+
+async def _banned(stream: LiveStream, user_id: PydanticObjectId) -> bool:
+    return await participant_service.is_banned(stream.id, user_id)
+
+
+# ---------- LIFECYCLE (user-028) ----------
+
+@pytest.mark.asyncio
+async def test_lifecycle_follows_allowed_transitions(stream):
+    live = await stream_lifecycle.start(stream.id)
+    assert live.status == StreamStatus.LIVE and live.started_at is not None
+
+    ended = await stream_lifecycle.end(stream.id)
+    assert ended.status == StreamStatus.ENDED and ended.ended_at is not None
+
+    processing = await stream_lifecycle.transition(stream.id, StreamStatus.PROCESSING)
+    assert processing.status == StreamStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_rejects_out_of_order_and_repeated_transitions(stream):
+    with pytest.raises(HTTPException) as e:
+        await stream_lifecycle.transition(stream.id, StreamStatus.READY)
+    assert e.value.status_code == 409
+
+    await stream_lifecycle.start(stream.id)
+    with pytest.raises(HTTPException) as e:
+        await stream_lifecycle.start(stream.id)
+    assert e.value.status_code == 409
+    assert (await LiveStream.get(stream.id)).status == StreamStatus.LIVE
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_missing_stream_is_404(stream):
+    with pytest.raises(HTTPException) as e:
+        await stream_lifecycle.start(PydanticObjectId())
+    assert e.value.status_code == 404
+
+
+def test_can_transition_table():
+    assert stream_lifecycle.can_transition(StreamStatus.CREATED, StreamStatus.LIVE)
+    assert not stream_lifecycle.can_transition(StreamStatus.ENDED, StreamStatus.LIVE)
+    assert not stream_lifecycle.can_transition(StreamStatus.READY, StreamStatus.ERROR)
+
+
+# ---------- BULK MODERATION (user-027) ----------
+
+@pytest.mark.asyncio
+async def test_co_host_only_moderates_lower_roles(stream):
+    co_host = await _join(stream, ParticipantRole.CO_HOST)
+    other_co_host = await _join(stream, ParticipantRole.CO_HOST)
+    owner = await _join(stream, ParticipantRole.OWNER)
+    speaker = await _join(stream, ParticipantRole.SPEAKER)
+    viewer = await _join(stream, ParticipantRole.VIEWER)
+
+    moderated = await participant_service.bulk_moderate(
+        stream.id, co_host, LiveStreamEventType.ban, [co_host, other_co_host, owner, speaker, viewer]
+    )
+
+    assert set(moderated) == {speaker, viewer}
+    assert await _banned(stream, speaker) and await _banned(stream, viewer)
+    assert not await _banned(stream, other_co_host)
+    assert not await _banned(stream, owner)
+    assert not await _banned(stream, co_host)
+    assert await LiveStreamEvent.find({"stream_id": stream.id}).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_owner_can_moderate_co_hosts(stream):
+    owner = await _join(stream, ParticipantRole.OWNER)
+    co_host = await _join(stream, ParticipantRole.CO_HOST)
+
+    assert await participant_service.bulk_moderate(stream.id, owner, LiveStreamEventType.kick, [co_host]) == [co_host]
+    assert await participant_service.get_permissions(stream.id, co_host) is None
+
+
+@pytest.mark.asyncio
+async def test_non_moderators_and_banned_moderators_are_refused(stream):
+    speaker = await _join(stream, ParticipantRole.SPEAKER)
+    banned_co_host = await _join(stream, ParticipantRole.CO_HOST, is_banned=True)
+    viewer = await _join(stream, ParticipantRole.VIEWER)
+
+    for actor in (speaker, banned_co_host, PydanticObjectId()):
+        with pytest.raises(PermissionError):
+            await participant_service.bulk_moderate(stream.id, actor, LiveStreamEventType.mute, [viewer])
+    assert not await participant_service.is_muted(stream.id, viewer)
+
+
+@pytest.mark.asyncio
+async def test_has_role_excludes_banned_participants(stream):
+    co_host = await _join(stream, ParticipantRole.CO_HOST, can_publish_video=True)
+    assert await participant_service.has_role(stream.id, co_host, ParticipantRole.CO_HOST)
+    assert await participant_service.can_publish(stream.id, co_host, "video")
+
+    await participant_service.ban_participant(stream.id, co_host)
+    assert not await participant_service.has_role(stream.id, co_host, ParticipantRole.CO_HOST)
+    assert not await participant_service.can_publish(stream.id, co_host, "video")
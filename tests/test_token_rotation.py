@@ -0,0 +1,26 @@
+import pytest
+import pytest_asyncio
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core.utils.token_manager import Token, token_manager
+from app.models.user_models import RefreshedToken, User
+
+
+@pytest_asyncio.fixture
+async def user():
+    await init_beanie(database=AsyncMongoMockClient()["test"], document_models=[User, RefreshedToken])
+    return await User(email="rotate@example.com").insert()
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_rotates_once(user):
+    _, refresh = await token_manager.generate_token_pair(user)
+
+    rotated = await token_manager.rotate_refresh_token(refresh)
+    assert isinstance(rotated, Token)
+    assert rotated.refresh_token != refresh
+
+    # The old token was consumed by the first rotation; replaying it fails.
+    assert await token_manager.rotate_refresh_token(refresh) is None
+    assert isinstance(await token_manager.rotate_refresh_token(rotated.refresh_token), Token)